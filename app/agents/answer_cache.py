@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.config import get_settings
+from app.rag.retriever import embed_query
+from app.transcription.keyword_index import tokenize
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+# Cosine similarity above which two questions count as the same question
+DEFAULT_SIMILARITY = 0.9
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_MEETINGS = 256
+DEFAULT_TTL_S = 600.0
+
+
+@dataclass
+class _CachedAnswer:
+    question: str
+    vector: list[float]  # unit length
+    keywords: frozenset[str]
+    answer: str
+    # Transcript seq the answer was computed from
+    seq: int
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _MeetingAnswers:
+    entries: OrderedDict[int, _CachedAnswer] = field(default_factory=OrderedDict)
+    # Transcript entries up to this seq have been checked against every cached answer
+    checked_seq: int = 0
+    next_id: int = 0
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(math.sumprod(vector, vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticAnswerCache:
+    """
+    Per-meeting cache of QA answers, looked up by question embedding.
+
+    A question whose embedding has cosine similarity >= `similarity` with a
+    cached question gets the cached answer, so paraphrases ("bila deadline?"
+    / "when is the deadline") hit as well as repeats.
+
+    An answer is dropped when:
+    - a transcript entry appended after it was computed shares a keyword
+      with its question (checked incrementally on lookup);
+    - a document is added to the meeting (invalidate());
+    - it is older than `ttl_s`.
+
+    Each meeting keeps at most `max_entries` answers and at most `max_meetings`
+    meetings are cached, both least-recently-used first out. Thread-safe:
+    lookup() and store() read the transcript, which for a replicated buffer
+    means network or file I/O, so async callers run them in a worker thread.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[list[float]]],
+        similarity: float = DEFAULT_SIMILARITY,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_meetings: int = DEFAULT_MAX_MEETINGS,
+        ttl_s: float = DEFAULT_TTL_S,
+    ) -> None:
+        self._embed = embed
+        self.similarity = similarity
+        self.max_entries = max_entries
+        self.max_meetings = max_meetings
+        self.ttl_s = ttl_s
+        self._meetings: OrderedDict[str, _MeetingAnswers] = OrderedDict()
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def embed(self, question: str) -> list[float]:
+        return _unit(await self._embed(question))
+
+    def lookup(
+        self, meeting_id: str, vector: list[float], buffer: TranscriptBuffer | None = None
+    ) -> str | None:
+        """Return the cached answer to the closest question, if it is close enough and fresh."""
+        with self._lock:
+            return self._lookup(meeting_id, vector, buffer)
+
+    def _lookup(
+        self, meeting_id: str, vector: list[float], buffer: TranscriptBuffer | None
+    ) -> str | None:
+        self.lookups += 1
+        meeting = self._meetings.get(meeting_id)
+        if meeting is None:
+            return None
+        self._meetings.move_to_end(meeting_id)
+        self._expire(meeting)
+        if buffer is not None:
+            self._check_transcript(meeting, buffer)
+
+        best_id, best_score = None, self.similarity
+        for entry_id, entry in meeting.entries.items():
+            score = math.sumprod(vector, entry.vector)
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+        if best_id is None:
+            return None
+        meeting.entries.move_to_end(best_id)
+        self.hits += 1
+        return meeting.entries[best_id].answer
+
+    def store(
+        self,
+        meeting_id: str,
+        question: str,
+        vector: list[float],
+        answer: str,
+        buffer: TranscriptBuffer | None = None,
+        seq: int = 0,
+    ) -> None:
+        """
+        Cache `answer`, computed from the transcript up to `seq` (read before
+        the answer was generated, so entries said meanwhile still invalidate it).
+        """
+        with self._lock:
+            self._store(meeting_id, question, vector, answer, buffer, seq)
+
+    def _store(
+        self,
+        meeting_id: str,
+        question: str,
+        vector: list[float],
+        answer: str,
+        buffer: TranscriptBuffer | None,
+        seq: int,
+    ) -> None:
+        meeting = self._meetings.get(meeting_id)
+        if meeting is None:
+            meeting = self._meetings[meeting_id] = _MeetingAnswers(checked_seq=seq)
+            if len(self._meetings) > self.max_meetings:
+                _, dropped = self._meetings.popitem(last=False)
+                self.evictions += len(dropped.entries)
+        self._meetings.move_to_end(meeting_id)
+
+        entry = _CachedAnswer(question, vector, frozenset(tokenize(question)), answer, seq)
+        if buffer is not None and seq < meeting.checked_seq:
+            # Entries between seq and checked_seq were checked before this answer existed
+            for _, said in buffer.since(seq, limit=meeting.checked_seq - seq):
+                if entry.keywords.intersection(tokenize(said.text)):
+                    return
+        meeting.entries[meeting.next_id] = entry
+        meeting.next_id += 1
+        if len(meeting.entries) > self.max_entries:
+            meeting.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, meeting_id: str) -> None:
+        """Forget every answer for a meeting (e.g. a document was added, or it ended)."""
+        with self._lock:
+            meeting = self._meetings.pop(meeting_id, None)
+            if meeting is not None:
+                self.invalidations += len(meeting.entries)
+
+    def _expire(self, meeting: _MeetingAnswers) -> None:
+        cutoff = time.monotonic() - self.ttl_s
+        for entry_id in [i for i, e in meeting.entries.items() if e.created_at < cutoff]:
+            del meeting.entries[entry_id]
+            self.invalidations += 1
+
+    def _check_transcript(self, meeting: _MeetingAnswers, buffer: TranscriptBuffer) -> None:
+        new = buffer.since(meeting.checked_seq)
+        if not new:
+            return
+        meeting.checked_seq = new[-1][0]
+        if not meeting.entries:
+            return
+        said: list[tuple[int, set[str]]] = [(seq, set(tokenize(e.text))) for seq, e in new]
+        stale = [
+            entry_id
+            for entry_id, entry in meeting.entries.items()
+            if any(seq > entry.seq and entry.keywords & words for seq, words in said)
+        ]
+        for entry_id in stale:
+            del meeting.entries[entry_id]
+        self.invalidations += len(stale)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "entries": sum(len(m.entries) for m in self._meetings.values()),
+            "meetings": len(self._meetings),
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+
+_cache: SemanticAnswerCache | None = None
+
+
+def get_answer_cache() -> SemanticAnswerCache | None:
+    """The process-wide answer cache, or None when QA_CACHE_ENABLED is off."""
+    global _cache
+    settings = get_settings()
+    if _cache is None and settings.qa_cache_enabled:
+        _cache = SemanticAnswerCache(
+            embed_query,
+            similarity=settings.qa_cache_similarity,
+            max_entries=settings.qa_cache_max_entries,
+            max_meetings=settings.qa_cache_max_meetings,
+            ttl_s=settings.qa_cache_ttl_s,
+        )
+    return _cache
+
+
+def invalidate_meeting(meeting_id: str) -> None:
+    """Drop a meeting's cached answers, if this process has any."""
+    if _cache is not None:
+        _cache.invalidate(meeting_id)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import threading
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal, TypeVar
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # System prompt base: instructs the model to handle EN / Malay / Manglish
 MULTILINGUAL_SYSTEM_PREAMBLE = """
 You are MeetingBot, an AI personal assistant embedded in meetings for a Malaysian organisation.
@@ -98,6 +103,147 @@ async def run_agent_thread(
     raise NotImplementedError("TODO: implement run_agent_thread()")
 
 
+@dataclass
+class AgentEvent:
+    """One increment of a streamed agent run."""
+
+    type: Literal["tool_call", "token", "done"]
+    # Answer text delta for "token"; the full answer for "done"
+    text: str = ""
+    # Function name for "tool_call"
+    tool: str | None = None
+
+
+class _ConsumerGone(Exception):
+    """Raised inside the producer thread once the async consumer has stopped iterating."""
+
+
+async def iterate_in_thread(produce: Callable[[Callable[[T], None]], None]) -> AsyncIterator[T]:
+    """
+    Run the blocking `produce(emit)` in a worker thread and yield each item it
+    emits as soon as it is emitted; an exception in `produce` is re-raised here.
+
+    Bridges the synchronous Foundry SDK's streaming callbacks to async code.
+    If the consumer stops early (e.g. the HTTP client disconnected), the next
+    emit() raises inside the thread so the producer unwinds instead of running
+    the agent to completion for nobody.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue()
+    gone = threading.Event()
+
+    def emit(item: T) -> None:
+        if gone.is_set():
+            raise _ConsumerGone
+        loop.call_soon_threadsafe(queue.put_nowait, (False, item))
+
+    def run() -> None:
+        try:
+            produce(emit)
+            outcome = (True, None)
+        except _ConsumerGone:
+            return
+        except BaseException as exc:
+            outcome = (True, exc)
+        if not gone.is_set():
+            loop.call_soon_threadsafe(queue.put_nowait, outcome)
+
+    # Not awaited: an abandoned producer stops at its next emit()
+    loop.run_in_executor(None, run)
+    try:
+        while True:
+            finished, value = await queue.get()
+            if finished:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        gone.set()
+
+
+def _submit_tool_outputs_stream(
+    client: Any, thread_id: str, run_id: str, tool_outputs: list[dict[str, str]]
+) -> Any:
+    """Submit a run's tool outputs and return an iterable over the run's continued events."""
+    # The concrete handler: BaseAgentEventHandler leaves _process_event abstract
+    from azure.ai.projects.models import AgentEventHandler
+
+    handler = AgentEventHandler()
+    client.agents.submit_tool_outputs_to_stream(
+        thread_id=thread_id, run_id=run_id, tool_outputs=tool_outputs, event_handler=handler
+    )
+    return handler
+
+
+async def stream_agent_thread(
+    agent_id: str,
+    user_message: str,
+    thread_id: str | None = None,
+    execute_tool: Callable[[str, dict[str, Any]], Awaitable[str]] | None = None,
+) -> AsyncIterator[AgentEvent]:
+    """
+    Like run_agent_thread(), but yields the run as it happens: a "tool_call"
+    event when the agent starts calling a tool, "token" events as answer
+    text streams in, then one "done" event with the full answer.
+
+    When the run stops for function calls, each is run with
+    `execute_tool(name, arguments)` on the event loop and the outputs are
+    submitted, continuing the same stream. The blocking SDK calls run in a
+    worker thread, bridged with iterate_in_thread().
+    """
+    loop = asyncio.get_running_loop()
+
+    def run_tool(name: str, arguments: str) -> str:
+        if execute_tool is None:
+            return f"Tool '{name}' is not available."
+        try:
+            args = json.loads(arguments or "{}")
+            future = asyncio.run_coroutine_threadsafe(execute_tool(name, args), loop)
+            return future.result()
+        except Exception as exc:
+            # Reported to the model rather than failing the whole run
+            logger.warning("Tool %s failed: %s", name, exc)
+            return f"Tool '{name}' failed: {exc}"
+
+    def produce(emit: Callable[[AgentEvent], None]) -> None:
+        client = get_foundry_client()
+        thread = (
+            client.agents.get_thread(thread_id) if thread_id else client.agents.create_thread()
+        )
+        client.agents.create_message(thread_id=thread.id, role="user", content=user_message)
+        answer: list[str] = []
+        with client.agents.create_stream(thread_id=thread.id, agent_id=agent_id) as stream:
+            events: Any = stream
+            while events is not None:
+                pending, events = events, None
+                # event_type is an AgentStreamEvent (a str enum)
+                for event_type, data, _ in pending:
+                    if event_type == "thread.message.delta":
+                        answer.append(data.text)
+                        emit(AgentEvent("token", text=data.text))
+                    elif event_type == "thread.run.step.created" and data.type == "tool_calls":
+                        for call in data.step_details.tool_calls:
+                            emit(AgentEvent("tool_call", tool=call.function.name))
+                    elif event_type == "thread.run.requires_action":
+                        calls = data.required_action.submit_tool_outputs.tool_calls
+                        outputs = [
+                            {
+                                "tool_call_id": call.id,
+                                "output": run_tool(call.function.name, call.function.arguments),
+                            }
+                            for call in calls
+                        ]
+                        # The run continues on a new event stream
+                        events = _submit_tool_outputs_stream(client, thread.id, data.id, outputs)
+                    elif event_type == "thread.run.failed":
+                        raise RuntimeError(f"Agent run failed: {data.last_error}")
+        emit(AgentEvent("done", text="".join(answer)))
+
+    async for event in iterate_in_thread(produce):
+        yield event
+
+
 async def create_or_get_agent(
     name: str,
     instructions: str,
@@ -51,7 +51,9 @@ async def generate_minutes(
     # TODO: Implement minutes generation using the AI Foundry agent.
     #
     # Pattern:
-    #   1. Build transcript text from buffer or entries
+    #   1. Build transcript text:
+    #        buffer.last_tokens_text(settings.minutes_transcript_token_budget)
+    #      (the whole transcript when it fits) or buffer.to_text(entries)
     #   2. Get or create the minutes agent via create_or_get_agent()
     #   3. Call run_agent_thread() with a user message containing the transcript
     #   4. Handle tool calls (search_meeting_docs, upload_minutes_to_sharepoint) in the loop
@@ -1,39 +1,129 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
 
+from app.agents.answer_cache import get_answer_cache
 from app.agents.base import (
     MULTILINGUAL_SYSTEM_PREAMBLE,
+    AgentEvent,
     create_or_get_agent,
-    run_agent_thread,
+    stream_agent_thread,
 )
-from app.agents.tools.search_tools import SEARCH_MEETING_DOCS_TOOL, SEARCH_ORG_KB_TOOL
-from app.agents.tools.web_search_tool import WEB_SEARCH_TOOL
-from app.agents.tools.graph_tool import GET_MEETING_INFO_TOOL
+from app.agents.tools.graph_tool import GET_MEETING_INFO_TOOL, execute_graph_tool
+from app.agents.tools.search_tools import (
+    SEARCH_MEETING_DOCS_TOOL,
+    SEARCH_ORG_KB_TOOL,
+    SEARCH_TRANSCRIPT_TOOL,
+    execute_search_tool,
+    execute_search_transcript_tool,
+)
+from app.agents.tools.web_search_tool import WEB_SEARCH_TOOL, execute_web_search_tool
+from app.config import get_settings
 from app.transcription.transcript_buffer import TranscriptBuffer
+from app.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 _AGENT_NAME = "meetingbot-qa-agent"
 
+# Shares one agent run between identical questions asked while it is in flight
+_single_flight: SingleFlight[str] = SingleFlight()
+
+# Progress messages shown while the agent runs a tool
+TOOL_PROGRESS = {
+    "search_meeting_docs": "Searching meeting documents…",
+    "search_transcript": "Searching the transcript…",
+    "search_org_kb": "Searching the knowledge base…",
+    "web_search": "Searching the web…",
+    "get_meeting_info": "Looking up meeting details…",
+}
+
 _INSTRUCTIONS = f"""{MULTILINGUAL_SYSTEM_PREAMBLE}
 
 Your task: answer questions accurately and concisely using the available tools.
 
 You have access to:
 - search_meeting_docs: search documents uploaded for the current meeting
+- search_transcript: keyword search over everything said so far in this meeting
 - search_org_kb: search the organisation's general knowledge base
 - web_search: search the web for external or current information
 - get_meeting_info: retrieve Teams meeting metadata
 
 Guidelines:
 - Always search internal sources before the web.
+- The transcript excerpt only covers recent discussion; use search_transcript for
+  anything said earlier in the meeting.
 - Cite your sources inline: (Source: <filename>) or (Web: <url>).
 - If information is not found in any source, say so honestly.
 - Keep responses concise. Use bullet points for lists.
 - Respond in the same language the user used (English / Malay / Manglish).
 """
 
+_TOOLS = [
+    SEARCH_MEETING_DOCS_TOOL,
+    SEARCH_TRANSCRIPT_TOOL,
+    SEARCH_ORG_KB_TOOL,
+    WEB_SEARCH_TOOL,
+    GET_MEETING_INFO_TOOL,
+]
+
+
+def _user_message(question: str, meeting_id: str, buffer: TranscriptBuffer | None) -> str:
+    excerpt = ""
+    if buffer is not None:
+        excerpt = buffer.last_tokens_text(get_settings().qa_transcript_token_budget)
+    return (
+        f"Meeting ID: {meeting_id}\n\n"
+        f"--- RECENT TRANSCRIPT ---\n{excerpt or '(nothing said yet)'}\n"
+        f"--- END TRANSCRIPT ---\n\n"
+        f"Question: {question}"
+    )
+
+
+async def _last_seq(buffer: TranscriptBuffer) -> int:
+    # A replicated buffer catches up over the network first; keep that off the loop
+    return await asyncio.to_thread(lambda: buffer.last_seq)
+
+
+async def _execute_tool(
+    name: str, arguments: dict[str, Any], buffer: TranscriptBuffer | None
+) -> str:
+    if name == "search_transcript":
+        return await execute_search_transcript_tool(arguments, buffer)
+    if name in ("search_meeting_docs", "search_org_kb"):
+        return await execute_search_tool(name, arguments)
+    if name == "web_search":
+        return await execute_web_search_tool(arguments)
+    if name == "get_meeting_info":
+        return await execute_graph_tool(name, arguments)
+    return f"Unknown tool '{name}'."
+
+
+async def _record_turn(
+    meeting_id: str, conversation_id: str, question: str, answer_text: str
+) -> None:
+    """Persist one question/answer turn to the conversation history container."""
+    from app.storage.cosmos_client import CONTAINER_HISTORY, get_cosmos_store
+
+    try:
+        await get_cosmos_store().upsert(CONTAINER_HISTORY, {
+            "id": str(uuid.uuid4()),
+            "conversation_id": conversation_id,
+            "meeting_id": meeting_id,
+            "question": question,
+            "answer": answer_text,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+    except Exception:
+        # The answer was already delivered; a lost history turn is not worth failing it
+        logger.warning(
+            "Could not record QA turn for conversation %s", conversation_id, exc_info=True
+        )
+
 
 async def answer(
     question: str,
@@ -60,13 +150,105 @@ async def answer(
     #
     # Pattern:
     #   1. Build a user message that includes:
-    #      - Current transcript snippet (last N entries from buffer)
+    #      - Current transcript snippet:
+    #        buffer.last_tokens_text(settings.qa_transcript_token_budget)
     #      - The user's question
     #      - meeting_id as context (for tool calls)
     #   2. Get or create the QA agent via create_or_get_agent()
     #   3. Call run_agent_thread(agent_id, user_message, thread_id=conversation_id)
-    #      → the agent calls search_meeting_docs, search_org_kb, web_search as needed
+    #      → the agent calls search_meeting_docs, search_transcript, search_org_kb,
+    #        web_search as needed (search_transcript is served by
+    #        execute_search_transcript_tool(arguments, buffer))
     #   4. Persist conversation turn to Cosmos DB (CONTAINER_HISTORY)
     #   5. Return the final answer string
     raise NotImplementedError("TODO: implement qa_agent.answer()")
 
+
+def normalize_question(question: str) -> str:
+    """Canonical form of a question, so "What's the deadline?" matches "what's the  deadline"."""
+    return " ".join(question.casefold().split()).rstrip("?!. ")
+
+
+async def answer_coalesced(
+    question: str,
+    meeting_id: str,
+    conversation_id: str,
+    buffer: TranscriptBuffer | None = None,
+) -> str:
+    """
+    answer(), with identical in-flight questions sharing one agent run.
+
+    Requests with the same meeting, normalized question and transcript
+    version (the buffer's last seq) while a run is in progress await that run
+    instead of starting their own; anything said since gives a fresh run. The
+    shared turn is recorded in the first asker's conversation only.
+    """
+    version = await _last_seq(buffer) if buffer is not None else None
+    key = (meeting_id, normalize_question(question), version)
+    return await _single_flight.do(
+        key, lambda: answer(question, meeting_id, conversation_id, buffer)
+    )
+
+
+async def answer_cached(
+    question: str,
+    meeting_id: str,
+    conversation_id: str,
+    buffer: TranscriptBuffer | None = None,
+) -> str:
+    """
+    answer_coalesced(), served from the meeting's semantic answer cache when
+    a close enough question was answered recently (see answer_cache). Falls
+    through to the agent if the question cannot be embedded. A cached answer
+    is not recorded in the asker's conversation history.
+    """
+    cache = get_answer_cache()
+    vector = None
+    if cache is not None:
+        try:
+            vector = await cache.embed(question)
+        except Exception:
+            logger.warning("Question embedding failed; answer cache bypassed", exc_info=True)
+        else:
+            cached = await asyncio.to_thread(cache.lookup, meeting_id, vector, buffer)
+            if cached is not None:
+                return cached
+
+    seq = await _last_seq(buffer) if buffer is not None else 0
+    result = await answer_coalesced(question, meeting_id, conversation_id, buffer)
+    if vector is not None:
+        await asyncio.to_thread(cache.store, meeting_id, question, vector, result, buffer, seq)
+    return result
+
+
+def coalescing_stats() -> dict[str, int]:
+    """Questions asked, agent runs started and runs saved by answer_coalesced()."""
+    return _single_flight.stats()
+
+
+async def answer_stream(
+    question: str,
+    meeting_id: str,
+    conversation_id: str,
+    buffer: TranscriptBuffer | None = None,
+) -> AsyncIterator[AgentEvent]:
+    """
+    Streaming variant of answer(): yields the agent's tool calls and answer
+    tokens as they happen, ending with a "done" event carrying the full
+    answer. Arguments are as for answer().
+    """
+    agent_id = await create_or_get_agent(_AGENT_NAME, _INSTRUCTIONS, tools=_TOOLS)
+    events = stream_agent_thread(
+        agent_id,
+        await asyncio.to_thread(_user_message, question, meeting_id, buffer),
+        thread_id=conversation_id,
+        execute_tool=lambda name, arguments: _execute_tool(name, arguments, buffer),
+    )
+    try:
+        async for event in events:
+            if event.type == "done":
+                # Persist the turn before the caller sees the end of the stream
+                await _record_turn(meeting_id, conversation_id, question, event.text)
+            yield event
+    finally:
+        await events.aclose()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+from app.transcription.transcript_buffer import TranscriptBuffer, render_line
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -42,6 +45,37 @@ SEARCH_MEETING_DOCS_TOOL: dict[str, Any] = {
     },
 }
 
+SEARCH_TRANSCRIPT_TOOL: dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": "search_transcript",
+        "description": (
+            "Keyword search (BM25) over everything said so far in the live meeting, "
+            "including utterances too old to appear in the transcript excerpt you were given. "
+            "Use this for questions about earlier discussion, e.g. what someone said an hour ago."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Keywords to look for (English or Malay).",
+                },
+                "meeting_id": {
+                    "type": "string",
+                    "description": "The meeting session ID whose transcript to search.",
+                },
+                "top_k": {
+                    "type": "integer",
+                    "description": "Number of utterances to return. Default 5.",
+                    "default": 5,
+                },
+            },
+            "required": ["query", "meeting_id"],
+        },
+    },
+}
+
 SEARCH_ORG_KB_TOOL: dict[str, Any] = {
     "type": "function",
     "function": {
@@ -104,3 +138,29 @@ async def execute_search_tool(tool_name: str, arguments: dict[str, Any]) -> str:
     #       )
     #   return "\n\n".join(f"[Source: {r['source']}]\n{r['content']}" for r in results)
     raise NotImplementedError(f"TODO: implement execute_search_tool for '{tool_name}'")
+
+
+async def execute_search_transcript_tool(
+    arguments: dict[str, Any],
+    buffer: TranscriptBuffer | None,
+) -> str:
+    """
+    Execute the search_transcript tool call against the meeting's live buffer.
+
+    Args:
+        arguments: Parsed JSON arguments from the model's tool call.
+        buffer: The TranscriptBuffer for arguments["meeting_id"] (None if not active).
+
+    Returns:
+        Matching utterances in chronological order, one per line, or a
+        not-found message the model can relay.
+    """
+    if buffer is None:
+        return "No live transcript is available for this meeting."
+    hits = await asyncio.to_thread(
+        buffer.search, arguments["query"], top_k=int(arguments.get("top_k", 5))
+    )
+    if not hits:
+        return "No matching utterances found in the meeting transcript."
+    # Present in chronological order so the model sees the conversation flow
+    return "\n".join(f"(#{seq}) {render_line(entry)}" for seq, entry, _ in sorted(hits))
@@ -61,14 +61,106 @@ class Settings(BaseSettings):
     bing_search_endpoint: str = "https://api.bing.microsoft.com/v7.0/search"
 
     # ── App tuning ──────────────────────────────────────────────────────────
-    # Max transcript entries to include as QA context
-    qa_transcript_context_limit: int = 50
+    # Max transcript tokens to include as QA context (most recent utterances first)
+    qa_transcript_token_budget: int = 4000
+    # Semantic QA answer cache: questions whose embeddings are at least this similar
+    # (cosine) share an answer; per-meeting size, meetings kept, and max answer age
+    qa_cache_enabled: bool = True
+    qa_cache_similarity: float = 0.9
+    qa_cache_max_entries: int = 128
+    qa_cache_max_meetings: int = 256
+    qa_cache_ttl_s: float = 600.0
+    # Max transcript tokens to send for minutes generation
+    minutes_transcript_token_budget: int = 100000
     # Max conversation history turns to include
     conversation_history_limit: int = 10
     # Number of search results to retrieve per source
     search_top_k: int = 5
     # Temp document TTL in days
     doc_ttl_days: int = 7
+    # Document uploads are streamed to Blob Storage in blocks of this size (MB),
+    # with this many blocks in flight per upload
+    blob_upload_block_size_mb: int = 4
+    blob_upload_concurrency: int = 2
+    # When Document Intelligence can't read a document from a SAS URL, it is
+    # downloaded into a temp file kept in memory up to this size (MB)
+    doc_spool_max_mb: int = 8
+    # Document ingestion pipeline: items buffered between stages, and chunks per
+    # embedding request / index upload
+    doc_ingest_queue_size: int = 4
+    doc_ingest_batch_size: int = 16
+
+    # Create the blob container and search index on first use instead of at startup
+    # (faster cold starts; GET /ready reports them as "deferred" until then)
+    startup_defer_noncritical: bool = False
+
+    # ── Transcript buffer ───────────────────────────────────────────────────
+    # Entries per in-memory segment before it is sealed
+    transcript_segment_size: int = 500
+    # Process-wide budget (MB) for sealed segments kept in memory across all meetings
+    transcript_memory_budget_mb: int = 256
+    # Directory for spilled segments (empty = system temp dir)
+    transcript_spill_dir: str = ""
+    # Directory for per-meeting write-ahead logs, replayed on startup (empty = no WAL)
+    transcript_wal_dir: str = ""
+    # Group-commit interval: max time (ms) before an appended entry is fsynced
+    transcript_wal_flush_ms: int = 20
+
+    # ── Meeting state ───────────────────────────────────────────────────────
+    # Where live transcripts are kept: "memory" (this process only), "shm" (shared by
+    # the uvicorn workers of one host) or "redis" (shared across hosts)
+    meeting_state_backend: str = "memory"
+    # Directory for the "shm" backend's logs (a tmpfs mount keeps them in shared memory)
+    meeting_state_shm_dir: str = "/dev/shm/meetingbot"
+    # Redis (or wire-compatible) server for the "redis" backend
+    meeting_state_redis_url: str = "redis://localhost:6379/0"
+    # Seconds a worker trusts that a meeting it holds is still live before asking Redis again
+    meeting_state_membership_ttl_s: float = 1.0
+
+    # ── Server-side speech recognition ──────────────────────────────────────
+    # Recognizer for streamed audio: "azure" (Azure Speech) or "fake" (scripted
+    # placeholder utterances, for local runs without a Speech resource)
+    speech_recognizer: str = "azure"
+    # Recognizers this worker runs at once (one per audio stream); further streams
+    # wait in a queue of at most SPEECH_MAX_QUEUED for up to SPEECH_QUEUE_TIMEOUT_S
+    speech_max_recognizers: int = 8
+    speech_max_queued: int = 16
+    speech_queue_timeout_s: float = 30.0
+
+    # ── Meeting lifecycle ───────────────────────────────────────────────────
+    # Seconds without appends, questions, viewers or open streams before a meeting
+    # nobody ended is evicted from memory (0 = never)
+    meeting_idle_timeout_s: float = 14400.0
+    # What eviction does: "end" (run the end-of-meeting job, as if it had been ended) or
+    # "checkpoint" (free the buffer and reload it from its WAL on next access; meetings
+    # without a WAL are ended). Shared state backends always checkpoint, since another
+    # worker may still be using the meeting
+    meeting_idle_action: str = "end"
+    # Seconds between idle sweeps
+    meeting_idle_check_interval_s: float = 60.0
+
+    # ── Meeting affinity ────────────────────────────────────────────────────
+    # This worker's base URL as reachable by its peers (empty = no affinity routing)
+    affinity_self_url: str = ""
+    # Comma-separated peer base URLs; with the "redis" state backend peers are also
+    # discovered through heartbeats in Redis
+    affinity_peers: str = ""
+    # Seconds between membership heartbeats (a peer is dropped after three missed)
+    affinity_heartbeat_s: float = 5.0
+
+    # ── Background jobs ─────────────────────────────────────────────────────
+    # SQLite file for the durable job queue consumed by `python -m app.jobs.worker`
+    # (empty = run end-of-meeting and ingestion jobs inside the API process; set it
+    # when running several API workers so job status is visible from all of them)
+    job_queue_path: str = ""
+    # Jobs each worker process runs at once
+    job_worker_concurrency: int = 4
+    # Attempts per job before it is marked failed
+    job_max_attempts: int = 3
+    # Delay before the first retry; doubles on each further attempt
+    job_retry_backoff_s: float = 5.0
+    # Seconds a worker holds a job without a heartbeat before others may reclaim it
+    job_lease_s: float = 300.0
 
 
 @lru_cache
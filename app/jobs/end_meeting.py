@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+
+from app.agents import minutes_agent, task_agent
+from app.integrations.sharepoint import upload_minutes
+from app.jobs.runner import stage
+from app.models.job import Job
+from app.models.minutes import MeetingMinutes
+from app.models.session import MeetingSession, TranscriptEntry
+from app.storage.cosmos_client import (
+    CONTAINER_MINUTES,
+    CONTAINER_SESSIONS,
+    CosmosAccessConditionFailedError,
+    get_cosmos_store,
+)
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+JOB_KIND = "end_meeting"
+
+
+def idempotency_key(meeting_id: str) -> str:
+    """A meeting is finalized by exactly one end-of-meeting job."""
+    return f"{JOB_KIND}:{meeting_id}"
+
+
+def build_payload(session: MeetingSession, buffer: TranscriptBuffer | None) -> dict[str, Any]:
+    """
+    Job input: the session and a snapshot of its transcript, so the job can
+    run in another process after the live buffer is released.
+    """
+    entries = buffer.snapshot() if buffer is not None else []
+    return {
+        "session": session.model_dump(mode="json"),
+        "transcript": [e.model_dump(mode="json") for e in entries],
+    }
+
+
+async def run(job: Job) -> dict[str, Any]:
+    """Job handler: rebuild the session and transcript from the payload and finalize."""
+    session = MeetingSession(**job.payload["session"])
+    buffer = TranscriptBuffer()
+    entries = [TranscriptEntry(**entry) for entry in job.payload.get("transcript", [])]
+    await asyncio.to_thread(buffer.extend, entries)
+    try:
+        return await finalize_meeting(job, session, buffer)
+    finally:
+        buffer.close()
+
+
+async def _mark_session_ended(store, session: MeetingSession) -> None:
+    """
+    Patch only the session's end-of-meeting fields (status, ended_at,
+    minutes_id), leaving `documents` and the rest as stored. The patch is
+    conditioned on the etag of the session as read, like the upload path's.
+    """
+    fields = session.model_dump(mode="json", include={"status", "ended_at", "minutes_id"})
+    operations = [
+        {"op": "set", "path": f"/{name}", "value": value} for name, value in fields.items()
+    ]
+    while True:
+        session_doc = await store.get(CONTAINER_SESSIONS, session.id)
+        if not session_doc:
+            # Never persisted (or deleted): there is nothing to overwrite
+            await store.upsert(CONTAINER_SESSIONS, session.model_dump(mode="json"))
+            return
+        try:
+            await store.patch(
+                CONTAINER_SESSIONS, session.id, operations, etag=session_doc.get("_etag")
+            )
+            return
+        except CosmosAccessConditionFailedError:
+            # The session changed since it was read: look again
+            continue
+
+
+async def finalize_meeting(
+    job: Job,
+    session: MeetingSession,
+    buffer: TranscriptBuffer | None,
+) -> dict[str, Any]:
+    """
+    End-of-meeting pipeline, run as a background job:
+    1. Generate meeting minutes from the transcript buffer.
+    2. Upload minutes to SharePoint and create Planner tasks for all action
+       items, concurrently (SharePoint failures are non-fatal).
+    3. Persist minutes and mark the session ended in Cosmos DB (a partial
+       patch, so document statuses written by ingestion jobs are kept).
+
+    Completed steps are recorded in job.checkpoint, so a retried job does not
+    regenerate minutes or create duplicate Planner tasks.
+
+    Returns the minutes as JSON (stored as the job result).
+    """
+    store = get_cosmos_store()
+    checkpoint = job.checkpoint
+
+    if "minutes" in checkpoint:
+        minutes = MeetingMinutes(**checkpoint["minutes"])
+    else:
+        async with stage(job, "minutes"):
+            minutes = await minutes_agent.generate_minutes(session=session, buffer=buffer)
+        checkpoint["minutes"] = minutes.model_dump(mode="json")
+
+    # assign_tasks() updates the minutes in place, so the upload renders its own copy
+    upload_copy = minutes.model_copy(deep=True)
+
+    async def _upload() -> str | None:
+        if "sharepoint_url" in checkpoint:
+            return checkpoint["sharepoint_url"]
+        async with stage(job, "sharepoint", required=False):
+            checkpoint["sharepoint_url"] = await upload_minutes(upload_copy)
+            return checkpoint["sharepoint_url"]
+        return None
+
+    async def _assign() -> MeetingMinutes:
+        if checkpoint.get("tasks_assigned"):
+            return minutes
+        async with stage(job, "planner"):
+            assigned = await task_agent.assign_tasks(minutes)
+        checkpoint["minutes"] = assigned.model_dump(mode="json")
+        checkpoint["tasks_assigned"] = True
+        return assigned
+
+    async with asyncio.TaskGroup() as tg:
+        upload = tg.create_task(_upload())
+        assign = tg.create_task(_assign())
+    minutes = assign.result()
+    minutes.sharepoint_url = upload.result()
+
+    session.status = "ended"
+    session.ended_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    session.minutes_id = minutes.meeting_id
+    async with stage(job, "persist"):
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(store.upsert(CONTAINER_MINUTES, minutes.model_dump(mode="json")))
+            tg.create_task(_mark_session_ended(store, session))
+
+    return minutes.model_dump(mode="json")
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from app.jobs import end_meeting, ingest_document
+from app.jobs.runner import JobFunc
+
+# Job kind → handler, shared by the in-process JobRunner and the queue worker
+HANDLERS: dict[str, JobFunc] = {
+    end_meeting.JOB_KIND: end_meeting.run,
+    ingest_document.JOB_KIND: ingest_document.run,
+}
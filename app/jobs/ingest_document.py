@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from app.agents.answer_cache import invalidate_meeting
+from app.config import get_settings
+from app.jobs.runner import describe_error, stage
+from app.models.job import Job
+from app.models.session import DocumentStatus
+from app.rag.ingest_pipeline import IngestProgress, run_ingest_pipeline
+from app.storage.blob_client import get_blob_store
+from app.storage.cosmos_client import CONTAINER_SESSIONS, get_cosmos_store
+
+JOB_KIND = "ingest_document"
+
+# Minimum seconds between progress writes to the session while a document is processing
+PROGRESS_INTERVAL_S = 1.0
+
+
+def idempotency_key(meeting_id: str, key: str) -> str:
+    """Scope a client's Idempotency-Key (or a blob name) to the meeting it uploads to."""
+    return f"{JOB_KIND}:{meeting_id}:{key}"
+
+
+def build_payload(blob_name: str, filename: str, document_id: str | None = None) -> dict[str, Any]:
+    return {"blob_name": blob_name, "filename": filename, "document_id": document_id}
+
+
+class ProgressReporter:
+    """
+    Mirrors a document's ingestion progress into `session.documents[<id>]`.
+
+    Each write patches just that entry, so concurrent ingestions (and other
+    session updates) don't overwrite each other. Progress within a status is
+    written at most every PROGRESS_INTERVAL_S; status changes always are.
+    """
+
+    def __init__(self, job: Job) -> None:
+        self.status = DocumentStatus(
+            id=job.payload["document_id"],
+            filename=job.payload["filename"],
+            blob_name=job.payload["blob_name"],
+            job_id=job.id,
+        )
+        self._meeting_id = job.meeting_id
+        self._written_at = 0.0
+
+    async def update(self, progress: IngestProgress | None = None, **changes: Any) -> None:
+        force = changes.get("status", self.status.status) != self.status.status
+        if progress is not None:
+            changes.update(
+                pages_analyzed=progress.pages_analyzed,
+                chunks_total=progress.chunks_total,
+                chunks_indexed=progress.chunks_indexed,
+            )
+        for name, value in changes.items():
+            setattr(self.status, name, value)
+        now = time.monotonic()
+        if not force and now - self._written_at < PROGRESS_INTERVAL_S:
+            return
+        self._written_at = now
+        self.status.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        await get_cosmos_store().patch(
+            CONTAINER_SESSIONS,
+            self._meeting_id,
+            [{
+                "op": "set",
+                "path": f"/documents/{self.status.id}",
+                "value": self.status.model_dump(mode="json"),
+            }],
+        )
+
+
+async def run(job: Job) -> dict[str, Any]:
+    """
+    Job handler: extract an uploaded document (already in Blob Storage) with
+    Document Intelligence and index its chunks in AI Search, through the
+    staged pipeline in app.rag.ingest_pipeline. Chunk ids are deterministic,
+    so a retried job overwrites rather than duplicates. Progress is mirrored
+    into the session when the upload recorded a document id.
+
+    Document Intelligence reads the blob itself through a SAS URL when the
+    storage account key is available; otherwise the blob is streamed into a
+    spooled temp file (in memory up to DOC_SPOOL_MAX_MB, then on disk) and
+    streamed from there.
+    """
+    settings = get_settings()
+    blob_name = job.payload["blob_name"]
+    reporter = ProgressReporter(job) if job.payload.get("document_id") else None
+    if reporter is not None:
+        await reporter.update(status="processing", error=None)
+
+    blob_store = get_blob_store()
+    spool_max = settings.doc_spool_max_mb * 1024 * 1024
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=spool_max) as spool:
+            url_source = None
+            if blob_store.can_sign:
+                url_source = blob_store.get_sas_url(blob_name, expiry_hours=1)
+            else:
+                async with stage(job, "download"):
+                    await blob_store.download_to_file(blob_name, spool)
+
+            progress = await run_ingest_pipeline(
+                file_bytes=None if url_source else spool,
+                filename=job.payload["filename"],
+                meeting_id=job.meeting_id,
+                doc_type="meeting",
+                url_source=url_source,
+                on_progress=reporter.update if reporter is not None else None,
+                track=lambda name: stage(job, name),
+                queue_size=settings.doc_ingest_queue_size,
+                batch_size=settings.doc_ingest_batch_size,
+            )
+    except Exception as exc:
+        if reporter is not None:
+            await reporter.update(status="failed", error=describe_error(exc))
+        raise
+
+    if reporter is not None:
+        await reporter.update(progress, status="ready")
+    # Answers cached while the document was being indexed didn't see it (this
+    # reaches the API's cache only when the job runs in the API process)
+    invalidate_meeting(job.meeting_id)
+    return {
+        "blob_name": blob_name,
+        "pages_analyzed": progress.pages_analyzed,
+        "chunks_indexed": progress.chunks_indexed,
+    }
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.models.job import Job, JobStage
+
+# Seconds a claimed job stays locked to its worker without a heartbeat
+DEFAULT_LEASE_S = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id              TEXT PRIMARY KEY,
+    kind            TEXT NOT NULL,
+    meeting_id      TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    status          TEXT NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    max_attempts    INTEGER NOT NULL,
+    payload         TEXT NOT NULL,
+    checkpoint      TEXT NOT NULL DEFAULT '{}',
+    stages          TEXT NOT NULL DEFAULT '[]',
+    result          TEXT,
+    error           TEXT,
+    run_after       REAL NOT NULL,
+    locked_by       TEXT,
+    locked_until    REAL,
+    created_at      TEXT NOT NULL,
+    started_at      TEXT,
+    finished_at     TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, run_after);
+CREATE INDEX IF NOT EXISTS jobs_meeting ON jobs (kind, meeting_id, created_at);
+"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        kind=row["kind"],
+        meeting_id=row["meeting_id"],
+        idempotency_key=row["idempotency_key"],
+        status=row["status"],
+        attempts=row["attempts"],
+        max_attempts=row["max_attempts"],
+        payload=json.loads(row["payload"]),
+        checkpoint=json.loads(row["checkpoint"]),
+        stages=[JobStage(**s) for s in json.loads(row["stages"])],
+        result=json.loads(row["result"]) if row["result"] else None,
+        error=row["error"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+    )
+
+
+class JobQueue:
+    """
+    Durable job queue in a local SQLite database, shared by the API (which
+    enqueues) and any number of worker processes (which claim and run jobs).
+
+    A claimed job is leased to its worker until `locked_until`; workers extend
+    the lease with heartbeat() while running, so a job whose worker died is
+    claimed again once the lease lapses. Failed attempts are retried with
+    exponential backoff until max_attempts. Methods are blocking; call them
+    via asyncio.to_thread() from async code.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        kind: str,
+        meeting_id: str,
+        payload: dict[str, Any],
+        idempotency_key: str | None = None,
+        max_attempts: int = 3,
+    ) -> Job:
+        """
+        Add a job and return it. If `idempotency_key` matches an existing job,
+        that job is returned instead (and requeued with its original payload
+        and checkpoint if it had permanently failed).
+        """
+        now = _utcnow().isoformat()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = None
+                if idempotency_key is not None:
+                    row = self._conn.execute(
+                        "SELECT * FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+                    ).fetchone()
+                if row is None:
+                    row = self._conn.execute(
+                        "INSERT INTO jobs (id, kind, meeting_id, idempotency_key, status,"
+                        " max_attempts, payload, run_after, created_at)"
+                        " VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?) RETURNING *",
+                        (
+                            str(uuid.uuid4()), kind, meeting_id, idempotency_key,
+                            max_attempts, json.dumps(payload), time.time(), now,
+                        ),
+                    ).fetchone()
+                elif row["status"] == "failed":
+                    row = self._conn.execute(
+                        "UPDATE jobs SET status = 'queued', attempts = 0, error = NULL,"
+                        " finished_at = NULL, run_after = ? WHERE id = ? RETURNING *",
+                        (time.time(), row["id"]),
+                    ).fetchone()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return _row_to_job(row)
+
+    def claim(
+        self,
+        worker_id: str,
+        kinds: list[str] | None = None,
+        lease_s: float = DEFAULT_LEASE_S,
+    ) -> Job | None:
+        """
+        Atomically lease the next runnable job (queued and due, or running with
+        an expired lease) to `worker_id`. Returns None if there is none.
+        """
+        now = time.time()
+        kind_filter = ""
+        params: list[Any] = [worker_id, now + lease_s, _utcnow().isoformat(), now, now]
+        if kinds:
+            kind_filter = f" AND kind IN ({', '.join('?' * len(kinds))})"
+            params.extend(kinds)
+        with self._lock:
+            row = self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, locked_by = ?,"
+                " locked_until = ?, started_at = COALESCE(started_at, ?)"
+                " WHERE id = (SELECT id FROM jobs WHERE"
+                " ((status = 'queued' AND run_after <= ?) OR"
+                " (status = 'running' AND locked_until < ?))"
+                f"{kind_filter} ORDER BY run_after LIMIT 1) RETURNING *",
+                params,
+            ).fetchone()
+        if row is None:
+            return None
+        job = _row_to_job(row)
+        if job.attempts > job.max_attempts:
+            # Worker died on its last allowed attempt
+            self.fail(job, "lease expired after final attempt", worker_id)
+            return self.claim(worker_id, kinds, lease_s)
+        return job
+
+    def heartbeat(self, job: Job, worker_id: str, lease_s: float = DEFAULT_LEASE_S) -> bool:
+        """Extend the lease and save progress; False if the job is no longer ours."""
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET locked_until = ?, stages = ?, checkpoint = ?"
+                " WHERE id = ? AND locked_by = ? AND status = 'running'",
+                (time.time() + lease_s, _dump_stages(job), json.dumps(job.checkpoint),
+                 job.id, worker_id),
+            )
+        return cur.rowcount == 1
+
+    def complete(self, job: Job, worker_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'succeeded', result = ?, stages = ?, checkpoint = ?,"
+                " error = NULL, locked_by = NULL, locked_until = NULL, finished_at = ?"
+                " WHERE id = ? AND locked_by = ?",
+                (json.dumps(job.result), _dump_stages(job), json.dumps(job.checkpoint),
+                 _utcnow().isoformat(), job.id, worker_id),
+            )
+
+    def fail(self, job: Job, error: str, worker_id: str, backoff_s: float = 5.0) -> bool:
+        """
+        Record a failed attempt. Requeues with exponential backoff while
+        attempts remain and returns True; otherwise marks the job failed.
+        """
+        retry = job.attempts < job.max_attempts
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, stages = ?, checkpoint = ?,"
+                " run_after = ?, locked_by = NULL, locked_until = NULL, finished_at = ?"
+                " WHERE id = ? AND locked_by = ?",
+                (
+                    "queued" if retry else "failed",
+                    error,
+                    _dump_stages(job),
+                    json.dumps(job.checkpoint),
+                    time.time() + backoff_s * 2 ** (job.attempts - 1),
+                    None if retry else _utcnow().isoformat(),
+                    job.id,
+                    worker_id,
+                ),
+            )
+        return retry
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def get_by_key(self, idempotency_key: str) -> Job | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def latest(self, kind: str, meeting_id: str) -> Job | None:
+        """Most recently enqueued job of `kind` for a meeting."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE kind = ? AND meeting_id = ?"
+                " ORDER BY created_at DESC LIMIT 1",
+                (kind, meeting_id),
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _dump_stages(job: Job) -> str:
+    return json.dumps([s.model_dump(mode="json") for s in job.stages])
+
+
+_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue | None:
+    """The configured durable queue, or None when JOB_QUEUE_PATH is unset (in-process jobs)."""
+    global _queue
+    if _queue is None:
+        path = get_settings().job_queue_path
+        if not path:
+            return None
+        _queue = JobQueue(path)
+    return _queue
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from app.models.job import Job, JobStage
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for status lookups before the oldest are forgotten
+DEFAULT_JOB_HISTORY = 1000
+
+JobFunc = Callable[[Job], Awaitable[dict[str, Any] | None]]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def describe_error(exc: BaseException) -> str:
+    # Concurrent stages fail as an ExceptionGroup; report the underlying error
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return str(exc) or type(exc).__name__
+
+
+@asynccontextmanager
+async def stage(job: Job, name: str, required: bool = True) -> AsyncIterator[JobStage]:
+    """
+    Record a named step of `job` while the block runs.
+
+    A failing required stage re-raises (failing the job); a failing optional
+    stage is logged, marked failed and swallowed so the job carries on. A
+    stage interrupted by cancellation (e.g. a sibling task failed) is marked
+    cancelled and the cancellation propagates.
+    """
+    step = JobStage(name=name)
+    job.stages.append(step)
+    try:
+        yield step
+    except Exception as exc:
+        step.status = "failed"
+        step.error = str(exc) or type(exc).__name__
+        step.finished_at = _utcnow()
+        if required:
+            raise
+        logger.warning("Job %s: optional stage '%s' failed: %s", job.id, name, step.error)
+    except BaseException:
+        step.status = "cancelled"
+        step.finished_at = _utcnow()
+        raise
+    else:
+        step.status = "succeeded"
+        step.finished_at = _utcnow()
+
+
+class JobRunner:
+    """
+    Runs jobs as background asyncio tasks on the server's event loop.
+
+    Jobs are tracked in memory so callers can poll their status; the latest
+    job per (kind, meeting_id) is indexed for per-meeting status endpoints.
+    """
+
+    def __init__(self, history: int = DEFAULT_JOB_HISTORY) -> None:
+        self._history = history
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._latest: dict[tuple[str, str], str] = {}
+        self._keys: dict[str, str] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def submit(
+        self,
+        kind: str,
+        meeting_id: str,
+        func: JobFunc,
+        payload: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> Job:
+        """
+        Start `func(job)` in the background and return the queued Job immediately.
+
+        If a job with the same `idempotency_key` exists it is returned instead;
+        a failed one is first restarted with its original payload and checkpoint.
+        """
+        job = self.get_by_key(idempotency_key)
+        if job is not None:
+            if job.status != "failed":
+                return job
+            # Restart in place: same id, original payload, progress kept in checkpoint
+            job.status, job.error, job.finished_at = "queued", None, None
+        else:
+            job = Job(
+                kind=kind,
+                meeting_id=meeting_id,
+                idempotency_key=idempotency_key,
+                payload=payload or {},
+            )
+            self._jobs[job.id] = job
+            if idempotency_key is not None:
+                self._keys[idempotency_key] = job.id
+        self._latest[(kind, meeting_id)] = job.id
+        self._tasks[job.id] = asyncio.create_task(self._run(job, func), name=f"job-{kind}-{job.id}")
+        self._prune()
+        return job
+
+    def get_by_key(self, idempotency_key: str | None) -> Job | None:
+        if idempotency_key is None:
+            return None
+        job_id = self._keys.get(idempotency_key)
+        return self._jobs.get(job_id) if job_id else None
+
+    async def _run(self, job: Job, func: JobFunc) -> None:
+        job.status = "running"
+        job.attempts += 1
+        job.started_at = _utcnow()
+        try:
+            job.result = await func(job)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "cancelled"
+            raise
+        except Exception as exc:
+            logger.exception(
+                "Job %s (%s) for meeting '%s' failed", job.id, job.kind, job.meeting_id
+            )
+            job.status = "failed"
+            job.error = describe_error(exc)
+        finally:
+            job.finished_at = _utcnow()
+            self._tasks.pop(job.id, None)
+
+    def _prune(self) -> None:
+        while len(self._jobs) > self._history:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.id in self._tasks:
+                break  # never forget a job that is still running
+            del self._jobs[oldest.id]
+            if self._latest.get((oldest.kind, oldest.meeting_id)) == oldest.id:
+                del self._latest[(oldest.kind, oldest.meeting_id)]
+            if oldest.idempotency_key is not None:
+                self._keys.pop(oldest.idempotency_key, None)
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def latest(self, kind: str, meeting_id: str) -> Job | None:
+        """Most recently submitted job of `kind` for a meeting."""
+        job_id = self._latest.get((kind, meeting_id))
+        return self._jobs.get(job_id) if job_id else None
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        """Wait up to `timeout` seconds for running jobs, then cancel the rest."""
+        tasks = list(self._tasks.values())
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+_runner: JobRunner | None = None
+
+
+def get_job_runner() -> JobRunner:
+    global _runner
+    if _runner is None:
+        _runner = JobRunner()
+    return _runner
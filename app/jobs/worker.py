@@ -0,0 +1,152 @@
+"""
+Standalone worker for the durable job queue.
+
+Runs end-of-meeting and document-ingestion jobs outside the API process, so
+a burst of meetings ending together does not compete with live QA:
+
+    JOB_QUEUE_PATH=/var/lib/meetingbot/jobs.db python -m app.jobs.worker --concurrency 4
+
+Run as many worker processes as needed against the same queue file.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from app.config import get_settings
+from app.jobs.handlers import HANDLERS
+from app.jobs.queue import JobQueue, get_job_queue
+from app.jobs.runner import describe_error
+from app.models.job import Job
+from app.storage.blob_client import get_blob_store
+from app.storage.cosmos_client import get_cosmos_store
+from app.utils.logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds to sleep when the queue is empty
+POLL_INTERVAL_S = 1.0
+
+
+class Worker:
+    """Claims jobs from a JobQueue and runs up to `concurrency` of them at once."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        concurrency: int = 4,
+        lease_s: float = 300.0,
+        backoff_s: float = 5.0,
+        poll_interval_s: float = POLL_INTERVAL_S,
+    ) -> None:
+        self.queue = queue
+        self.concurrency = concurrency
+        self.lease_s = lease_s
+        self.backoff_s = backoff_s
+        self.poll_interval_s = poll_interval_s
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; run() returns once in-flight jobs finish."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+        running: set[asyncio.Task] = set()
+        kinds = list(HANDLERS)
+        logger.info("Worker %s started (concurrency=%d)", self.worker_id, self.concurrency)
+        while not self._stopping.is_set():
+            await slots.acquire()
+            # stop() may have been called while every slot was busy
+            if self._stopping.is_set():
+                slots.release()
+                break
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id, kinds, self.lease_s)
+            if job is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval_s)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._execute(job))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            task.add_done_callback(lambda _: slots.release())
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        logger.info("Worker %s stopped", self.worker_id)
+
+    async def _execute(self, job: Job) -> None:
+        logger.info(
+            "Running job %s (%s) for meeting '%s', attempt %d/%d",
+            job.id, job.kind, job.meeting_id, job.attempts, job.max_attempts,
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            job.result = await HANDLERS[job.kind](job)
+        except Exception as exc:
+            error = describe_error(exc)
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            retry = await asyncio.to_thread(
+                self.queue.fail, job, error, self.worker_id, self.backoff_s
+            )
+            if not retry:
+                logger.error("Job %s (%s) failed permanently: %s", job.id, job.kind, error)
+        else:
+            await asyncio.to_thread(self.queue.complete, job, self.worker_id)
+            logger.info("Job %s (%s) succeeded", job.id, job.kind)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: Job) -> None:
+        """Extend the lease and save stage progress while the job runs."""
+        while True:
+            await asyncio.sleep(self.lease_s / 3)
+            owned = await asyncio.to_thread(self.queue.heartbeat, job, self.worker_id, self.lease_s)
+            if not owned:
+                logger.warning("Lost lease on job %s; another worker may rerun it", job.id)
+                return
+
+
+async def main(concurrency: int | None = None) -> None:
+    settings = get_settings()
+    queue = get_job_queue()
+    if queue is None:
+        raise SystemExit("JOB_QUEUE_PATH is not set; nothing to consume")
+
+    cosmos = get_cosmos_store()
+    blob = get_blob_store()
+    await asyncio.gather(cosmos.initialize(), blob.initialize())
+
+    worker = Worker(
+        queue,
+        concurrency=concurrency or settings.job_worker_concurrency,
+        lease_s=settings.job_lease_s,
+        backoff_s=settings.job_retry_backoff_s,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await cosmos.close()
+        await blob.close()
+        queue.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MeetingBot background job worker")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Jobs to run at once (default: settings)"
+    )
+    args = parser.parse_args()
+    configure_logging()
+    asyncio.run(main(args.concurrency))
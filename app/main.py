@@ -1,48 +1,279 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import uuid
-from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-
-from app.agents import minutes_agent, qa_agent, task_agent
-from app.integrations.sharepoint import upload_minutes
-from app.models.session import MeetingSession
-from app.rag.document_processor import process_document
-from app.rag.retriever import ensure_index, upsert_chunks
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime
+from typing import Callable
+
+from fastapi import (
+    FastAPI,
+    Header,
+    HTTPException,
+    Request,
+    UploadFile,
+    File,
+    Form,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.agents import qa_agent
+from app.agents.answer_cache import get_answer_cache, invalidate_meeting
+from app.config import get_settings
+from app.jobs import end_meeting as end_meeting_job, ingest_document as ingest_document_job
+from app.jobs.handlers import HANDLERS
+from app.jobs.queue import get_job_queue
+from app.jobs.runner import get_job_runner
+from app.models.job import Job
+from app.models.session import DocumentStatus, MeetingSession, TranscriptEntry
+from app.rag.retriever import ensure_index
 from app.storage.blob_client import get_blob_store
 from app.storage.cosmos_client import (
     CONTAINER_MINUTES,
     CONTAINER_SESSIONS,
+    CosmosAccessConditionFailedError,
     get_cosmos_store,
 )
-from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.bulk import (
+    NDJSON_CONTENT_TYPES,
+    BulkFormatError,
+    parse_columnar,
+    parse_ndjson,
+)
+from app.transcription.fanout import TranscriptEvent
+from app.transcription.recognizer_pool import (
+    AudioSession,
+    PoolExhausted,
+    get_recognizer_pool,
+    recognizer_stats,
+)
+from app.state.affinity import (
+    AffinityRouter,
+    MeetingAffinityMiddleware,
+    RedisMembership,
+    StaticMembership,
+)
+from app.state.base import InProcessStore, MeetingStore
+from app.state.lifecycle import MeetingLifecycle, describe_meeting
+from app.transcription.transcript_buffer import TranscriptBuffer, get_memory_budget
+from app.transcription.wal import (
+    TranscriptWAL,
+    get_group_committer,
+    list_wal_meetings,
+    wal_path,
+)
+from app.utils.warmup import Warmup
+
+logger = logging.getLogger(__name__)
+
+# meeting_id → TranscriptBuffer for live meetings. In-process by default (rebuilt from the
+# write-ahead logs on restart when TRANSCRIPT_WAL_DIR is set); replaced in lifespan by a
+# shared backend when MEETING_STATE_BACKEND is "shm" or "redis"
+_active_buffers: MeetingStore = InProcessStore()
+
+
+def _new_buffer(meeting_id: str) -> TranscriptBuffer:
+    """Create the buffer for a meeting, replaying its WAL if one exists."""
+    settings = get_settings()
+    wal = None
+    if settings.transcript_wal_dir:
+        wal = TranscriptWAL(wal_path(settings.transcript_wal_dir, meeting_id))
+    return TranscriptBuffer(
+        segment_size=settings.transcript_segment_size,
+        spill_dir=settings.transcript_spill_dir or None,
+        wal=wal,
+    )
+
+
+def _create_meeting_store() -> MeetingStore:
+    settings = get_settings()
+    backend = settings.meeting_state_backend
+    buffer_kwargs = {
+        "segment_size": settings.transcript_segment_size,
+        "spill_dir": settings.transcript_spill_dir or None,
+    }
+    if backend == "memory":
+        return InProcessStore(_new_buffer)
+    # Shared backends are imported on demand (the shm one needs POSIX file locks)
+    if backend == "shm":
+        from app.state.shm import SharedMemoryStore
+
+        return SharedMemoryStore(settings.meeting_state_shm_dir, **buffer_kwargs)
+    if backend == "redis":
+        from app.state.redis_store import RedisStore
+        from app.state.resp import RespClient
+
+        return RedisStore(
+            RespClient(settings.meeting_state_redis_url),
+            membership_ttl_s=settings.meeting_state_membership_ttl_s,
+            **buffer_kwargs,
+        )
+    raise ValueError(f"Unknown MEETING_STATE_BACKEND: {backend!r}")
+
+
+# Routes each meeting's requests to its owning worker when AFFINITY_SELF_URL is set
+_affinity: AffinityRouter | None = None
+
+
+def _create_affinity_router() -> AffinityRouter | None:
+    settings = get_settings()
+    if not settings.affinity_self_url:
+        return None
+    peers = [p.strip() for p in settings.affinity_peers.split(",") if p.strip()]
+    if settings.meeting_state_backend == "redis":
+        from app.state.resp import RespClient
+
+        membership = RedisMembership(
+            RespClient(settings.meeting_state_redis_url), ttl_s=3 * settings.affinity_heartbeat_s
+        )
+        for peer in peers:
+            membership.join(peer)
+    else:
+        membership = StaticMembership(peers)
+    return AffinityRouter(
+        settings.affinity_self_url,
+        membership,
+        heartbeat_s=settings.affinity_heartbeat_s,
+        on_rebalance=_release_unowned,
+    )
+
+
+def _release_unowned(is_local: Callable[[str], bool]) -> None:
+    """After a ring change, drop local copies of meetings now owned by another worker."""
+    for meeting_id in _active_buffers.local_meetings():
+        if not is_local(meeting_id):
+            _active_buffers.release(meeting_id)
+
+
+def _new_meeting_id() -> str:
+    """A fresh meeting id; with affinity routing, one this worker owns."""
+    meeting_id = str(uuid.uuid4())
+    if _affinity is not None:
+        # Expected tries = number of nodes
+        while not _affinity.is_local(meeting_id):
+            meeting_id = str(uuid.uuid4())
+    return meeting_id
+
+
+# Frees meetings nobody ended; started in lifespan when MEETING_IDLE_TIMEOUT_S > 0
+_lifecycle: MeetingLifecycle | None = None
+
 
-# In-memory map of meeting_id → TranscriptBuffer (lives for the duration of the server process)
-_active_buffers: dict[str, TranscriptBuffer] = {}
+async def _get_buffer(meeting_id: str) -> TranscriptBuffer | None:
+    """
+    Look up a live meeting's buffer off the event loop: the shared stores
+    check membership and build replicas over the network or filesystem.
+    """
+    return await asyncio.to_thread(_active_buffers.get, meeting_id)
+
+
+def _extend(buffer: TranscriptBuffer, entries: list[TranscriptEntry]) -> tuple[int, int]:
+    """Append entries and return (total entries, last seq); run off the event loop."""
+    last_seq = buffer.extend(entries)
+    return len(buffer), last_seq
+
+
+async def _evict_idle_meeting(meeting_id: str, buffer: TranscriptBuffer) -> None:
+    """Checkpoint or finalize a meeting that has gone idle, freeing its buffer."""
+    settings = get_settings()
+    checkpoint = (
+        settings.meeting_idle_action == "checkpoint" or settings.meeting_state_backend != "memory"
+    )
+    if checkpoint and _active_buffers.evict(meeting_id):
+        invalidate_meeting(meeting_id)
+        logger.info("Checkpointed idle meeting '%s'", meeting_id)
+        return
+
+    session_doc = await get_cosmos_store().get(CONTAINER_SESSIONS, meeting_id)
+    if session_doc:
+        job = await _finalize_meeting(meeting_id, session_doc)
+        logger.info("Ended idle meeting '%s' (job %s)", meeting_id, job.id)
+    else:
+        logger.warning("Idle meeting '%s' has no session; discarding its transcript", meeting_id)
+    # Already gone unless an earlier end job for the meeting exists
+    if _active_buffers.pop(meeting_id, None) is not None:
+        await asyncio.to_thread(buffer.close)
+    invalidate_meeting(meeting_id)
+
+
+# Seconds to wait for background jobs on shutdown before cancelling them
+_JOB_SHUTDOWN_TIMEOUT_S = 30.0
+
+# Startup initialization of Azure resources; also backs GET /ready
+_warmup = Warmup()
+
+
+async def _warm(*names: str) -> None:
+    """Make sure deferred dependencies are set up before first use (best effort)."""
+    try:
+        await _warmup.ensure(*names)
+    except Exception:
+        logger.warning("Deferred init of %s failed", ", ".join(names), exc_info=True)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialise Azure resources on startup."""
+    """Initialise Azure resources and recover live transcripts on startup."""
+    global _active_buffers, _affinity, _lifecycle, _warmup
+    settings = get_settings()
+    get_memory_budget().limit_bytes = settings.transcript_memory_budget_mb * 1024 * 1024
+    get_group_committer().interval_s = settings.transcript_wal_flush_ms / 1000
+
+    _active_buffers = _create_meeting_store()
+    if settings.meeting_state_backend == "memory" and settings.transcript_wal_dir:
+        for meeting_id in list_wal_meetings(settings.transcript_wal_dir):
+            buffer = _active_buffers.create(meeting_id)
+            logger.info(
+                "Recovered transcript for meeting '%s' (%d entries)", meeting_id, len(buffer)
+            )
+
+    _affinity = _create_affinity_router()
+    if _affinity is not None:
+        await _affinity.start()
+
+    # Azure resources are set up concurrently; blob container and search index
+    # creation can be deferred to first use to shorten cold starts
     cosmos = get_cosmos_store()
-    await cosmos.initialize()
-
     blob = get_blob_store()
-    await blob.initialize()
-
-    await ensure_index()
+    defer = settings.startup_defer_noncritical
+    _warmup = Warmup()
+    _warmup.add("cosmos", cosmos.initialize)
+    _warmup.add("blob", blob.initialize, critical=False, lazy=defer)
+    _warmup.add("search_index", ensure_index, critical=False, lazy=defer)
+    await _warmup.start()
+
+    if settings.meeting_idle_timeout_s > 0:
+        _lifecycle = MeetingLifecycle(
+            _active_buffers,
+            _evict_idle_meeting,
+            idle_timeout_s=settings.meeting_idle_timeout_s,
+            interval_s=settings.meeting_idle_check_interval_s,
+        )
+        await _lifecycle.start()
 
     yield
 
+    if _lifecycle is not None:
+        await _lifecycle.stop()
+    # Let in-flight end-of-meeting jobs finish before closing their clients
+    await get_job_runner().shutdown(timeout=_JOB_SHUTDOWN_TIMEOUT_S)
+    # Flush pending WAL records; the files stay behind for replay on next start
+    get_group_committer().stop()
+    if _affinity is not None:
+        await _affinity.stop()
+    _active_buffers.close()
     await cosmos.close()
     await blob.close()
 
 
 app = FastAPI(title="MeetingBot API", version="0.1.0", lifespan=lifespan)
+app.add_middleware(MeetingAffinityMiddleware, get_router=lambda: _affinity)
 
 
 # ── Health ────────────────────────────────────────────────────────────────────
@@ -52,6 +283,53 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready():
+    """
+    Readiness probe, unlike /health: 503 until critical dependencies are
+    initialized. Reports each dependency's init status and latency.
+    """
+    body = {"ready": _warmup.ready, "dependencies": _warmup.status()}
+    return JSONResponse(body, status_code=200 if _warmup.ready else 503)
+
+
+@app.get("/metrics")
+async def metrics():
+    """In-process counters for this worker."""
+    cache = get_answer_cache()
+    return {
+        "qa_coalescing": qa_agent.coalescing_stats(),
+        "qa_cache": cache.stats() if cache is not None else None,
+        "speech_recognizers": recognizer_stats(),
+    }
+
+
+@app.get("/admin/meetings")
+async def list_live_meetings():
+    """
+    Live meetings held in this worker, largest first: entries, approximate
+    memory, age and seconds since last activity. Meetings idle longer than
+    `idle_timeout_s` are ended or checkpointed by the lifecycle sweep.
+    """
+
+    def describe_local() -> list[dict]:
+        meetings = []
+        for meeting_id in _active_buffers.local_meetings():
+            buffer = _active_buffers.get(meeting_id)
+            if buffer is not None:
+                meetings.append(describe_meeting(meeting_id, buffer))
+        return meetings
+
+    meetings = await asyncio.to_thread(describe_local)
+    meetings.sort(key=lambda m: m["memory_bytes"], reverse=True)
+    return {
+        "meetings": meetings,
+        "memory_bytes": sum(m["memory_bytes"] for m in meetings),
+        "idle_timeout_s": _lifecycle.idle_timeout_s if _lifecycle is not None else None,
+        "idle_evicted": _lifecycle.evicted if _lifecycle is not None else 0,
+    }
+
+
 # ── Meeting session ───────────────────────────────────────────────────────────
 
 class StartMeetingRequest(BaseModel):
@@ -63,59 +341,119 @@ class StartMeetingRequest(BaseModel):
 async def start_meeting(body: StartMeetingRequest):
     """Start a new meeting session."""
     session = MeetingSession(
-        id=str(uuid.uuid4()),
+        id=_new_meeting_id(),
         title=body.title,
         participants=body.participants,
     )
     store = get_cosmos_store()
     await store.upsert(CONTAINER_SESSIONS, session.model_dump(mode="json"))
-    _active_buffers[session.id] = TranscriptBuffer()
+    _active_buffers.create(session.id)
     return {"meeting_id": session.id, "status": "active"}
 
 
-@app.post("/meetings/{meeting_id}/end")
+# ── Background jobs ───────────────────────────────────────────────────────────
+
+async def _submit_job(
+    kind: str,
+    meeting_id: str,
+    payload: dict,
+    idempotency_key: str | None = None,
+) -> Job:
+    """Enqueue on the durable queue if configured, else run in this process."""
+    queue = get_job_queue()
+    if queue is not None:
+        return await asyncio.to_thread(
+            queue.enqueue,
+            kind,
+            meeting_id,
+            payload,
+            idempotency_key,
+            get_settings().job_max_attempts,
+        )
+    return get_job_runner().submit(kind, meeting_id, HANDLERS[kind], payload, idempotency_key)
+
+
+async def _find_job(idempotency_key: str) -> Job | None:
+    queue = get_job_queue()
+    if queue is not None:
+        return await asyncio.to_thread(queue.get_by_key, idempotency_key)
+    return get_job_runner().get_by_key(idempotency_key)
+
+
+async def _latest_job(kind: str, meeting_id: str) -> Job | None:
+    queue = get_job_queue()
+    if queue is not None:
+        return await asyncio.to_thread(queue.latest, kind, meeting_id)
+    return get_job_runner().latest(kind, meeting_id)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status, per-stage progress and result of a background job."""
+    queue = get_job_queue()
+    if queue is not None:
+        job = await asyncio.to_thread(queue.get, job_id)
+    else:
+        job = get_job_runner().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.model_dump(mode="json")
+
+
+@app.post("/meetings/{meeting_id}/end", status_code=202)
 async def end_meeting(meeting_id: str):
     """
-    End a meeting session:
-    1. Generate meeting minutes from the transcript buffer.
-    2. Upload minutes to SharePoint.
-    3. Create Planner tasks for all action items.
-    4. Persist minutes to Cosmos DB.
+    End a meeting session.
+
+    Returns 202 with a job id straight away; minutes generation, SharePoint
+    upload, Planner task creation and persistence run in the background
+    (in a `python -m app.jobs.worker` process when JOB_QUEUE_PATH is set,
+    otherwise in this process; see app.jobs.end_meeting). Poll `GET /meetings/{id}/end/status` for
+    progress; the finished job's `result` holds the minutes. Calling this
+    again while a job is queued, running or done returns that job.
     """
     store = get_cosmos_store()
     session_doc = await store.get(CONTAINER_SESSIONS, meeting_id)
     if not session_doc:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    session = MeetingSession(**session_doc)
-    buffer = _active_buffers.get(meeting_id)
-
-    # Generate minutes
-    minutes = await minutes_agent.generate_minutes(session=session, buffer=buffer)
-
-    # Upload to SharePoint
-    try:
-        sp_url = await upload_minutes(minutes)
-        minutes.sharepoint_url = sp_url
-    except Exception as exc:
-        # Non-fatal: log and continue
-        minutes.sharepoint_url = None
-
-    # Assign tasks in Planner
-    minutes = await task_agent.assign_tasks(minutes)
-
-    # Persist minutes
-    await store.upsert(CONTAINER_MINUTES, minutes.model_dump(mode="json"))
-
-    # Mark session ended
-    session.status = "ended"
-    session.ended_at = datetime.now(timezone.utc).replace(tzinfo=None)
-    await store.upsert(CONTAINER_SESSIONS, session.model_dump(mode="json"))
+    job = await _finalize_meeting(meeting_id, session_doc)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/meetings/{meeting_id}/end/status",
+    }
 
-    # Clean up buffer
-    _active_buffers.pop(meeting_id, None)
 
-    return minutes.model_dump(mode="json")
+async def _finalize_meeting(meeting_id: str, session_doc: dict) -> Job:
+    """
+    Submit the meeting's end-of-meeting job and release its live buffer, or
+    return the job already queued, running or done.
+    """
+    key = end_meeting_job.idempotency_key(meeting_id)
+    job = await _find_job(key)
+    if job is None or job.status == "failed":
+        buffer = await _get_buffer(meeting_id)
+        payload = await asyncio.to_thread(
+            end_meeting_job.build_payload, MeetingSession(**session_doc), buffer
+        )
+        job = await _submit_job(end_meeting_job.JOB_KIND, meeting_id, payload, key)
+        # The transcript now travels with the job; release the live buffer,
+        # its spill file and WAL
+        if buffer is not None:
+            _active_buffers.pop(meeting_id, None)
+            await asyncio.to_thread(buffer.close)
+        invalidate_meeting(meeting_id)
+    return job
+
+
+@app.get("/meetings/{meeting_id}/end/status")
+async def end_meeting_status(meeting_id: str):
+    """Progress of the meeting's end-of-meeting job (per-stage status, then the minutes)."""
+    job = await _latest_job(end_meeting_job.JOB_KIND, meeting_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No end-of-meeting job for this meeting")
+    return job.model_dump(mode="json")
 
 
 @app.get("/meetings/{meeting_id}/minutes")
@@ -135,75 +473,391 @@ class TranscriptLine(BaseModel):
     text: str
     language: str = "en-US"
 
+    def to_entry(self) -> TranscriptEntry:
+        return TranscriptEntry(speaker=self.speaker, text=self.text, language=self.language)
+
 
 @app.post("/meetings/{meeting_id}/transcript")
 async def add_transcript(meeting_id: str, lines: list[TranscriptLine]):
     """Push transcript lines into the live buffer (for PoC/testing)."""
-    from app.models.session import TranscriptEntry
-
-    buf = _active_buffers.get(meeting_id)
+    buf = await _get_buffer(meeting_id)
     if buf is None:
         raise HTTPException(status_code=404, detail="No active meeting buffer")
 
-    for line in lines:
-        buf.append(TranscriptEntry(speaker=line.speaker, text=line.text, language=line.language))
+    total, _ = await asyncio.to_thread(_extend, buf, [line.to_entry() for line in lines])
+    return {"buffered": len(lines), "total": total}
+
+
+@app.post("/meetings/{meeting_id}/transcript/bulk")
+async def add_transcript_bulk(meeting_id: str, request: Request):
+    """
+    Append many transcript lines at once (replaying a recorded meeting, bulk
+    imports), skipping per-line pydantic validation:
+
+    - `Content-Type: application/x-ndjson`: one
+      `{"speaker", "text", "language"?, "timestamp"?}` object per line
+    - `Content-Type: application/json`: a columnar payload
+      (`speakers`, `speaker`, `text`, optional `language` / `timestamp`;
+      see app.transcription.bulk.parse_columnar)
 
-    return {"buffered": len(lines), "total": len(buf)}
+    Lines are appended in request order, in chunks that each take the buffer
+    lock once, so a concurrent writer's lines may be interleaved between chunks.
+    """
+    buf = await _get_buffer(meeting_id)
+    if buf is None:
+        raise HTTPException(status_code=404, detail="No active meeting buffer")
+    content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        parse = parse_ndjson
+    elif content_type == "application/json":
+        parse = parse_columnar
+    else:
+        raise HTTPException(
+            status_code=415, detail="Use application/x-ndjson or columnar application/json"
+        )
+
+    body = await request.body()
+    try:
+        entries = await asyncio.to_thread(parse, body)
+    except BulkFormatError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from None
+    total, last_seq = await asyncio.to_thread(_extend, buf, entries)
+    return {"buffered": len(entries), "total": total, "last_seq": last_seq}
 
 
 @app.get("/meetings/{meeting_id}/transcript")
-async def get_transcript(meeting_id: str):
-    """Return the current transcript for the active meeting."""
-    buf = _active_buffers.get(meeting_id)
+async def get_transcript(
+    meeting_id: str,
+    since: int = Query(0, ge=0, description="Only return entries with seq greater than this"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of entries to return"),
+    speaker: str | None = Query(None, description="Only return entries by this speaker"),
+    start: datetime | None = Query(None, description="Only return entries at or after this time"),
+    end: datetime | None = Query(None, description="Only return entries before this time"),
+):
+    """
+    Return the transcript for the active meeting.
+
+    Each entry carries a `seq`; pollers pass the returned `last_seq` back as
+    `?since=` to fetch only the lines added since their previous call.
+    `speaker`, `start` and `end` filter via the buffer's indexes (timestamps
+    without an offset are taken as UTC).
+    """
+    buf = await _get_buffer(meeting_id)
+    if buf is None:
+        raise HTTPException(status_code=404, detail="No active meeting buffer")
+    buf.touch()
+    page = await asyncio.to_thread(
+        buf.query, since=since, start=start, end=end, speaker=speaker, limit=limit
+    )
+    return {
+        "entries": [{"seq": seq, **e.model_dump(mode="json")} for seq, e in page],
+        "last_seq": page[-1][0] if page else max(since, 0),
+    }
+
+
+# Seconds between SSE keep-alive comments when no entries arrive
+_SSE_KEEPALIVE_S = 15.0
+
+# Page size when backfilling a viewer from the buffer
+_SSE_BACKFILL_PAGE = 500
+
+
+def _sse_entry(seq: int, data: str) -> str:
+    return f"id: {seq}\nevent: transcript\ndata: {data}\n\n"
+
+
+@app.get("/meetings/{meeting_id}/transcript/stream")
+async def stream_transcript_events(
+    meeting_id: str,
+    request: Request,
+    since: int | None = Query(None, ge=0, description="Replay entries with seq greater than this"),
+    last_event_id: int | None = Header(None, ge=0),
+):
+    """
+    Live-tail the transcript as Server-Sent Events.
+
+    Each appended entry is sent once as a `transcript` event whose `id` is
+    its seq, so a reconnecting EventSource resumes via `Last-Event-ID`
+    (or `?since=`) without gaps or duplicates. Viewers get a bounded queue
+    each: if one falls behind, its oldest queued events are dropped and the
+    missed range is re-read from the buffer, so slow viewers never hold up
+    ingestion or other viewers.
+    """
+    buf = await _get_buffer(meeting_id)
     if buf is None:
         raise HTTPException(status_code=404, detail="No active meeting buffer")
-    return {"entries": [e.model_dump(mode="json") for e in buf.snapshot()]}
+    resume = last_event_id if last_event_id is not None else since
+
+    async def events():
+        # Subscribe before backfilling so nothing appended in between is missed
+        sub = buf.subscribe()
+        try:
+            cursor = await asyncio.to_thread(lambda: buf.last_seq) if resume is None else resume
+            backfill = resume is not None
+            while True:
+                if backfill:
+                    page = await asyncio.to_thread(buf.since, cursor, limit=_SSE_BACKFILL_PAGE)
+                    for seq, entry in page:
+                        yield _sse_entry(seq, TranscriptEvent(seq, entry).json())
+                        cursor = seq
+                    backfill = len(page) == _SSE_BACKFILL_PAGE
+                    continue
+                batch, dropped = await sub.get(timeout=_SSE_KEEPALIVE_S)
+                if await request.is_disconnected():
+                    break
+                if dropped:
+                    # Coalesce: re-read everything after the cursor in pages
+                    backfill = True
+                    continue
+                if not batch:
+                    if sub.closed:
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                for event in batch:
+                    if event.seq > cursor:
+                        yield _sse_entry(event.seq, event.json())
+                        cursor = event.seq
+            yield "event: end\ndata: {}\n\n"
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ── Streaming ingestion ───────────────────────────────────────────────────────
+
+_TRANSCRIPT_LINES = TypeAdapter(list[TranscriptLine])
+
+# Close code for an audio stream turned away because every recognizer is busy
+_WS_TRY_AGAIN_LATER = 1013
+
+
+def _parse_stream_frame(text: str) -> list[TranscriptLine]:
+    """Parse a text frame: a JSON array of lines, or one JSON line object per text line."""
+    text = text.strip()
+    if text.startswith("["):
+        return _TRANSCRIPT_LINES.validate_json(text)
+    return [TranscriptLine.model_validate_json(line) for line in text.splitlines() if line.strip()]
+
+
+@app.websocket("/meetings/{meeting_id}/stream")
+async def stream_transcript(websocket: WebSocket, meeting_id: str, speaker: str = "Unknown"):
+    """
+    Stream transcript lines (and optionally raw audio) into the live buffer.
+
+    Text frames carry newline-delimited JSON lines (`{"speaker", "text",
+    "language"}`) or a JSON array of them. Each frame is appended and
+    acknowledged with `{"buffered", "total", "last_seq"}` before the next one
+    is read, so a producer that outpaces the server is held back by the
+    socket rather than queueing unbounded work here.
+
+    Binary frames carry raw PCM (16 kHz, 16-bit, mono) for a server-side
+    recognizer from the pool (see `/meetings/{id}/audio`) attributed to
+    `?speaker=`; recognized utterances are appended as they arrive. If no
+    recognizer frees up in time the socket is closed with code 1013.
+
+    While the socket is open the meeting is never evicted as idle.
+    """
+    await websocket.accept()
+    buf = await _get_buffer(meeting_id)
+    if buf is None:
+        await websocket.close(code=4404, reason="No active meeting buffer")
+        return
+
+    session: AudioSession | None = None
+    async with AsyncExitStack() as stack:
+        stack.enter_context(buf.hold())
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                audio = message.get("bytes")
+                if audio is not None:
+                    if session is None:
+                        session = await stack.enter_async_context(
+                            get_recognizer_pool().session(meeting_id, buf, speaker)
+                        )
+                    session.push(audio)
+                    continue
+                try:
+                    lines = _parse_stream_frame(message.get("text") or "")
+                except ValidationError as exc:
+                    await websocket.send_json({"error": exc.errors(include_url=False)})
+                    continue
+                total, last_seq = await asyncio.to_thread(
+                    _extend, buf, [line.to_entry() for line in lines]
+                )
+                await websocket.send_json(
+                    {"buffered": len(lines), "total": total, "last_seq": last_seq}
+                )
+        except PoolExhausted as exc:
+            await websocket.close(code=_WS_TRY_AGAIN_LATER, reason=str(exc))
+        except WebSocketDisconnect:
+            pass
+
+
+@app.websocket("/meetings/{meeting_id}/audio")
+async def stream_audio(websocket: WebSocket, meeting_id: str, speaker: str = "Unknown"):
+    """
+    Stream raw PCM audio (16 kHz, 16-bit, mono binary frames) for server-side
+    speech recognition; utterances attributed to `?speaker=` are appended to
+    the meeting's transcript as they are recognized.
+
+    Each worker runs at most SPEECH_MAX_RECOGNIZERS recognizers (one per
+    audio stream). The server sends:
+
+    - `{"status": "queued", "position": n}` while every recognizer is busy
+    - `{"status": "recognizing"}` once one is assigned; send audio after this
+    - `{"status": "stopped", "entries": n}` after a text frame ends the
+      stream and the recognizer has flushed its last results
+
+    The socket is closed with code 1013 (try again later) if the wait queue
+    is full or no recognizer frees up within SPEECH_QUEUE_TIMEOUT_S.
+    """
+    await websocket.accept()
+    buf = await _get_buffer(meeting_id)
+    if buf is None:
+        await websocket.close(code=4404, reason="No active meeting buffer")
+        return
+
+    async def queued(position: int) -> None:
+        await websocket.send_json({"status": "queued", "position": position})
+
+    stopped = False
+    try:
+        pool = get_recognizer_pool()
+        async with pool.session(meeting_id, buf, speaker, on_queued=queued) as session:
+            await websocket.send_json({"status": "recognizing"})
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                audio = message.get("bytes")
+                if audio is None:
+                    stopped = True
+                    break
+                session.push(audio)
+        if stopped:
+            await websocket.send_json({"status": "stopped", "entries": session.entries})
+            await websocket.close()
+    except PoolExhausted as exc:
+        await websocket.close(code=_WS_TRY_AGAIN_LATER, reason=str(exc))
+    except WebSocketDisconnect:
+        pass
 
 
 # ── Document upload ───────────────────────────────────────────────────────────
 
-@app.post("/meetings/{meeting_id}/documents", status_code=201)
+async def _ensure_documents_map(store, meeting_id: str, session_doc: dict) -> None:
+    """
+    Create the session's `documents` map if it is missing. The create is
+    conditioned on the session's etag, so it cannot replace a map that a
+    concurrent upload created (and added its document to) since our read.
+    """
+    while "documents" not in session_doc:
+        try:
+            await store.patch(
+                CONTAINER_SESSIONS,
+                meeting_id,
+                [{"op": "add", "path": "/documents", "value": {}}],
+                etag=session_doc.get("_etag"),
+            )
+            return
+        except CosmosAccessConditionFailedError:
+            # The session changed since it was read: look again
+            session_doc = await store.get(CONTAINER_SESSIONS, meeting_id)
+            if not session_doc:
+                raise HTTPException(status_code=404, detail="Meeting not found")
+
+
+@app.post("/meetings/{meeting_id}/documents", status_code=202)
 async def upload_document(
     meeting_id: str,
     file: UploadFile = File(...),
+    idempotency_key: str | None = Header(None),
 ):
     """
     Pre-upload a document for a meeting session.
-    The document is processed by Document Intelligence and indexed in AI Search.
+
+    The file is stored in Blob Storage, then a background job extracts it
+    with Document Intelligence and indexes it in AI Search; poll
+    `GET /meetings/{meeting_id}/documents/{document_id}` for progress.
+    Retrying with the same `Idempotency-Key` header returns the original
+    job without re-uploading.
     """
     store = get_cosmos_store()
     session_doc = await store.get(CONTAINER_SESSIONS, meeting_id)
     if not session_doc:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
+    if idempotency_key is not None:
+        job = await _find_job(ingest_document_job.idempotency_key(meeting_id, idempotency_key))
+        if job is not None:
+            return {
+                "document_id": job.payload.get("document_id"),
+                "blob_name": job.payload["blob_name"],
+                "job_id": job.id,
+                "status": job.status,
+            }
+
+    await _warm("blob")
     blob_store = get_blob_store()
-    file_bytes = await file.read()
+    filename = file.filename or "upload"
+    document_id = uuid.uuid4().hex
 
-    # Store in Blob
-    blob_name = await blob_store.upload(
-        data=file_bytes,
-        filename=file.filename or "upload",
+    # Stream into Blob in staged blocks; the file is never read whole into memory
+    blob_name, _ = await blob_store.upload_stream(
+        file,
+        filename=filename,
         meeting_id=meeting_id,
         content_type=file.content_type or "application/octet-stream",
+        blob_id=document_id,
     )
 
-    # Process with Document Intelligence
-    chunks = await process_document(
-        file_bytes=file_bytes,
-        filename=file.filename or "upload",
-        meeting_id=meeting_id,
-        doc_type="meeting",
+    # Track document in session; patched so concurrent uploads don't race
+    await _ensure_documents_map(store, meeting_id, session_doc)
+    status = DocumentStatus(id=document_id, filename=filename, blob_name=blob_name)
+    await store.patch(CONTAINER_SESSIONS, meeting_id, [
+        {"op": "add", "path": "/document_ids/-", "value": blob_name},
+        {"op": "set", "path": f"/documents/{document_id}", "value": status.model_dump(mode="json")},
+    ])
+    # Cached answers may be missing what the new document says
+    invalidate_meeting(meeting_id)
+
+    # Extract and index in the background
+    job = await _submit_job(
+        ingest_document_job.JOB_KIND,
+        meeting_id,
+        ingest_document_job.build_payload(blob_name, filename, document_id),
+        ingest_document_job.idempotency_key(meeting_id, idempotency_key or blob_name),
     )
+    return {
+        "document_id": document_id,
+        "blob_name": blob_name,
+        "job_id": job.id,
+        "status": job.status,
+    }
 
-    # Index chunks in Azure AI Search
-    await upsert_chunks(chunks)
 
-    # Track document in session
-    session = MeetingSession(**session_doc)
-    session.document_ids.append(blob_name)
-    await store.upsert(CONTAINER_SESSIONS, session.model_dump(mode="json"))
-
-    return {"blob_name": blob_name, "chunks_indexed": len(chunks)}
+@app.get("/meetings/{meeting_id}/documents/{document_id}")
+async def get_document_status(meeting_id: str, document_id: str):
+    """
+    Ingestion progress of an uploaded document: status (queued → processing →
+    ready | failed), pages analyzed and chunks indexed so far.
+    """
+    session_doc = await get_cosmos_store().get(CONTAINER_SESSIONS, meeting_id)
+    if not session_doc:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    status = MeetingSession(**session_doc).documents.get(document_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return status
 
 
 # ── Q&A ───────────────────────────────────────────────────────────────────────
@@ -215,14 +869,76 @@ class QARequest(BaseModel):
 
 @app.post("/meetings/{meeting_id}/qa")
 async def ask_question(meeting_id: str, body: QARequest):
-    """Answer a question in the context of the active meeting."""
+    """
+    Answer a question in the context of the active meeting. Repeats and
+    paraphrases of a recent question are answered from the meeting's answer
+    cache, and identical questions asked while one is being answered share
+    its agent run.
+    """
     conversation_id = body.conversation_id or meeting_id
-    buffer = _active_buffers.get(meeting_id)
+    buffer = await _get_buffer(meeting_id)
+    if buffer is not None:
+        buffer.touch()
+    await _warm("search_index")
 
-    answer = await qa_agent.answer(
+    answer = await qa_agent.answer_cached(
         question=body.question,
         meeting_id=meeting_id,
         conversation_id=conversation_id,
         buffer=buffer,
     )
     return {"answer": answer, "conversation_id": conversation_id}
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/meetings/{meeting_id}/qa/stream")
+async def ask_question_stream(meeting_id: str, body: QARequest):
+    """
+    Answer a question as Server-Sent Events, so the first words arrive in
+    well under a second instead of after the whole agent run:
+
+    - `progress`: the agent started a tool,
+      e.g. `{"tool": "web_search", "message": "Searching the web…"}`
+    - `token`: answer text as it is generated, `{"text": "..."}`
+    - `done`: `{"answer": "...", "conversation_id": "..."}`, the same body as `POST .../qa`
+    - `error`: `{"detail": "..."}` if the run fails part-way
+    """
+    conversation_id = body.conversation_id or meeting_id
+    buffer = await _get_buffer(meeting_id)
+    if buffer is not None:
+        buffer.touch()
+    await _warm("search_index")
+
+    async def events():
+        # Sent straight away so proxies and the browser open the stream
+        yield ": ok\n\n"
+        stream = qa_agent.answer_stream(
+            question=body.question,
+            meeting_id=meeting_id,
+            conversation_id=conversation_id,
+            buffer=buffer,
+        )
+        try:
+            async for event in stream:
+                if event.type == "tool_call":
+                    message = qa_agent.TOOL_PROGRESS.get(event.tool, f"Running {event.tool}…")
+                    yield _sse_event("progress", {"tool": event.tool, "message": message})
+                elif event.type == "token":
+                    yield _sse_event("token", {"text": event.text})
+                else:
+                    done = {"answer": event.text, "conversation_id": conversation_id}
+                    yield _sse_event("done", done)
+        except Exception as exc:
+            logger.exception("Streaming answer failed for meeting %s", meeting_id)
+            yield _sse_event("error", {"detail": str(exc) or type(exc).__name__})
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+StageStatus = Literal["running", "succeeded", "failed", "cancelled"]
+
+
+class JobStage(BaseModel):
+    """Progress of one named step inside a background job."""
+
+    name: str
+    status: StageStatus = "running"
+    error: str | None = None
+    started_at: datetime = Field(default_factory=_utcnow)
+    finished_at: datetime | None = None
+
+
+class Job(BaseModel):
+    """A unit of background work (e.g. the end-of-meeting pipeline) and its progress."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: str
+    meeting_id: str
+    status: JobStatus = "queued"
+    # Requests carrying the same key map to the same job
+    idempotency_key: str | None = None
+    attempts: int = 0
+    max_attempts: int = 1
+    stages: list[JobStage] = Field(default_factory=list)
+    error: str | None = None
+    result: dict[str, Any] | None = None
+    created_at: datetime = Field(default_factory=_utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    # Handler input, and progress a retry resumes from (e.g. minutes already
+    # generated); internal, so left out of status responses
+    payload: dict[str, Any] = Field(default_factory=dict, exclude=True)
+    checkpoint: dict[str, Any] = Field(default_factory=dict, exclude=True)
@@ -19,6 +19,22 @@ class TranscriptEntry(BaseModel):
     timestamp: datetime = Field(default_factory=_utcnow)
 
 
+class DocumentStatus(BaseModel):
+    """Ingestion progress of a document uploaded for a session."""
+
+    id: str
+    filename: str
+    blob_name: str
+    status: Literal["queued", "processing", "ready", "failed"] = "queued"
+    job_id: str | None = None
+    pages_analyzed: int = 0
+    # Chunks produced so far; final once status is "ready"
+    chunks_total: int = 0
+    chunks_indexed: int = 0
+    error: str | None = None
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+
 class MeetingSession(BaseModel):
     """Tracks an active or completed meeting session."""
 
@@ -32,6 +48,10 @@ class MeetingSession(BaseModel):
     status: Literal["active", "ended"] = "active"
     # IDs of documents pre-uploaded for this session
     document_ids: list[str] = Field(default_factory=list)
+    # Ingestion status of those documents, keyed by document id
+    documents: dict[str, DocumentStatus] = Field(default_factory=dict)
+    # Key of the meeting's minutes in the minutes container, once generated
+    minutes_id: str | None = None
 
 
 class ConversationTurn(BaseModel):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import IO, AsyncIterator
 
 from app.config import get_settings
 
@@ -25,24 +26,42 @@ class DocumentChunk:
 
 
 async def process_document(
-    file_bytes: bytes,
+    file_bytes: bytes | IO[bytes] | None,
     filename: str,
     meeting_id: str,
     doc_type: str = "meeting",
+    url_source: str | None = None,
 ) -> list[DocumentChunk]:
     """
     Analyze a document using Azure Document Intelligence and return text chunks.
     Supports PDF, DOCX, PPTX, XLSX, images (PNG/JPEG/TIFF).
 
     Args:
-        file_bytes: Raw bytes of the document.
+        file_bytes: Raw bytes of the document, or a binary file object that is
+            streamed to the service. None when `url_source` is given.
         filename: Original filename (used as source label in search).
         meeting_id: Meeting session ID for search scoping.
         doc_type: "meeting" (session-scoped) or "org" (persistent org KB).
+        url_source: URL the service fetches the document from (e.g. a blob SAS
+            URL), so the file never passes through this process.
 
     Returns:
         List of DocumentChunk objects ready for embedding and indexing.
     """
+    chunks: list[DocumentChunk] = []
+    async for page, text in analyze_document(file_bytes, url_source):
+        chunks.extend(chunk_page(text, filename, meeting_id, page, doc_type))
+    return chunks
+
+
+async def analyze_document(
+    file_bytes: bytes | IO[bytes] | None,
+    url_source: str | None = None,
+) -> AsyncIterator[tuple[int, str]]:
+    """
+    Run Document Intelligence layout analysis and yield (page_number, text)
+    for each page, in order. See process_document() for the arguments.
+    """
     # TODO: Implement document analysis using Azure Document Intelligence.
     #
     # Pattern:
@@ -53,16 +72,38 @@ async def process_document(
     #       endpoint=settings.azure_document_intelligence_endpoint,
     #       credential=AzureKeyCredential(settings.azure_document_intelligence_key),
     #   )
+    #   from azure.ai.documentintelligence.models import AnalyzeDocumentRequest
     #   async with client:
-    #       poller = await client.begin_analyze_document(
-    #           model_id="prebuilt-layout",
-    #           body=file_bytes,
-    #           content_type="application/octet-stream",
-    #       )
+    #       if url_source:
+    #           poller = await client.begin_analyze_document(
+    #               model_id="prebuilt-layout",
+    #               body=AnalyzeDocumentRequest(url_source=url_source),
+    #           )
+    #       else:
+    #           poller = await client.begin_analyze_document(
+    #               model_id="prebuilt-layout",
+    #               body=file_bytes,  # bytes or file object (streamed)
+    #               content_type="application/octet-stream",
+    #           )
     #       result = await poller.result()
-    #   # Split each page's text into overlapping chunks using _split_text()
-    #   # Set doc_type on each chunk
-    raise NotImplementedError("TODO: implement process_document()")
+    #   for page in result.pages:
+    #       yield page.page_number, "\n".join(line.content for line in page.lines or [])
+    raise NotImplementedError("TODO: implement analyze_document()")
+    yield  # pragma: no cover  (makes this an async generator)
+
+
+def chunk_page(
+    text: str,
+    source: str,
+    meeting_id: str,
+    page: int = 1,
+    doc_type: str = "meeting",
+) -> list[DocumentChunk]:
+    """Split one page's text into overlapping chunks tagged with `doc_type`."""
+    chunks = _split_text(text, source, meeting_id, page)
+    for chunk in chunks:
+        chunk.doc_type = doc_type
+    return chunks
 
 
 def _split_text(text: str, source: str, meeting_id: str, page: int = 1) -> list[DocumentChunk]:
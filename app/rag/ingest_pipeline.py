@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import IO, AsyncContextManager, Awaitable, Callable
+
+from app.rag.document_processor import DocumentChunk, analyze_document, chunk_page
+from app.rag.retriever import embed_chunks, index_chunks
+
+# Items buffered between two stages; a slow stage blocks the one feeding it
+DEFAULT_QUEUE_SIZE = 4
+# Chunks per embedding request / index upload
+DEFAULT_BATCH_SIZE = 16
+
+_DONE = None  # end-of-stream marker passed down the queues
+
+
+@dataclass
+class IngestProgress:
+    pages_analyzed: int = 0
+    chunks_total: int = 0
+    chunks_embedded: int = 0
+    chunks_indexed: int = 0
+
+
+def _untracked(name: str) -> AsyncContextManager[None]:
+    return contextlib.nullcontext()
+
+
+async def run_ingest_pipeline(
+    file_bytes: bytes | IO[bytes] | None,
+    filename: str,
+    meeting_id: str,
+    doc_type: str = "meeting",
+    url_source: str | None = None,
+    on_progress: Callable[[IngestProgress], Awaitable[None]] | None = None,
+    track: Callable[[str], AsyncContextManager[None]] = _untracked,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> IngestProgress:
+    """
+    Ingest a document as four concurrent stages joined by bounded queues:
+
+        analyze (pages) → chunk (batches) → embed → index
+
+    so indexing of the first pages overlaps analysis of the rest, and memory
+    is bounded by the queue sizes rather than the document size. Each stage
+    runs inside `track(stage_name)`, and `on_progress` is awaited after every
+    page analyzed and batch indexed. A failure in any stage cancels the others
+    and is raised (as an ExceptionGroup); arguments are as for process_document().
+    """
+    progress = IngestProgress()
+    pages: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(queue_size)
+    batches: asyncio.Queue[list[DocumentChunk] | None] = asyncio.Queue(queue_size)
+    embedded: asyncio.Queue[tuple[list[DocumentChunk], list[list[float]]] | None] = (
+        asyncio.Queue(queue_size)
+    )
+
+    async def report() -> None:
+        if on_progress is not None:
+            await on_progress(progress)
+
+    async def analyze() -> None:
+        async with track("analyze"):
+            async for page in analyze_document(file_bytes, url_source):
+                await pages.put(page)
+                progress.pages_analyzed += 1
+                await report()
+        await pages.put(_DONE)
+
+    async def chunk() -> None:
+        async with track("chunk"):
+            batch: list[DocumentChunk] = []
+            while (page := await pages.get()) is not _DONE:
+                number, text = page
+                for c in chunk_page(text, filename, meeting_id, number, doc_type):
+                    batch.append(c)
+                    progress.chunks_total += 1
+                    if len(batch) == batch_size:
+                        await batches.put(batch)
+                        batch = []
+            if batch:
+                await batches.put(batch)
+        await batches.put(_DONE)
+
+    async def embed() -> None:
+        async with track("embed"):
+            while (batch := await batches.get()) is not _DONE:
+                embeddings = await embed_chunks(batch)
+                progress.chunks_embedded += len(batch)
+                await embedded.put((batch, embeddings))
+        await embedded.put(_DONE)
+
+    async def index() -> None:
+        async with track("index"):
+            while (item := await embedded.get()) is not _DONE:
+                batch, embeddings = item
+                await index_chunks(batch, embeddings)
+                progress.chunks_indexed += len(batch)
+                await report()
+
+    async with asyncio.TaskGroup() as tg:
+        for stage in (analyze, chunk, embed, index):
+            tg.create_task(stage())
+    return progress
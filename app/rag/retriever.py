@@ -44,16 +44,33 @@ async def upsert_chunks(chunks: list[DocumentChunk]) -> None:
     Args:
         chunks: List of DocumentChunk objects from document_processor.process_document().
     """
-    # TODO: Implement chunk embedding and upsert.
+    await index_chunks(chunks, await embed_chunks(chunks))
+
+
+async def embed_chunks(chunks: list[DocumentChunk]) -> list[list[float]]:
+    """Embed the text of each chunk, in order."""
+    return await _embed([c.text for c in chunks])
+
+
+async def embed_query(text: str) -> list[float]:
+    """Embed a single query string."""
+    [embedding] = await _embed([text])
+    return embedding
+
+
+async def index_chunks(chunks: list[DocumentChunk], embeddings: list[list[float]]) -> None:
+    """Upload already-embedded chunks to the search index."""
+    # TODO: Implement chunk upload.
     #
     # Pattern:
-    #   embeddings = await _embed([c.text for c in chunks])
-    #   docs = [{"id": str(uuid.uuid4()), "content": c.text, "source": c.source,
+    #   # Deterministic ids: a retried ingestion job overwrites instead of duplicating
+    #   docs = [{"id": hashlib.sha1(f"{c.meeting_id}/{c.source}/{c.page}/{c.chunk_index}"
+    #                               .encode()).hexdigest(), "content": c.text, "source": c.source,
     #            "doc_type": c.doc_type, "meeting_id": c.meeting_id, "page": c.page,
     #            "embedding": emb} for c, emb in zip(chunks, embeddings)]
     #   async with SearchClient(...) as client:
     #       await client.upload_documents(documents=docs)
-    raise NotImplementedError("TODO: implement upsert_chunks()")
+    raise NotImplementedError("TODO: implement index_chunks()")
 
 
 async def hybrid_search(
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import re
+import time
+from typing import Callable, Iterable
+
+import httpx
+import websockets
+
+from app.state.resp import RespClient
+
+logger = logging.getLogger(__name__)
+
+# Points per node on the ring; more points spread meetings more evenly
+DEFAULT_VNODES = 128
+
+# Set on forwarded requests so a node that disagrees about ownership (e.g. mid
+# membership change) serves the request instead of bouncing it back
+FORWARDED_HEADER = b"x-meetingbot-forwarded-by"
+
+_MEETING_PATH = re.compile(r"^/meetings/([^/]+)(?:/|$)")
+
+# Headers that describe one connection and must not be forwarded
+_HOP_BY_HOP = frozenset({
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+    b"te", b"trailer", b"transfer-encoding", b"upgrade", b"host",
+})
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping keys (meeting ids) to nodes (worker URLs).
+
+    Each node is placed at `vnodes` pseudo-random points; a key belongs to the
+    first point clockwise from its hash. Adding or removing a node only moves
+    the keys on the arcs it gains or loses (about 1/N of them).
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = DEFAULT_VNODES) -> None:
+        self.vnodes = vnodes
+        self._nodes: frozenset[str] = frozenset()
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        self.set_nodes(nodes)
+
+    @property
+    def nodes(self) -> frozenset[str]:
+        return self._nodes
+
+    def set_nodes(self, nodes: Iterable[str]) -> bool:
+        """Replace the membership; returns False if it was unchanged."""
+        nodes = frozenset(nodes)
+        if nodes == self._nodes:
+            return False
+        ring = sorted((_hash(f"{node}#{i}"), node) for node in nodes for i in range(self.vnodes))
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+        self._nodes = nodes
+        return True
+
+    def owner(self, key: str) -> str | None:
+        if not self._points:
+            return None
+        idx = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[idx]
+
+
+class StaticMembership:
+    """Fixed node list (e.g. AFFINITY_PEERS)."""
+
+    def __init__(self, nodes: Iterable[str]) -> None:
+        self._nodes = set(nodes)
+
+    def join(self, node: str) -> None:
+        self._nodes.add(node)
+
+    def leave(self, node: str) -> None:
+        self._nodes.discard(node)
+
+    def members(self) -> set[str]:
+        return set(self._nodes)
+
+
+class RedisMembership:
+    """
+    Nodes announce themselves in a Redis hash (node → last heartbeat time);
+    a node that stops heartbeating drops out after `ttl_s`.
+    """
+
+    def __init__(self, client: RespClient, key: str = "meetingbot:nodes", ttl_s: float = 15.0):
+        self._client = client
+        self._key = key
+        self.ttl_s = ttl_s
+
+    def join(self, node: str) -> None:
+        self._client.execute("HSET", self._key, node, f"{time.time():.3f}")
+
+    def leave(self, node: str) -> None:
+        self._client.execute("HDEL", self._key, node)
+
+    def members(self) -> set[str]:
+        raw = self._client.execute("HGETALL", self._key) or []
+        cutoff = time.time() - self.ttl_s
+        return {
+            node.decode()
+            for node, seen in zip(raw[::2], raw[1::2])
+            if float(seen) >= cutoff
+        }
+
+
+class AffinityRouter:
+    """
+    Decides which worker owns each meeting and keeps the ring in step with
+    cluster membership.
+
+    Every `heartbeat_s` the router re-announces this node and re-reads the
+    membership; when it changes the ring is rebuilt and `on_rebalance` is
+    called with is_local(), so the caller can release meetings this node no
+    longer owns (their new owner rebuilds them from shared state).
+    """
+
+    def __init__(
+        self,
+        self_url: str,
+        membership: StaticMembership | RedisMembership,
+        heartbeat_s: float = 5.0,
+        on_rebalance: Callable[[Callable[[str], bool]], None] | None = None,
+        vnodes: int = DEFAULT_VNODES,
+    ) -> None:
+        self.self_url = self_url.rstrip("/")
+        self.membership = membership
+        self.heartbeat_s = heartbeat_s
+        self.on_rebalance = on_rebalance
+        self.ring = HashRing([self.self_url], vnodes=vnodes)
+        self._task: asyncio.Task | None = None
+
+    def owner(self, meeting_id: str) -> str:
+        return self.ring.owner(meeting_id) or self.self_url
+
+    def is_local(self, meeting_id: str) -> bool:
+        return self.owner(meeting_id) == self.self_url
+
+    def refresh(self) -> bool:
+        """Heartbeat and re-read membership; returns True if the ring changed."""
+        self.membership.join(self.self_url)
+        nodes = {n.rstrip("/") for n in self.membership.members()} | {self.self_url}
+        if not self.ring.set_nodes(nodes):
+            return False
+        logger.info("Affinity ring rebalanced: %d node(s) %s", len(nodes), sorted(nodes))
+        if self.on_rebalance is not None:
+            self.on_rebalance(self.is_local)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception:
+                logger.exception("Affinity membership refresh failed")
+            await asyncio.sleep(self.heartbeat_s)
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self.refresh)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.membership.leave, self.self_url)
+
+
+class MeetingAffinityMiddleware:
+    """
+    ASGI middleware that forwards `/meetings/{meeting_id}/...` HTTP and
+    WebSocket requests to the meeting's owning worker, streaming bodies both
+    ways (so SSE and WebSocket streams work through it). Requests for
+    meetings this node owns, requests without a meeting id, and requests
+    already forwarded once are served locally.
+
+    `get_router` is called per request so the router can be created in the
+    app's lifespan; while it returns None everything is served locally.
+    """
+
+    def __init__(
+        self,
+        app,
+        get_router: Callable[[], AffinityRouter | None],
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.app = app
+        self.get_router = get_router
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=None))
+        return self._client
+
+    async def __call__(self, scope, receive, send) -> None:
+        router = self.get_router()
+        if router is None or scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+        match = _MEETING_PATH.match(scope["path"])
+        if match is None or any(k == FORWARDED_HEADER for k, _ in scope["headers"]):
+            return await self.app(scope, receive, send)
+        owner = router.owner(match.group(1))
+        if owner == router.self_url:
+            return await self.app(scope, receive, send)
+        if scope["type"] == "http":
+            return await self._forward_http(scope, receive, send, owner, router.self_url)
+        return await self._forward_websocket(scope, receive, send, owner, router.self_url)
+
+    @staticmethod
+    def _target(scope, owner: str) -> str:
+        path = scope.get("raw_path") or scope["path"].encode()
+        query = scope.get("query_string") or b""
+        return owner + path.decode("latin-1") + ("?" + query.decode("latin-1") if query else "")
+
+    @staticmethod
+    def _headers(scope, self_url: str) -> list[tuple[bytes, bytes]]:
+        headers = [(k, v) for k, v in scope["headers"] if k.lower() not in _HOP_BY_HOP]
+        headers.append((FORWARDED_HEADER, self_url.encode()))
+        return headers
+
+    async def _forward_http(self, scope, receive, send, owner: str, self_url: str) -> None:
+        async def body():
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                yield message.get("body", b"")
+                if not message.get("more_body"):
+                    return
+
+        request = self.client.build_request(
+            scope["method"],
+            self._target(scope, owner),
+            headers=self._headers(scope, self_url),
+            content=body(),
+        )
+        try:
+            response = await self.client.send(request, stream=True)
+        except httpx.TransportError as exc:
+            logger.warning("Forwarding %s to %s failed: %s", scope["path"], owner, exc)
+            await send({
+                "type": "http.response.start",
+                "status": 502,
+                "headers": [(b"content-type", b"application/json")],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": b'{"detail":"Meeting owner unreachable"}',
+            })
+            return
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (k, v) for k, v in response.headers.raw if k.lower() not in _HOP_BY_HOP
+                ],
+            })
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            await response.aclose()
+
+    async def _forward_websocket(self, scope, receive, send, owner: str, self_url: str) -> None:
+        await receive()  # websocket.connect
+        url = "ws" + self._target(scope, owner).removeprefix("http")
+        headers = [
+            (k.decode("latin-1"), v.decode("latin-1"))
+            for k, v in self._headers(scope, self_url)
+            if not k.lower().startswith(b"sec-websocket")
+        ]
+        try:
+            upstream = await websockets.connect(url, additional_headers=headers)
+        except (OSError, websockets.WebSocketException) as exc:
+            logger.warning("Forwarding %s to %s failed: %s", scope["path"], owner, exc)
+            await send({"type": "websocket.close", "code": 1011})
+            return
+        await send({"type": "websocket.accept"})
+
+        async def client_to_upstream() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                data = message.get("text")
+                await upstream.send(data if data is not None else message["bytes"])
+
+        async def upstream_to_client() -> None:
+            try:
+                async for data in upstream:
+                    key = "text" if isinstance(data, str) else "bytes"
+                    await send({"type": "websocket.send", key: data})
+            except websockets.ConnectionClosed:
+                pass
+            await send({"type": "websocket.close", "code": upstream.close_code or 1000})
+
+        tasks = [
+            asyncio.create_task(client_to_upstream()),
+            asyncio.create_task(upstream_to_client()),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await upstream.close()
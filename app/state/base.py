@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Iterator
+
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+
+class MeetingStore(MutableMapping[str, TranscriptBuffer]):
+    """
+    Where live meetings' transcript buffers are kept: a mapping of
+    meeting_id → TranscriptBuffer plus create().
+
+    InProcessStore keeps plain buffers in this process. The shared backends
+    (SharedMemoryStore, RedisStore) hand out ReplicatedTranscriptBuffers
+    backed by a log every API worker can see, so requests for one meeting may
+    land on any worker. Removing a meeting from the store only forgets it
+    locally; closing its buffer discards the transcript everywhere.
+    """
+
+    def create(self, meeting_id: str) -> TranscriptBuffer:
+        raise NotImplementedError
+
+    def __setitem__(self, meeting_id: str, buffer: TranscriptBuffer) -> None:
+        raise TypeError(f"{type(self).__name__} creates its own buffers; use create()")
+
+    def local_meetings(self) -> list[str]:
+        """Meetings with a buffer held in this process."""
+        return list(self)
+
+    def release(self, meeting_id: str) -> None:
+        """
+        Drop this process's copy of a meeting that is now served elsewhere.
+        Only shared backends can do this; in-process buffers are kept.
+        """
+
+    def evict(self, meeting_id: str) -> bool:
+        """
+        Free this process's memory for an idle meeting but keep its transcript,
+        so the next access reloads it. Returns False, keeping the buffer, when
+        the transcript only exists in memory. Shared backends release their
+        replica (the shared log stays).
+        """
+        self.release(meeting_id)
+        return True
+
+    def close(self) -> None:
+        """Release process-local resources; shared transcripts are left in place."""
+
+
+class InProcessStore(MeetingStore):
+    """
+    Buffers in a process-local dict (single worker; the default).
+
+    A meeting evicted while idle keeps only its WAL; the next lookup rebuilds
+    its buffer from the factory, which replays the log. Lookups run in worker
+    threads, so the dict is guarded by a lock and an evicted meeting is
+    rebuilt exactly once.
+    """
+
+    def __init__(self, factory: Callable[[str], TranscriptBuffer] | None = None) -> None:
+        self._factory = factory or (lambda meeting_id: TranscriptBuffer())
+        self._buffers: dict[str, TranscriptBuffer] = {}
+        self._evicted: set[str] = set()
+        self._lock = threading.Lock()
+
+    def create(self, meeting_id: str) -> TranscriptBuffer:
+        with self._lock:
+            return self._create_locked(meeting_id)
+
+    def _create_locked(self, meeting_id: str) -> TranscriptBuffer:
+        self._evicted.discard(meeting_id)
+        buffer = self._buffers[meeting_id] = self._factory(meeting_id)
+        return buffer
+
+    def __getitem__(self, meeting_id: str) -> TranscriptBuffer:
+        with self._lock:
+            buffer = self._buffers.get(meeting_id)
+            if buffer is None:
+                if meeting_id not in self._evicted:
+                    raise KeyError(meeting_id)
+                buffer = self._create_locked(meeting_id)
+            return buffer
+
+    def __setitem__(self, meeting_id: str, buffer: TranscriptBuffer) -> None:
+        with self._lock:
+            self._evicted.discard(meeting_id)
+            self._buffers[meeting_id] = buffer
+
+    def __delitem__(self, meeting_id: str) -> None:
+        with self._lock:
+            if self._buffers.pop(meeting_id, None) is None and meeting_id not in self._evicted:
+                raise KeyError(meeting_id)
+            self._evicted.discard(meeting_id)
+
+    def __contains__(self, meeting_id: object) -> bool:
+        # Without reloading an evicted meeting, as the Mapping default would
+        with self._lock:
+            return meeting_id in self._buffers or meeting_id in self._evicted
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter([*self._buffers, *sorted(self._evicted)])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buffers) + len(self._evicted)
+
+    def local_meetings(self) -> list[str]:
+        with self._lock:
+            return list(self._buffers)
+
+    def evict(self, meeting_id: str) -> bool:
+        with self._lock:
+            buffer = self._buffers.get(meeting_id)
+            if buffer is None:
+                return meeting_id in self._evicted
+            if not buffer.durable:
+                return False
+            del self._buffers[meeting_id]
+            self._evicted.add(meeting_id)
+        buffer.detach()
+        return True
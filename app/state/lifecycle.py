@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+from app.state.base import MeetingStore
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+logger = logging.getLogger(__name__)
+
+# Default seconds without activity before a meeting counts as abandoned
+DEFAULT_IDLE_TIMEOUT_S = 4 * 3600.0
+# Default seconds between sweeps
+DEFAULT_SWEEP_INTERVAL_S = 60.0
+
+
+def describe_meeting(meeting_id: str, buffer: TranscriptBuffer) -> dict[str, Any]:
+    """Memory, age and activity of one live meeting's buffer."""
+    return {
+        "meeting_id": meeting_id,
+        "entries": len(buffer),
+        "memory_bytes": buffer.memory_bytes,
+        "spilled_segments": buffer.spilled_segments,
+        "age_s": round(time.time() - buffer.created_at, 1),
+        "idle_s": round(buffer.idle_s, 1),
+        "in_use": buffer.in_use,
+    }
+
+
+class MeetingLifecycle:
+    """
+    Background sweep that finds meetings nobody ended and frees their buffers.
+
+    Every `interval_s` it looks at the buffers held in this process; one with
+    no appends or touch() for `idle_timeout_s`, and no live viewer or open
+    stream, is handed to `on_idle(meeting_id, buffer)`, which finalizes or
+    checkpoints it and removes it from the store. A failing on_idle is
+    logged and retried on the next sweep.
+    """
+
+    def __init__(
+        self,
+        store: MeetingStore,
+        on_idle: Callable[[str, TranscriptBuffer], Awaitable[None]],
+        idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+        interval_s: float = DEFAULT_SWEEP_INTERVAL_S,
+    ) -> None:
+        self.store = store
+        self.on_idle = on_idle
+        self.idle_timeout_s = idle_timeout_s
+        self.interval_s = interval_s
+        self.evicted = 0
+        self._task: asyncio.Task | None = None
+
+    def idle_meetings(self) -> list[tuple[str, TranscriptBuffer]]:
+        idle = []
+        for meeting_id in self.store.local_meetings():
+            buffer = self.store.get(meeting_id)
+            if buffer is not None and not buffer.in_use and buffer.idle_s >= self.idle_timeout_s:
+                idle.append((meeting_id, buffer))
+        return idle
+
+    async def sweep(self) -> list[str]:
+        """Hand every idle meeting to on_idle; return the ids handled."""
+        handled = []
+        # Store lookups and len() may do network or file I/O for shared backends
+        for meeting_id, buffer in await asyncio.to_thread(self.idle_meetings):
+            entries = await asyncio.to_thread(len, buffer)
+            logger.info(
+                "Meeting '%s' idle for %.0f s (%d entries); evicting",
+                meeting_id, buffer.idle_s, entries,
+            )
+            try:
+                await self.on_idle(meeting_id, buffer)
+            except Exception:
+                logger.exception("Evicting idle meeting '%s' failed", meeting_id)
+                continue
+            handled.append(meeting_id)
+        self.evicted += len(handled)
+        return handled
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            await self.sweep()
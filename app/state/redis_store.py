@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Iterator
+
+from app.state.base import MeetingStore
+from app.state.resp import RespClient
+from app.transcription.replicated import ReplicatedTranscriptBuffer, SharedLog
+
+DEFAULT_KEY_PREFIX = "meetingbot"
+# How long a lookup trusts that a meeting with a local replica is still live
+DEFAULT_MEMBERSHIP_TTL_S = 1.0
+
+
+class RedisLog(SharedLog):
+    """
+    SharedLog stored as a Redis list (one element per record). RPUSH is
+    atomic and every reader sees the same order; the cursor is a list index.
+    """
+
+    def __init__(self, client: RespClient, key: str, registry_key: str, meeting_id: str) -> None:
+        self._client = client
+        self._key = key
+        self._registry_key = registry_key
+        self._meeting_id = meeting_id
+
+    def append(self, payload: bytes) -> None:
+        self._client.execute("RPUSH", self._key, payload)
+
+    def extend(self, payloads: list[bytes]) -> None:
+        self._client.execute("RPUSH", self._key, *payloads)
+
+    def read(self, cursor: int) -> tuple[list[bytes], int]:
+        records = self._client.execute("LRANGE", self._key, cursor, -1) or []
+        return records, cursor + len(records)
+
+    def exists(self) -> bool:
+        return bool(self._client.execute("SISMEMBER", self._registry_key, self._meeting_id))
+
+    def delete(self) -> None:
+        self._client.execute("SREM", self._registry_key, self._meeting_id)
+        self._client.execute("DEL", self._key)
+
+
+class RedisStore(MeetingStore):
+    """
+    Meeting state shared across hosts through a Redis-protocol server.
+
+    Live meeting ids are members of the `<prefix>:meetings` set and each
+    transcript is a RedisLog at `<prefix>:transcript:<meeting_id>`; each
+    process keeps a ReplicatedTranscriptBuffer per meeting it has served.
+
+    A lookup of a meeting that has a local replica only asks Redis whether
+    the meeting is still live (SISMEMBER) once per `membership_ttl_s`, so a
+    meeting ended by another process may still be returned here for that
+    long.
+    """
+
+    def __init__(
+        self,
+        client: RespClient,
+        prefix: str = DEFAULT_KEY_PREFIX,
+        membership_ttl_s: float = DEFAULT_MEMBERSHIP_TTL_S,
+        **buffer_kwargs: Any,
+    ) -> None:
+        self._client = client
+        self._prefix = prefix
+        self._registry_key = f"{prefix}:meetings"
+        self._buffer_kwargs = buffer_kwargs
+        self._membership_ttl_s = membership_ttl_s
+        self._replicas: dict[str, ReplicatedTranscriptBuffer] = {}
+        # Monotonic time until which each local replica's meeting is taken as live
+        self._live_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _replica(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        with self._lock:
+            replica = self._replicas.get(meeting_id)
+            if replica is None:
+                log = RedisLog(
+                    self._client,
+                    f"{self._prefix}:transcript:{meeting_id}",
+                    self._registry_key,
+                    meeting_id,
+                )
+                replica = ReplicatedTranscriptBuffer(log, **self._buffer_kwargs)
+                self._replicas[meeting_id] = replica
+            # Callers have just confirmed the meeting is live
+            self._live_until[meeting_id] = time.monotonic() + self._membership_ttl_s
+            return replica
+
+    def _forget(self, meeting_id: str) -> ReplicatedTranscriptBuffer | None:
+        with self._lock:
+            self._live_until.pop(meeting_id, None)
+            return self._replicas.pop(meeting_id, None)
+
+    def create(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        self._client.execute("SADD", self._registry_key, meeting_id)
+        return self._replica(meeting_id)
+
+    def __getitem__(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        with self._lock:
+            if self._live_until.get(meeting_id, 0.0) > time.monotonic():
+                return self._replicas[meeting_id]
+        if not self._client.execute("SISMEMBER", self._registry_key, meeting_id):
+            # Ended (possibly by another process): drop any stale local replica
+            replica = self._forget(meeting_id)
+            if replica is not None:
+                replica.detach()
+            raise KeyError(meeting_id)
+        return self._replica(meeting_id)
+
+    def __delitem__(self, meeting_id: str) -> None:
+        if self._forget(meeting_id) is None:
+            raise KeyError(meeting_id)
+
+    def __iter__(self) -> Iterator[str]:
+        members = self._client.execute("SMEMBERS", self._registry_key) or []
+        return iter(sorted(m.decode() for m in members))
+
+    def __len__(self) -> int:
+        return self._client.execute("SCARD", self._registry_key)
+
+    def local_meetings(self) -> list[str]:
+        with self._lock:
+            return list(self._replicas)
+
+    def release(self, meeting_id: str) -> None:
+        replica = self._forget(meeting_id)
+        if replica is not None:
+            replica.detach()
+
+    def close(self) -> None:
+        with self._lock:
+            replicas, self._replicas = self._replicas, {}
+            self._live_until = {}
+        for replica in replicas.values():
+            replica.detach()
+        self._client.close()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import socket
+import ssl
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server."""
+
+
+class RespClient:
+    """
+    Minimal blocking client for the Redis serialization protocol (RESP2).
+
+    Speaks to Redis or anything wire-compatible (Valkey, KeyDB, Azure Cache
+    for Redis, a test stand-in) over one connection serialized by a lock.
+    A failed connection is dropped and re-opened on the next command; the
+    failing command is not retried, since it may already have been applied.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", timeout: float = 5.0) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise ValueError(f"Unsupported Redis URL scheme: {url!r}")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.password = parsed.password
+        self.username = parsed.username
+        self.tls = parsed.scheme == "rediss"
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        if self.tls:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        if self.password:
+            auth = (self.username, self.password) if self.username else (self.password,)
+            self._call("AUTH", *auth)
+        if self.db:
+            self._call("SELECT", self.db)
+
+    def execute(self, *args: Any) -> Any:
+        """Send one command and return its reply (bytes, int, list, None or "OK")."""
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                return self._call(*args)
+            except (OSError, EOFError):
+                self._disconnect()
+                raise
+
+    def _call(self, *args: Any) -> Any:
+        self._sock.sendall(_encode_command(args))
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise EOFError("Connection closed by server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            raise RespError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise EOFError("Connection closed by server")
+            return data[:-2]
+        if prefix == b"*":
+            count = int(body)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise RespError(f"Unexpected reply prefix {prefix!r}")
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+
+def _encode_command(args: tuple[Any, ...]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
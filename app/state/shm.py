@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+from app.state.base import MeetingStore
+from app.transcription.replicated import ReplicatedTranscriptBuffer, SharedLog
+from app.transcription.wal import frame, iter_frames, wal_path
+
+LOG_SUFFIX = ".log"
+
+
+class FileLog(SharedLog):
+    """
+    SharedLog in a file of CRC-framed records (the WAL format). Appends take
+    an exclusive flock so concurrent writers never interleave; readers pread
+    from their cursor and stop at any frame still being written.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fd: int | None = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o600)
+        return self._fd
+
+    def append(self, payload: bytes) -> None:
+        self._write(frame(payload))
+
+    def extend(self, payloads: list[bytes]) -> None:
+        self._write(b"".join(frame(payload) for payload in payloads))
+
+    def _write(self, data: bytes) -> None:
+        with self._lock:
+            fd = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                # One write for a batch, but a large one may be split
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def read(self, cursor: int) -> tuple[list[bytes], int]:
+        with self._lock:
+            if not self.path.exists():
+                return [], cursor
+            fd = self._open()
+            size = os.fstat(fd).st_size
+            if size <= cursor:
+                return [], cursor
+            raw = os.pread(fd, size - cursor, cursor)
+        records = []
+        end = 0
+        for payload, end in iter_frames(raw):
+            records.append(payload)
+        return records, cursor + end
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def delete(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class SharedMemoryStore(MeetingStore):
+    """
+    Meeting state shared by the worker processes of one host.
+
+    Each meeting is a FileLog under `root` (by default a tmpfs directory such
+    as /dev/shm, so the log lives in shared memory); each process keeps a
+    ReplicatedTranscriptBuffer per meeting it has served.
+    """
+
+    def __init__(self, root: str | Path, **buffer_kwargs: Any) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._buffer_kwargs = buffer_kwargs
+        self._replicas: dict[str, ReplicatedTranscriptBuffer] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, meeting_id: str) -> Path:
+        return wal_path(self.root, meeting_id).with_suffix(LOG_SUFFIX)
+
+    def _replica(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        with self._lock:
+            replica = self._replicas.get(meeting_id)
+            if replica is None:
+                log = FileLog(self._path(meeting_id))
+                replica = ReplicatedTranscriptBuffer(log, **self._buffer_kwargs)
+                self._replicas[meeting_id] = replica
+            return replica
+
+    def create(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        self._path(meeting_id).touch()
+        return self._replica(meeting_id)
+
+    def __getitem__(self, meeting_id: str) -> ReplicatedTranscriptBuffer:
+        if not self._path(meeting_id).exists():
+            # Ended (possibly by another process): drop any stale local replica
+            with self._lock:
+                replica = self._replicas.pop(meeting_id, None)
+            if replica is not None:
+                replica.detach()
+            raise KeyError(meeting_id)
+        return self._replica(meeting_id)
+
+    def __delitem__(self, meeting_id: str) -> None:
+        with self._lock:
+            if self._replicas.pop(meeting_id, None) is None:
+                raise KeyError(meeting_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(p.stem for p in self.root.glob(f"*{LOG_SUFFIX}")))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob(f"*{LOG_SUFFIX}"))
+
+    def local_meetings(self) -> list[str]:
+        with self._lock:
+            return list(self._replicas)
+
+    def release(self, meeting_id: str) -> None:
+        with self._lock:
+            replica = self._replicas.pop(meeting_id, None)
+        if replica is not None:
+            replica.detach()
+
+    def close(self) -> None:
+        with self._lock:
+            replicas, self._replicas = self._replicas, {}
+        for replica in replicas.values():
+            replica.detach()
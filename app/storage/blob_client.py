@@ -1,16 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 import logging
 import uuid
 from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Protocol
 
 from azure.storage.blob.aio import BlobServiceClient
-from azure.storage.blob import generate_blob_sas, BlobSasPermissions
+from azure.storage.blob import generate_blob_sas, BlobSasPermissions, ContentSettings
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Staged-block uploads read and PUT one block at a time, so at most
+# block_size * concurrency bytes of a file are held in memory
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_UPLOAD_CONCURRENCY = 2
+
+
+class AsyncReader(Protocol):
+    """Anything with an async read(n), e.g. FastAPI's UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+def _block_id(index: int) -> str:
+    # Block ids must be base64 and all the same length within a blob
+    return base64.b64encode(f"{index:08d}".encode()).decode()
+
+
+async def stage_blocks(
+    blob_client: Any,
+    stream: AsyncReader,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+) -> tuple[list[str], int]:
+    """
+    Read `stream` in `block_size` chunks and stage each as an uncommitted
+    block of `blob_client`, with up to `concurrency` PUTs in flight; a block
+    is only read once a slot is free, so memory stays bounded however large
+    the file is. Returns the block ids in order and the total size; the blob
+    does not exist until the ids are committed.
+    """
+    block_ids: list[str] = []
+    total = 0
+    slots = asyncio.Semaphore(concurrency)
+
+    async def put(block_id: str, data: bytes) -> None:
+        try:
+            await blob_client.stage_block(block_id, data, length=len(data))
+        finally:
+            slots.release()
+
+    async with asyncio.TaskGroup() as tg:
+        while True:
+            await slots.acquire()
+            data = await stream.read(block_size)
+            if not data:
+                slots.release()
+                break
+            block_id = _block_id(len(block_ids))
+            block_ids.append(block_id)
+            total += len(data)
+            tg.create_task(put(block_id, data))
+    return block_ids, total
+
 
 class BlobStore:
     """
@@ -28,6 +84,8 @@ class BlobStore:
         )
         self._container = settings.azure_storage_container_meeting_docs
         self._ttl_days = settings.doc_ttl_days
+        self._block_size = settings.blob_upload_block_size_mb * 1024 * 1024
+        self._upload_concurrency = settings.blob_upload_concurrency
 
     async def initialize(self) -> None:
         """Ensure the container exists."""
@@ -58,15 +116,52 @@ class BlobStore:
         logger.info("Uploaded blob '%s' for meeting '%s'", blob_name, meeting_id)
         return blob_name
 
-    def get_sas_url(self, blob_name: str, expiry_hours: int = 24) -> str:
-        """Generate a SAS URL for reading a blob."""
-        settings = get_settings()
-        # Extract account name and key from connection string
-        parts = dict(
+    async def upload_stream(
+        self,
+        stream: AsyncReader,
+        filename: str,
+        meeting_id: str,
+        content_type: str = "application/octet-stream",
+        blob_id: str | None = None,
+    ) -> tuple[str, int]:
+        """
+        Upload a file from an async stream as staged blocks and return its
+        blob name and size. Unlike upload(), the file is never fully in memory.
+        `blob_id` (default: random) makes the blob name unique within the meeting.
+        """
+        blob_name = f"{meeting_id}/{blob_id or uuid.uuid4().hex}_{filename}"
+        blob_client = self._client.get_blob_client(self._container, blob_name)
+        block_ids, size = await stage_blocks(
+            blob_client, stream, self._block_size, self._upload_concurrency
+        )
+        await blob_client.commit_block_list(
+            block_ids,
+            content_settings=ContentSettings(content_type=content_type),
+            metadata={"meeting_id": meeting_id},
+        )
+        logger.info(
+            "Uploaded blob '%s' (%d bytes, %d blocks) for meeting '%s'",
+            blob_name, size, len(block_ids), meeting_id,
+        )
+        return blob_name, size
+
+    @staticmethod
+    def _connection_parts() -> dict[str, str]:
+        return dict(
             part.split("=", 1)
-            for part in settings.azure_storage_connection_string.split(";")
+            for part in get_settings().azure_storage_connection_string.split(";")
             if "=" in part
         )
+
+    @property
+    def can_sign(self) -> bool:
+        """Whether get_sas_url() works (the connection string has an account key)."""
+        return bool(self._connection_parts().get("AccountKey"))
+
+    def get_sas_url(self, blob_name: str, expiry_hours: int = 24) -> str:
+        """Generate a SAS URL for reading a blob."""
+        # Extract account name and key from connection string
+        parts = self._connection_parts()
         account_name = parts.get("AccountName", "")
         account_key = parts.get("AccountKey", "")
 
@@ -86,6 +181,17 @@ class BlobStore:
         blob = await container_client.download_blob(blob_name)
         return await blob.readall()
 
+    async def download_to_file(self, blob_name: str, file: IO[bytes]) -> int:
+        """Stream blob content into `file` chunk by chunk; return the bytes written."""
+        container_client = self._client.get_container_client(self._container)
+        blob = await container_client.download_blob(blob_name)
+        size = 0
+        async for chunk in blob.chunks():
+            file.write(chunk)
+            size += len(chunk)
+        file.seek(0)
+        return size
+
     async def close(self) -> None:
         await self._client.close()
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+from azure.core import MatchConditions
 from azure.cosmos.aio import CosmosClient
-from azure.cosmos.exceptions import CosmosResourceNotFoundError
+from azure.cosmos.exceptions import (
+    CosmosAccessConditionFailedError,  # noqa: F401  (raised by patch(etag=...))
+    CosmosResourceNotFoundError,
+)
 
 from app.config import get_settings
 
@@ -34,17 +39,40 @@ class CosmosStore:
     async def initialize(self) -> None:
         """Create database and containers if they don't exist."""
         self._db = await self._client.create_database_if_not_exists(id=self._db_name)
-        for name in _ALL_CONTAINERS:
-            await self._db.create_container_if_not_exists(
+        await asyncio.gather(*(
+            self._db.create_container_if_not_exists(
                 id=name,
                 partition_key={"paths": ["/id"], "kind": "Hash"},
             )
+            for name in _ALL_CONTAINERS
+        ))
         logger.info("Cosmos DB initialized (db=%s)", self._db_name)
 
     async def upsert(self, container: str, item: dict[str, Any]) -> dict[str, Any]:
         c = self._db.get_container_client(container)
         return await c.upsert_item(item)
 
+    async def patch(
+        self,
+        container: str,
+        item_id: str,
+        operations: list[dict[str, Any]],
+        etag: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Apply partial-update operations (e.g. {"op": "set", "path": "/a/b", "value": 1})
+        server-side, so concurrent writers to different fields don't overwrite each other.
+        With `etag`, the patch only applies if the item is unchanged since it was read;
+        otherwise CosmosAccessConditionFailedError is raised.
+        """
+        c = self._db.get_container_client(container)
+        conditions: dict[str, Any] = {}
+        if etag is not None:
+            conditions = {"etag": etag, "match_condition": MatchConditions.IfNotModified}
+        return await c.patch_item(
+            item=item_id, partition_key=item_id, patch_operations=operations, **conditions
+        )
+
     async def get(self, container: str, item_id: str) -> dict[str, Any] | None:
         c = self._db.get_container_client(container)
         try:
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.models.session import TranscriptEntry
+
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # optional speed-up: pip install "meetingbot[fast]"
+    _loads = json.loads
+
+NDJSON_CONTENT_TYPES = frozenset({"application/x-ndjson", "application/ndjson"})
+
+# Validates a whole batch in one call instead of a model per line
+_ENTRIES = TypeAdapter(list[TranscriptEntry])
+
+
+class BulkFormatError(ValueError):
+    """A bulk transcript payload that is not valid NDJSON or columnar JSON."""
+
+
+class _Columns(BaseModel):
+    speakers: list[str]
+    speaker: list[int]
+    text: list[str]
+    language: str | list[str] = "en-US"
+    timestamp: list[datetime] | None = None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _describe(exc: ValidationError, row: Callable[[int], str]) -> str:
+    error = exc.errors(include_url=False)[0]
+    loc = list(error["loc"])
+    where = row(loc.pop(0)) if loc and isinstance(loc[0], int) else "payload"
+    field = ".".join(str(part) for part in loc)
+    return f"{where}: {field + ': ' if field else ''}{error['msg']}"
+
+
+def _validate(records: list[Any], row: Callable[[int], str]) -> list[TranscriptEntry]:
+    # Rows without a timestamp share the time of the call (cheaper than the default factory)
+    now = _now()
+    for record in records:
+        if type(record) is dict and record.get("timestamp") is None:
+            record["timestamp"] = now
+    try:
+        return _ENTRIES.validate_python(records)
+    except ValidationError as exc:
+        raise BulkFormatError(_describe(exc, row)) from None
+
+
+def parse_ndjson(body: bytes) -> list[TranscriptEntry]:
+    """
+    Parse newline-delimited `{"speaker", "text", "language"?, "timestamp"?}`
+    objects into entries.
+
+    All lines are decoded in one JSON call (joined into an array) and
+    validated in one batch; lines are only decoded one by one to locate a
+    syntax error.
+    """
+    numbered = [(n, line) for n, line in enumerate(body.splitlines(), 1) if line.strip()]
+    try:
+        records = _loads(b"[" + b",".join(line for _, line in numbered) + b"]")
+    except ValueError:
+        records = None
+    if records is None or len(records) != len(numbered):
+        for n, line in numbered:
+            try:
+                _loads(line)
+            except ValueError as exc:
+                raise BulkFormatError(f"line {n}: invalid JSON ({exc})") from None
+        raise BulkFormatError("invalid NDJSON")
+    return _validate(records, lambda i: f"line {numbered[i][0]}")
+
+
+def parse_columnar(body: bytes) -> list[TranscriptEntry]:
+    """
+    Parse a columnar payload into entries:
+
+        {"speakers": ["Aisyah", "Ben"],     # speaker names, referenced by index
+         "speaker": [0, 1, 0],              # one index per row
+         "text": ["...", "...", "..."],
+         "language": "ms-MY",               # optional: one value, or one per row
+         "timestamp": ["2025-01-01T09:00:00Z", ...]}  # optional, one per row
+
+    Speaker names are sent once rather than per line, so large transcripts
+    are much smaller than the equivalent NDJSON.
+    """
+    try:
+        columns = _Columns.model_validate_json(body)
+    except ValidationError as exc:
+        raise BulkFormatError(_describe(exc, lambda i: f"row {i}")) from None
+    rows = len(columns.text)
+    languages = columns.language
+    if isinstance(languages, str):
+        languages = [languages] * rows
+    timestamps = columns.timestamp or [None] * rows
+    for name, values in (
+        ("speaker", columns.speaker), ("language", languages), ("timestamp", timestamps)
+    ):
+        if len(values) != rows:
+            raise BulkFormatError(f"'{name}' has {len(values)} values for {rows} rows")
+    speakers = columns.speakers
+    if any(not 0 <= i < len(speakers) for i in columns.speaker):
+        raise BulkFormatError("'speaker' values must be indexes into 'speakers'")
+
+    records = [
+        {"speaker": speakers[s], "text": text, "language": language, "timestamp": ts}
+        for s, text, language, ts in zip(columns.speaker, columns.text, languages, timestamps)
+    ]
+    return _validate(records, lambda i: f"row {i}")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from app.models.session import TranscriptEntry
+
+_EPOCH = datetime(1970, 1, 1)
+_HEADER = struct.Struct("<II")  # entry count, text byte length
+
+
+def to_epoch_us(ts: datetime) -> int:
+    """Convert a (naive UTC or aware) datetime to integer microseconds since the epoch."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = ts - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_epoch_us(us: int) -> datetime:
+    """Inverse of to_epoch_us(); returns a naive UTC datetime like TranscriptEntry's default."""
+    return _EPOCH + timedelta(microseconds=us)
+
+
+class StringTable:
+    """Interns repeated strings (speakers, languages) as small integer ids."""
+
+    __slots__ = ("values", "_ids")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.values.append(value)
+            self._ids[value] = idx
+        return idx
+
+    def get(self, value: str) -> int | None:
+        return self._ids.get(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class EntryColumns:
+    """
+    Columnar storage for a run of transcript entries.
+
+    Speaker and language are ids into buffer-level StringTables, timestamps
+    are int64 epoch microseconds, and all texts share one UTF-8 bytearray
+    addressed by cumulative end offsets. TranscriptEntry objects are only
+    built on demand by entry()/entries().
+    """
+
+    __slots__ = ("speakers", "languages", "timestamps", "text_ends", "text")
+
+    def __init__(self) -> None:
+        self.speakers = array("I")
+        self.languages = array("H")
+        self.timestamps = array("q")
+        self.text_ends = array("I")
+        self.text = bytearray()
+
+    def append(self, speaker_id: int, language_id: int, ts_us: int, text: str) -> None:
+        self.speakers.append(speaker_id)
+        self.languages.append(language_id)
+        self.timestamps.append(ts_us)
+        self.text += text.encode()
+        self.text_ends.append(len(self.text))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def nbytes(self) -> int:
+        n = len(self.timestamps)
+        return n * (4 + 2 + 8 + 4) + len(self.text)
+
+    def text_at(self, i: int) -> str:
+        start = self.text_ends[i - 1] if i else 0
+        return self.text[start:self.text_ends[i]].decode()
+
+    def entry(self, i: int, speakers: StringTable, languages: StringTable) -> TranscriptEntry:
+        # model_construct skips validation: every field was validated on the way in
+        return TranscriptEntry.model_construct(
+            speaker=speakers.values[self.speakers[i]],
+            text=self.text_at(i),
+            language=languages.values[self.languages[i]],
+            timestamp=from_epoch_us(self.timestamps[i]),
+        )
+
+    def entries(
+        self,
+        start: int,
+        stop: int,
+        speakers: StringTable,
+        languages: StringTable,
+    ) -> list[TranscriptEntry]:
+        return [self.entry(i, speakers, languages) for i in range(start, min(stop, len(self)))]
+
+    def lines(self, start: int, stop: int, speakers: StringTable) -> list[str]:
+        """
+        Render entries [start, stop) as render_line() would, without building
+        entries. Timestamps are stored as UTC, so times render in UTC.
+        """
+        names = speakers.values
+        ends = self.text_ends
+        text = self.text
+        out = []
+        prev = ends[start - 1] if start else 0
+        for i in range(start, min(stop, len(self))):
+            end = ends[i]
+            seconds = self.timestamps[i] // 1_000_000 % 86_400
+            hours, rest = divmod(seconds, 3600)
+            minutes, seconds = divmod(rest, 60)
+            out.append(
+                f"[{hours:02d}:{minutes:02d}:{seconds:02d}] {names[self.speakers[i]]}: "
+                f"{text[prev:end].decode()}"
+            )
+            prev = end
+        return out
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact binary blob (native byte order: process-local spill only)."""
+        return b"".join((
+            _HEADER.pack(len(self), len(self.text)),
+            self.speakers.tobytes(),
+            self.languages.tobytes(),
+            self.timestamps.tobytes(),
+            self.text_ends.tobytes(),
+            bytes(self.text),
+        ))
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> EntryColumns:
+        count, text_len = _HEADER.unpack_from(raw)
+        cols = cls()
+        pos = _HEADER.size
+        for column in (cols.speakers, cols.languages, cols.timestamps, cols.text_ends):
+            size = count * column.itemsize
+            column.frombytes(raw[pos:pos + size])
+            pos += size
+        cols.text = bytearray(raw[pos:pos + text_len])
+        return cols
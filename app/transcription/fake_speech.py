@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Callable, Sequence
+
+from app.models.session import TranscriptEntry
+
+# 16 kHz, 16-bit, mono PCM: one second of audio
+BYTES_PER_SECOND = 32_000
+
+
+class FakeRecognizer:
+    """
+    Drop-in stand-in for SpeechClient that needs no Azure Speech resource.
+
+    Every `bytes_per_result` bytes of pushed audio "recognize" the next entry
+    of `script`, or a numbered placeholder utterance by `speaker_name` when
+    no script is given, so tests (and local load runs with
+    SPEECH_RECOGNIZER=fake) get deterministic results from any audio.
+    Like SpeechClient, it calls `on_result(entry, audio_end_s)` if set.
+    """
+
+    def __init__(
+        self,
+        speaker_name: str = "Unknown",
+        script: Sequence[TranscriptEntry] | None = None,
+        bytes_per_result: int = BYTES_PER_SECOND,
+    ) -> None:
+        self.speaker_name = speaker_name
+        self.bytes_per_result = bytes_per_result
+        self.bytes_received = 0
+        self._script = list(script) if script is not None else None
+        self._emitted = 0
+        self._queue: asyncio.Queue[TranscriptEntry | None] = asyncio.Queue()
+        self.on_result: Callable[[TranscriptEntry, float], None] | None = None
+
+    def _next(self) -> TranscriptEntry | None:
+        if self._script is None:
+            return TranscriptEntry(
+                speaker=self.speaker_name, text=f"utterance {self._emitted + 1}"
+            )
+        if self._emitted < len(self._script):
+            return self._script[self._emitted]
+        return None
+
+    def push_audio(self, audio_bytes: bytes) -> None:
+        """Count pushed audio; call from the event loop the stream is consumed on."""
+        before = self.bytes_received // self.bytes_per_result
+        self.bytes_received += len(audio_bytes)
+        for boundary in range(before + 1, self.bytes_received // self.bytes_per_result + 1):
+            entry = self._next()
+            if entry is None:
+                return
+            self._emitted += 1
+            if self.on_result is not None:
+                self.on_result(entry, boundary * self.bytes_per_result / BYTES_PER_SECOND)
+            self._queue.put_nowait(entry)
+
+    async def stream(self) -> AsyncGenerator[TranscriptEntry, None]:
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+            yield entry
+
+    async def stop(self) -> None:
+        self._queue.put_nowait(None)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import deque
+from typing import Sequence
+
+from app.models.session import TranscriptEntry
+
+# Events held per subscriber before the oldest are dropped
+DEFAULT_SUBSCRIBER_QUEUE = 256
+
+
+class TranscriptEvent:
+    """
+    One appended entry as delivered to subscribers.
+
+    The same instance is shared by every subscriber and its JSON form is
+    built at most once, so fan-out to hundreds of viewers serializes each
+    utterance a single time.
+    """
+
+    __slots__ = ("seq", "entry", "_json")
+
+    def __init__(self, seq: int, entry: TranscriptEntry) -> None:
+        self.seq = seq
+        self.entry = entry
+        self._json: str | None = None
+
+    def json(self) -> str:
+        if self._json is None:
+            self._json = json.dumps({"seq": self.seq, **self.entry.model_dump(mode="json")})
+        return self._json
+
+
+class Subscription:
+    """
+    A subscriber's bounded event queue.
+
+    publish() never blocks: when the queue is full the oldest event is
+    dropped and counted, and the consumer is expected to backfill the gap
+    from the buffer (see TranscriptBuffer.since) rather than slow ingestion.
+    """
+
+    def __init__(self, fanout: TranscriptFanout, maxsize: int) -> None:
+        self._fanout = fanout
+        self._queue: deque[TranscriptEvent] = deque(maxlen=maxsize)
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self.closed = False
+
+    def _push(self, event: TranscriptEvent) -> None:
+        """Queue an event without waking the consumer (see TranscriptFanout.wake)."""
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self._dropped += 1
+            self._queue.append(event)
+
+    def _wake(self) -> None:
+        """Wake the consumer; raises RuntimeError if its event loop is closed."""
+        if threading.get_ident() == self._loop_thread:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def get(self, timeout: float | None = None) -> tuple[list[TranscriptEvent], int]:
+        """
+        Wait for events and return (events, dropped) — everything queued so
+        far, oldest first, plus how many events were dropped since the last
+        call. Returns ([], 0) on timeout or once the subscription is closed.
+        """
+        if not self._queue and not self.closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        with self._lock:
+            self._wakeup.clear()
+            events = list(self._queue)
+            self._queue.clear()
+            dropped, self._dropped = self._dropped, 0
+        return events, dropped
+
+    def close(self) -> None:
+        self.closed = True
+        self._fanout._remove(self)
+        self._wake()
+
+
+class TranscriptFanout:
+    """
+    Delivers each appended entry to every live Subscription of one buffer.
+
+    Publishing is split in two so the buffer can keep its lock short:
+    publish() queues events (under the buffer lock, to keep seq order) and
+    returns the subscribers to notify, and wake() notifies them once the
+    lock is released. Subscribers whose event loop has closed are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: list[Subscription] = []
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, maxsize: int = DEFAULT_SUBSCRIBER_QUEUE) -> Subscription:
+        """Create a subscription; must be called from the consumer's event loop."""
+        sub = Subscription(self, maxsize)
+        with self._lock:
+            # Copy-on-write so publish() can iterate without holding the lock
+            self._subscribers = [*self._subscribers, sub]
+        return sub
+
+    def _remove(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not sub]
+
+    def publish(self, seq: int, entry: TranscriptEntry) -> list[Subscription]:
+        """Queue one entry for every subscriber; return the subscribers to wake()."""
+        return self.publish_many(seq, [entry])
+
+    def publish_many(
+        self, first_seq: int, entries: Sequence[TranscriptEntry]
+    ) -> list[Subscription]:
+        """Queue consecutive entries for every subscriber; return the subscribers to wake()."""
+        subscribers = self._subscribers
+        for seq, entry in enumerate(entries, start=first_seq):
+            event = TranscriptEvent(seq, entry)
+            for sub in subscribers:
+                sub._push(event)
+        return subscribers
+
+    def wake(self, subscribers: Sequence[Subscription]) -> None:
+        """Wake subscribers returned by publish(); call without holding the buffer lock."""
+        for sub in subscribers:
+            try:
+                sub._wake()
+            except RuntimeError:
+                # The subscriber's event loop is closed: nobody will read this queue
+                sub.closed = True
+                self._remove(sub)
+
+    def close(self) -> None:
+        """Close every subscription (e.g. the meeting ended)."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for sub in subscribers:
+            sub.closed = True
+        self.wake(subscribers)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import sys
+from array import array
+from typing import Callable, Iterable
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# English and Malay function words, plus Manglish discourse particles that
+# carry tone rather than content ("siap dah lah", "betul kan?"). Negations
+# ("no", "not", "tak", "tidak") are kept: dropping them turns "not approved"
+# into "approved". So is "one", which is also a number.
+STOPWORDS: frozenset[str] = frozenset(
+    """
+    a an and are as at be been but by can could did do does for from had has have he her him
+    his i if in into is it its just me my of on or our she so that the their them then
+    there they this to too up us was we were what when where which who will with would you your
+    ada adalah akan aku apa atau bagi bahawa boleh dah dalam dan dari dengan di dia ini itu juga
+    kami kamu kat ke kita mana mereka nak pada saja saya sebab sudah tapi telah
+    untuk yang
+    ah ahh aiyo aiyoh alamak eh ha haa hor kan la lah leh lor mah meh nah oh ok okay
+    sia wei wor ya yah yeah
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercase word tokens for English / Malay / Manglish text, minus stopwords.
+
+    Hyphenated Malay reduplication ("kanak-kanak") splits into its parts, and
+    single characters are dropped.
+    """
+    return [t for t in _TOKEN_RE.findall(text.casefold()) if len(t) > 1 and t not in STOPWORDS]
+
+
+# term -> (positions, term frequencies)
+Postings = dict[str, tuple[array, array]]
+
+
+def term_counts(text: str) -> dict[str, int]:
+    """Term frequencies of `text` after tokenize()."""
+    # A plain dict is much cheaper than Counter for a handful of terms
+    counts: dict[str, int] = {}
+    for term in tokenize(text):
+        counts[term] = counts.get(term, 0) + 1
+    return counts
+
+
+def build_postings(
+    texts: Iterable[str], first_position: int, terms: set[str] | None = None
+) -> Postings:
+    """Index consecutive documents starting at `first_position`, optionally only `terms`."""
+    postings: Postings = {}
+    for position, text in enumerate(texts, start=first_position):
+        for term, tf in term_counts(text).items():
+            if terms is not None and term not in terms:
+                continue
+            entry = postings.get(term)
+            if entry is None:
+                entry = postings[term] = (array("I"), array("H"))
+            entry[0].append(position)
+            entry[1].append(min(tf, 0xFFFF))
+    return postings
+
+
+def postings_nbytes(postings: Postings) -> int:
+    """Approximate memory held by a postings dict, including its keys and arrays."""
+    return sys.getsizeof(postings) + sum(
+        sys.getsizeof(term) + sys.getsizeof(entry)
+        + sys.getsizeof(entry[0]) + sys.getsizeof(entry[1])
+        for term, entry in postings.items()
+    )
+
+
+class KeywordIndex:
+    """
+    Incrementally updated inverted index with BM25 scoring.
+
+    Documents are identified by their buffer position (0-based, dense, added
+    in order). Each term maps to parallel arrays of positions and term
+    frequencies, so adding a document costs O(distinct terms) and a search
+    touches only the postings of the query terms.
+
+    Postings are kept per segment: add() indexes into the open segment and
+    seal() hands its postings to the caller, which stores (and may spill or
+    drop) them alongside the segment's entries and passes them back to
+    search(). The index itself keeps only the corpus statistics BM25 needs:
+    document frequency per term and document lengths. Not thread-safe on its
+    own; TranscriptBuffer calls it under its lock.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Postings = {}
+        self._df: dict[str, int] = {}
+        self._doc_lengths = array("I")
+        self._total_length = 0
+
+    def add(self, text: str) -> None:
+        """Index the next document (its position is the current document count)."""
+        position = len(self._doc_lengths)
+        counts = term_counts(text)
+        length = sum(counts.values())
+        self._doc_lengths.append(length)
+        self._total_length += length
+        df = self._df
+        for term, tf in counts.items():
+            df[term] = df.get(term, 0) + 1
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("H"))
+            postings[0].append(position)
+            postings[1].append(min(tf, 0xFFFF))
+
+    def seal(self) -> Postings:
+        """Return the postings added since the last seal() and start a new segment."""
+        postings, self._postings = self._postings, {}
+        return postings
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        sealed: Callable[[set[str]], Iterable[Postings]] | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Return up to `top_k` (position, score) pairs, best first.
+
+        `sealed` is called with the query terms and yields the postings of
+        the segments sealed so far (only those terms are looked up, so a
+        segment can be re-indexed for just them).
+        """
+        n_docs = len(self._doc_lengths)
+        if n_docs == 0 or top_k <= 0:
+            return []
+        terms = {term for term in tokenize(query) if term in self._df}
+        if not terms:
+            return []
+        avg_len = self._total_length / n_docs or 1.0
+        lengths = self._doc_lengths
+        idf = {
+            term: math.log(1 + (n_docs - self._df[term] + 0.5) / (self._df[term] + 0.5))
+            for term in terms
+        }
+        segments = list(sealed(terms)) if sealed is not None else []
+        segments.append(self._postings)
+        scores: dict[int, float] = {}
+        for postings in segments:
+            for term in terms:
+                entry = postings.get(term)
+                if entry is None:
+                    continue
+                weight = idf[term]
+                for pos, tf in zip(*entry):
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[pos] / avg_len)
+                    scores[pos] = scores.get(pos, 0.0) + weight * tf * (BM25_K1 + 1) / (tf + norm)
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], item[0]))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held here: open-segment postings and BM25 statistics."""
+        return (
+            postings_nbytes(self._postings)
+            + sys.getsizeof(self._df)
+            + sum(sys.getsizeof(term) for term in self._df)
+            + self._doc_lengths.itemsize * len(self._doc_lengths)
+        )
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Protocol
+
+from app.config import get_settings
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ACTIVE = 8
+DEFAULT_MAX_QUEUED = 16
+DEFAULT_QUEUE_TIMEOUT_S = 30.0
+# How long to wait for a recognizer to flush its last results once audio ends
+DEFAULT_DRAIN_TIMEOUT_S = 5.0
+
+
+class Recognizer(Protocol):
+    """What the pool needs from a recognizer (SpeechClient, FakeRecognizer)."""
+
+    # Called with each entry and where its utterance ended in the audio (replay timing)
+    on_result: Callable[[TranscriptEntry, float], None] | None
+
+    def push_audio(self, audio_bytes: bytes) -> None: ...
+
+    def stream(self) -> AsyncIterator[TranscriptEntry]: ...
+
+    async def stop(self) -> None: ...
+
+
+class PoolExhausted(Exception):
+    """No recognizer became free: the wait queue was full or the wait timed out."""
+
+
+class AudioSession:
+    """One audio stream being recognized into a meeting's buffer."""
+
+    def __init__(self, meeting_id: str, speaker: str, recognizer: Recognizer) -> None:
+        self.meeting_id = meeting_id
+        self.speaker = speaker
+        self.recognizer = recognizer
+        self.bytes_received = 0
+        self.entries = 0
+
+    def push(self, audio: bytes) -> None:
+        self.bytes_received += len(audio)
+        self.recognizer.push_audio(audio)
+
+
+class RecognizerPool:
+    """
+    Caps the speech recognizers this worker runs at once.
+
+    Each audio stream gets its own recognizer from `factory(speaker)` for as
+    long as its session() is open; recognized utterances are appended to the
+    meeting's buffer as they arrive. When `max_active` recognizers are busy,
+    new sessions wait in FIFO order (up to `max_queued` of them, for at most
+    `queue_timeout_s`) and PoolExhausted is raised beyond that. Single event
+    loop only.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], Recognizer],
+        max_active: int = DEFAULT_MAX_ACTIVE,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        queue_timeout_s: float = DEFAULT_QUEUE_TIMEOUT_S,
+        drain_timeout_s: float = DEFAULT_DRAIN_TIMEOUT_S,
+    ) -> None:
+        self.factory = factory
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.queue_timeout_s = queue_timeout_s
+        self.drain_timeout_s = drain_timeout_s
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.sessions = 0
+        self.rejected = 0
+
+    async def _acquire(self, on_queued: Callable[[int], Any] | None) -> None:
+        if self._active < self.max_active and not self._waiters:
+            self._active += 1
+            return
+        if len(self._waiters) >= self.max_queued:
+            self.rejected += 1
+            raise PoolExhausted(f"{self._active} recognizers busy, {len(self._waiters)} queued")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            if on_queued is not None:
+                await on_queued(len(self._waiters))
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout_s)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # Handed a slot just as we gave up: pass it on
+                self._release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                self.rejected += 1
+                raise PoolExhausted(
+                    f"no recognizer free after {self.queue_timeout_s:.0f} s"
+                ) from None
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot straight to the next waiter, if any
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def session(
+        self,
+        meeting_id: str,
+        buffer: TranscriptBuffer,
+        speaker: str = "Unknown",
+        on_queued: Callable[[int], Any] | None = None,
+    ) -> AsyncIterator[AudioSession]:
+        """
+        Recognize one audio stream into `buffer` until the block exits.
+        `on_queued(position)` is awaited if the session has to wait for a slot.
+        """
+        await self._acquire(on_queued)
+        try:
+            session = AudioSession(meeting_id, speaker, self.factory(speaker))
+            self.sessions += 1
+            with buffer.hold():
+                pump = asyncio.create_task(self._pump(session, buffer))
+                try:
+                    yield session
+                finally:
+                    await session.recognizer.stop()
+                    try:
+                        await asyncio.wait_for(pump, self.drain_timeout_s)
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            "Recognizer for meeting '%s' did not drain in time", meeting_id
+                        )
+        finally:
+            self._release()
+
+    async def _pump(self, session: AudioSession, buffer: TranscriptBuffer) -> None:
+        try:
+            async for entry in session.recognizer.stream():
+                # Off the loop: a replicated buffer appends over the network
+                await asyncio.to_thread(buffer.append, entry)
+                session.entries += 1
+        except Exception:
+            logger.exception("Recognizer for meeting '%s' failed", session.meeting_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "active": self._active,
+            "queued": len(self._waiters),
+            "max_active": self.max_active,
+            "sessions": self.sessions,
+            "rejected": self.rejected,
+        }
+
+
+def _recognizer_factory(kind: str) -> Callable[[str], Recognizer]:
+    if kind == "fake":
+        from app.transcription.fake_speech import FakeRecognizer
+
+        return lambda speaker: FakeRecognizer(speaker_name=speaker)
+    if kind == "azure":
+        from app.transcription.speech_client import SpeechClient
+
+        return lambda speaker: SpeechClient(speaker_name=speaker)
+    raise ValueError(f"Unknown SPEECH_RECOGNIZER: {kind!r}")
+
+
+_pool: RecognizerPool | None = None
+
+
+def get_recognizer_pool() -> RecognizerPool:
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = RecognizerPool(
+            _recognizer_factory(settings.speech_recognizer),
+            max_active=settings.speech_max_recognizers,
+            max_queued=settings.speech_max_queued,
+            queue_timeout_s=settings.speech_queue_timeout_s,
+        )
+    return _pool
+
+
+def recognizer_stats() -> dict[str, Any] | None:
+    """The pool's counters, or None if no audio has been streamed to this worker yet."""
+    return _pool.stats() if _pool is not None else None
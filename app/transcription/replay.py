@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import time
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.models.session import TranscriptEntry
+from app.transcription.fake_speech import BYTES_PER_SECOND
+from app.transcription.recognizer_pool import DEFAULT_DRAIN_TIMEOUT_S, Recognizer
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.vad import SAMPLE_RATE, VoiceActivityGate
+
+logger = logging.getLogger(__name__)
+
+# Audio is pushed in blocks of this size, as by the microphone callback in
+# scripts/local_meeting.py
+DEFAULT_CHUNK_MS = 100
+
+
+def load_audio(path: str | Path) -> np.ndarray:
+    """
+    Read a recording as 16 kHz mono int16 samples: a .wav file in that
+    format, or headerless little-endian PCM (.pcm / .raw).
+    """
+    path = Path(path)
+    if path.suffix.lower() != ".wav":
+        return np.fromfile(path, dtype="<i2")
+    with wave.open(str(path), "rb") as wav:
+        if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (SAMPLE_RATE, 1, 2):
+            raise ValueError(f"{path}: expected 16 kHz mono 16-bit PCM")
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+
+
+@dataclass
+class UtteranceTiming:
+    text: str
+    # Where the utterance ended in the audio pushed to the recognizer
+    audio_end_s: float
+    # From pushing the utterance's last audio to the recognizer enqueuing its entry
+    recognized_ms: float
+    # From pushing the utterance's last audio to the entry being in the buffer
+    buffered_ms: float
+
+
+@dataclass
+class ReplayReport:
+    audio_s: float
+    wall_s: float
+    bytes_in: int
+    bytes_pushed: int
+    utterances: list[UtteranceTiming] = field(default_factory=list)
+
+    @staticmethod
+    def _percentiles(values: list[float]) -> dict[str, float]:
+        if not values:
+            return {}
+        p50, p95 = np.percentile(values, [50, 95])
+        return {
+            "p50": round(float(p50), 2),
+            "p95": round(float(p95), 2),
+            "max": round(max(values), 2),
+        }
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "audio_s": round(self.audio_s, 2),
+            "wall_s": round(self.wall_s, 2),
+            "speed": round(self.audio_s / self.wall_s, 1) if self.wall_s else None,
+            "bytes_in": self.bytes_in,
+            "bytes_pushed": self.bytes_pushed,
+            "utterances": len(self.utterances),
+            "recognized_ms": self._percentiles([u.recognized_ms for u in self.utterances]),
+            "buffered_ms": self._percentiles([u.buffered_ms for u in self.utterances]),
+        }
+
+
+async def replay(
+    audio: np.ndarray,
+    recognizer: Recognizer,
+    buffer: TranscriptBuffer | None = None,
+    speed: float = 1.0,
+    chunk_ms: int = DEFAULT_CHUNK_MS,
+    vad: VoiceActivityGate | None = None,
+    drain_timeout_s: float = DEFAULT_DRAIN_TIMEOUT_S,
+) -> ReplayReport:
+    """
+    Stream a recording through `recognizer.push_audio()` and time each result.
+
+    Audio is pushed in `chunk_ms` blocks paced at `speed` times real time
+    (0 = as fast as possible), through `vad` if given, while recognized
+    entries are appended to `buffer`. Per utterance, the report has the
+    latency from pushing its last audio to the recognizer enqueuing the
+    entry (via the recognizer's `on_result` hook) and to the entry being
+    appended to the buffer.
+    """
+    buffer = buffer if buffer is not None else TranscriptBuffer()
+    chunk = SAMPLE_RATE * chunk_ms // 1000
+    # Pushed byte count after each push, and when that push started
+    pushed_bytes: list[int] = []
+    pushed_at: list[float] = []
+    results: list[tuple[TranscriptEntry, float, float]] = []
+    buffered_at: list[float] = []
+
+    def on_result(entry: TranscriptEntry, audio_end_s: float) -> None:
+        # May run on a recognizer thread; list.append is atomic
+        results.append((entry, audio_end_s, time.perf_counter()))
+
+    async def consume() -> None:
+        async for entry in recognizer.stream():
+            buffer.append(entry)
+            buffered_at.append(time.perf_counter())
+
+    recognizer.on_result = on_result
+    consumer = asyncio.create_task(consume())
+    total = 0
+    start = time.perf_counter()
+    for n, offset in enumerate(range(0, audio.size, chunk)):
+        if speed > 0:
+            delay = start + n * chunk_ms / 1000 / speed - time.perf_counter()
+            await asyncio.sleep(max(0.0, delay))
+        else:
+            await asyncio.sleep(0)  # let the consumer run
+        block = audio[offset:offset + chunk]
+        data = vad.process(block) if vad is not None else block.tobytes()
+        if not data:
+            continue
+        pushed_at.append(time.perf_counter())
+        total += len(data)
+        pushed_bytes.append(total)
+        recognizer.push_audio(data)
+
+    close_audio = getattr(recognizer, "close_audio", None)
+    if close_audio is not None:
+        # A real recognizer ends its stream once the last results are flushed
+        close_audio()
+    else:
+        await recognizer.stop()
+    try:
+        await asyncio.wait_for(consumer, drain_timeout_s)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Recognizer did not finish within %.0f s of the end of audio", drain_timeout_s
+        )
+    wall_s = time.perf_counter() - start
+
+    report = ReplayReport(
+        audio_s=audio.size / SAMPLE_RATE,
+        wall_s=wall_s,
+        bytes_in=audio.nbytes,
+        bytes_pushed=total,
+    )
+    for (entry, audio_end_s, recognized), buffered in zip(results, buffered_at):
+        # The push that carried the utterance's last byte
+        i = bisect.bisect_left(pushed_bytes, int(audio_end_s * BYTES_PER_SECOND))
+        pushed = pushed_at[min(i, len(pushed_at) - 1)]
+        report.utterances.append(UtteranceTiming(
+            text=entry.text,
+            audio_end_s=audio_end_s,
+            recognized_ms=(recognized - pushed) * 1000,
+            buffered_ms=(buffered - pushed) * 1000,
+        ))
+    return report
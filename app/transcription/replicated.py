@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from typing import Any, Callable, Sequence
+
+from app.models.session import TranscriptEntry
+from app.transcription.fanout import DEFAULT_SUBSCRIBER_QUEUE, Subscription
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.wal import RECORD_CLEAR, decode_record, encode_record
+
+# How often a replica with live subscribers polls the shared log for other processes' appends
+DEFAULT_POLL_INTERVAL_S = 0.05
+
+
+class SharedLog:
+    """
+    Append-only record log shared by every process serving a meeting.
+
+    Records are encode_record() payloads. Implementations must make append()
+    atomic and give all readers the same record order; `cursor` is an opaque
+    position (byte offset, list index, ...) that read() advances.
+    """
+
+    def append(self, payload: bytes) -> None:
+        raise NotImplementedError
+
+    def extend(self, payloads: list[bytes]) -> None:
+        """Append several records; implementations may write them as one atomic batch."""
+        for payload in payloads:
+            self.append(payload)
+
+    def read(self, cursor: int) -> tuple[list[bytes], int]:
+        """Return the records after `cursor` and the cursor to resume from."""
+        raise NotImplementedError
+
+    def exists(self) -> bool:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release this process's handles on the log."""
+
+    def delete(self) -> None:
+        """Remove the log for every process."""
+        raise NotImplementedError
+
+
+def _synced(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: ReplicatedTranscriptBuffer, *args, **kwargs):
+        self.sync()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class ReplicatedTranscriptBuffer(TranscriptBuffer):
+    """
+    A TranscriptBuffer whose source of truth is a SharedLog.
+
+    Writes go to the log; this process's buffer is a local replica that
+    catches up with sync() before every read, so every worker serving the
+    meeting sees the same entries with the same sequence numbers and gets
+    the local buffer's indexes and caches for free. While it has live
+    subscribers the replica also polls the log in the background so entries
+    appended by other processes are fanned out promptly.
+
+    Reads and writes therefore do network or file I/O: async code calls
+    them through asyncio.to_thread() rather than on the event loop.
+
+    snapshot_and_clear() is not atomic across processes: an entry another
+    process appends between the snapshot and the clear is discarded.
+    """
+
+    def __init__(
+        self,
+        log: SharedLog,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._log = log
+        self._cursor = 0
+        self._sync_lock = threading.RLock()
+        self._poll_interval_s = poll_interval_s
+        self._poller: asyncio.Task | None = None
+        self.sync()
+
+    def sync(self) -> int:
+        """Apply records appended to the shared log since the last sync; return how many."""
+        with self._sync_lock:
+            records, self._cursor = self._log.read(self._cursor)
+            subscribers = {}
+            for payload in records:
+                kind, entry = decode_record(payload)
+                with self._lock:
+                    if kind == RECORD_CLEAR:
+                        self._reset()
+                        continue
+                    sealed = self._append_locked(entry)
+                    if self._fanout:
+                        seq = self._base_seq + self._count - 1
+                        subscribers.update(dict.fromkeys(self._fanout.publish(seq, entry)))
+                if sealed is not None:
+                    self._budget.charge(self, sealed)
+            if subscribers:
+                self._fanout.wake(list(subscribers))
+            return len(records)
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def append(self, entry: TranscriptEntry) -> None:
+        self._log.append(encode_record(entry))
+        self.sync()
+
+    def extend(self, entries: Sequence[TranscriptEntry]) -> int:
+        if entries:
+            self._log.extend([encode_record(entry) for entry in entries])
+        self.sync()
+        return self.last_seq
+
+    def clear(self) -> None:
+        self._log.append(encode_record(None))
+        self.sync()
+
+    def snapshot_and_clear(self) -> list[TranscriptEntry]:
+        with self._sync_lock:
+            self.sync()
+            entries = super().snapshot()
+            self._log.append(encode_record(None))
+        self.sync()
+        return entries
+
+    def subscribe(self, maxsize: int = DEFAULT_SUBSCRIBER_QUEUE) -> Subscription:
+        sub = super().subscribe(maxsize)
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self._poll())
+        return sub
+
+    async def _poll(self) -> None:
+        while self._fanout:
+            if not await asyncio.to_thread(self._log.exists):
+                # The meeting was ended by another process
+                self._fanout.close()
+                return
+            await asyncio.to_thread(self.sync)
+            await asyncio.sleep(self._poll_interval_s)
+
+    # The shared log outlives this replica
+    durable = True
+
+    def detach(self) -> None:
+        """Release this process's replica, leaving the shared log in place."""
+        super().close()
+        self._log.close()
+
+    def close(self) -> None:
+        """Discard the meeting's transcript everywhere (deletes the shared log)."""
+        super().close()
+        self._log.delete()
+
+    # ── Reads (catch up with other processes first) ──────────────────────────
+
+    snapshot = _synced(TranscriptBuffer.snapshot)
+    last_n = _synced(TranscriptBuffer.last_n)
+    last_n_text = _synced(TranscriptBuffer.last_n_text)
+    last_tokens = _synced(TranscriptBuffer.last_tokens)
+    last_tokens_text = _synced(TranscriptBuffer.last_tokens_text)
+    since = _synced(TranscriptBuffer.since)
+    query = _synced(TranscriptBuffer.query)
+    search = _synced(TranscriptBuffer.search)
+    range = _synced(TranscriptBuffer.range)
+    by_speaker = _synced(TranscriptBuffer.by_speaker)
+    to_text = _synced(TranscriptBuffer.to_text)
+    __len__ = _synced(TranscriptBuffer.__len__)
+
+    @property
+    def last_seq(self) -> int:
+        self.sync()
+        return TranscriptBuffer.last_seq.fget(self)
+
+    @property
+    def total_tokens(self) -> int:
+        self.sync()
+        return TranscriptBuffer.total_tokens.fget(self)
@@ -12,6 +12,9 @@ from app.models.session import TranscriptEntry
 
 logger = logging.getLogger(__name__)
 
+# Result offsets and durations are in 100 ns ticks
+_TICKS_PER_SECOND = 10_000_000
+
 
 def _build_recognizer(
     push_stream: speechsdk.audio.PushAudioInputStream,
@@ -51,14 +54,26 @@ class SpeechClient:
             print(entry)
         # Push raw PCM audio: client.push_audio(pcm_bytes)
         # Stop: await client.stop()
+
+    The blocking Speech SDK calls (building the recognizer, starting and
+    stopping recognition) run in worker threads so they don't stall the
+    event loop. stop() ends the audio; the stream ends once the SDK has
+    flushed the last results and reports the session stopped.
+
+    `on_result(entry, audio_end_s)`, if set, is called from the Speech SDK
+    thread as each entry is enqueued, with the position in the pushed audio
+    (seconds) where the utterance ended; the replay harness uses it to time
+    recognition.
     """
 
     def __init__(self, speaker_name: str = "Unknown") -> None:
         self.speaker_name = speaker_name
         self._push_stream = speechsdk.audio.PushAudioInputStream()
-        self._recognizer = _build_recognizer(self._push_stream)
+        # Built by stream(), off the event loop
+        self._recognizer: speechsdk.SpeechRecognizer | None = None
         self._queue: asyncio.Queue[TranscriptEntry | None] = asyncio.Queue()
         self._loop: asyncio.AbstractEventLoop | None = None
+        self.on_result: Callable[[TranscriptEntry, float], None] | None = None
 
     def _enqueue(self, entry: TranscriptEntry | None) -> None:
         """Thread-safe enqueue from Speech SDK callback thread."""
@@ -80,6 +95,9 @@ class SpeechClient:
                 text=text,
                 language=language,
             )
+            if self.on_result is not None:
+                end_ticks = evt.result.offset + evt.result.duration
+                self.on_result(entry, end_ticks / _TICKS_PER_SECOND)
             self._enqueue(entry)
 
     def _on_canceled(self, evt: speechsdk.SpeechRecognitionCanceledEventArgs) -> None:
@@ -88,6 +106,10 @@ class SpeechClient:
             logger.error("Speech recognition canceled: %s", details.error_details)
         self._enqueue(None)  # signal end of stream
 
+    def _on_session_stopped(self, evt: speechsdk.SessionEventArgs) -> None:
+        # All audio has been recognized (or recognition was stopped)
+        self._enqueue(None)
+
     def push_audio(self, audio_bytes: bytes) -> None:
         """Push raw PCM audio bytes (16kHz, 16-bit, mono) into the recognizer."""
         self._push_stream.write(audio_bytes)
@@ -100,9 +122,12 @@ class SpeechClient:
         """Async generator yielding TranscriptEntry objects as speech is recognized."""
         self._loop = asyncio.get_running_loop()
 
-        self._recognizer.recognized.connect(self._on_recognized)
-        self._recognizer.canceled.connect(self._on_canceled)
-        self._recognizer.start_continuous_recognition()
+        recognizer = await asyncio.to_thread(_build_recognizer, self._push_stream)
+        self._recognizer = recognizer
+        recognizer.recognized.connect(self._on_recognized)
+        recognizer.canceled.connect(self._on_canceled)
+        recognizer.session_stopped.connect(self._on_session_stopped)
+        await asyncio.to_thread(recognizer.start_continuous_recognition)
 
         logger.info("Speech recognition started (en-US, ms-MY)")
 
@@ -113,10 +138,12 @@ class SpeechClient:
                     break
                 yield entry
         finally:
-            self._recognizer.stop_continuous_recognition()
+            await asyncio.to_thread(recognizer.stop_continuous_recognition)
             logger.info("Speech recognition stopped")
 
     async def stop(self) -> None:
-        """Gracefully stop recognition and flush the queue."""
+        """
+        End the audio. The stream keeps yielding the results still being
+        recognized and finishes when the SDK reports the session stopped.
+        """
         self.close_audio()
-        self._enqueue(None)
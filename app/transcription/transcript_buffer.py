@@ -1,62 +1,734 @@
 from __future__ import annotations
 
+import os
+import sys
+import tempfile
 import threading
-from copy import deepcopy
-from typing import Sequence
+import time
+import weakref
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Sequence
 
 from app.models.session import TranscriptEntry
+from app.transcription.columnar import EntryColumns, StringTable, to_epoch_us
+from app.transcription.fanout import DEFAULT_SUBSCRIBER_QUEUE, Subscription, TranscriptFanout
+from app.transcription.keyword_index import (
+    KeywordIndex,
+    Postings,
+    build_postings,
+    postings_nbytes,
+)
+from app.transcription.wal import RECORD_CLEAR, TranscriptWAL
+from app.utils.tokens import count_tokens
+
+# Entries per segment before the hot segment is sealed
+DEFAULT_SEGMENT_SIZE = 500
+# Process-wide budget for sealed segments kept in memory (all buffers combined)
+DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+# Entries extend() appends per lock acquisition
+EXTEND_CHUNK_SIZE = 2000
+
+
+def render_line(entry: TranscriptEntry) -> str:
+    """
+    Render a single entry as a transcript line: `[HH:MM:SS] Speaker: text`.
+
+    The time is UTC: aware timestamps are converted, naive ones are taken as
+    UTC already (TranscriptEntry's default). TranscriptBuffer stores
+    timestamps normalized to UTC, so a line reads the same whether it is
+    rendered from the entry or from a resident or spilled segment.
+    """
+    ts = entry.timestamp
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    # Equivalent to strftime("%H:%M:%S"), which is several times slower
+    return f"[{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}] {entry.speaker}: {entry.text}"
+
+
+class _Segment:
+    """
+    A sealed run of consecutive entries.
+
+    While resident, `columns` holds the entries in columnar form, `postings`
+    their keyword postings and `text` their rendered transcript lines, and
+    all three count towards `nbytes`. Once spilled, all are None and the
+    segment lives at [offset, offset + length) of the owning buffer's spill
+    file as an EntryColumns blob; its postings and text are rebuilt from the
+    columns when a search or render needs them.
+    """
+
+    __slots__ = (
+        "columns", "postings", "text", "count", "nbytes", "offset", "length", "dropped",
+    )
+
+    def __init__(self, columns: EntryColumns, postings: Postings, text: str) -> None:
+        self.columns: EntryColumns | None = columns
+        self.postings: Postings | None = postings
+        self.text: str | None = text
+        self.count = len(columns)
+        self.nbytes = columns.nbytes + postings_nbytes(postings) + sys.getsizeof(text)
+        self.offset = -1
+        self.length = 0
+        self.dropped = False
+
+
+class MemoryBudget:
+    """
+    Process-wide byte budget for resident sealed segments across all buffers.
+
+    Segments are tracked in seal order; when the total exceeds `limit_bytes`
+    the oldest segments (from whichever buffer) are spilled to disk. Hot
+    segments are not charged — they are bounded per buffer by `segment_size`.
+    """
+
+    def __init__(self, limit_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES) -> None:
+        self.limit_bytes = limit_bytes
+        self._used = 0
+        self._resident: OrderedDict[_Segment, weakref.ref[TranscriptBuffer]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def used_bytes(self) -> int:
+        with self._lock:
+            return self._used
+
+    def charge(self, buffer: TranscriptBuffer, segment: _Segment) -> None:
+        """Track a newly sealed segment and spill the oldest ones if over budget."""
+        with self._lock:
+            if segment.dropped:
+                return
+            self._resident[segment] = weakref.ref(buffer)
+            self._used += segment.nbytes
+            victims = self._pop_over_budget()
+        # Spill outside the budget lock: _spill() takes the owning buffer's lock
+        for seg, ref in victims:
+            owner = ref()
+            if owner is not None:
+                owner._spill(seg)
+
+    def release(self, segment: _Segment) -> None:
+        """Stop tracking a segment (spilled, cleared or owner closed)."""
+        with self._lock:
+            if self._resident.pop(segment, None) is not None:
+                self._used -= segment.nbytes
+
+    def _pop_over_budget(self) -> list[tuple[_Segment, weakref.ref[TranscriptBuffer]]]:
+        victims = []
+        while self._used > self.limit_bytes and self._resident:
+            seg, ref = self._resident.popitem(last=False)
+            self._used -= seg.nbytes
+            victims.append((seg, ref))
+        return victims
+
+
+_budget: MemoryBudget | None = None
+
+
+def get_memory_budget() -> MemoryBudget:
+    global _budget
+    if _budget is None:
+        _budget = MemoryBudget()
+    return _budget
 
 
 class TranscriptBuffer:
     """
-    Thread-safe in-memory buffer for accumulating TranscriptEntry objects
+    Thread-safe segmented buffer for accumulating TranscriptEntry objects
     during a live meeting session.
 
-    Entries are appended as they arrive from the SpeechClient stream.
+    Entries are appended to a hot in-memory segment as they arrive from the
+    SpeechClient stream. Segments are stored column-wise (interned speaker and
+    language ids, int64 timestamps, one shared UTF-8 text store) and
+    TranscriptEntry objects are only materialized on read. Every
+    `segment_size` entries the hot segment is sealed and charged to a
+    process-wide MemoryBudget; when the budget is exceeded the oldest sealed
+    segments are spilled to an append-only file and read back lazily on demand.
+
+    Transcript text is rendered incrementally: each entry's line is rendered
+    once on append and kept with the hot segment, and a sealed segment keeps
+    its lines joined into one string that is charged to the MemoryBudget and
+    spilled with it. to_text() joins those per-segment strings and only
+    re-renders spilled segments from their columns (no TranscriptEntry
+    objects); last_n_text() and last_tokens_text() render only the tail they
+    return.
+
+    Token counts are computed once per entry at append time and kept as
+    prefix sums, so last_tokens(budget) finds the longest suffix that fits a
+    prompt budget with a binary search.
+
+    Timestamps are normalized to UTC on ingest: entries read back (and
+    rendered lines) carry naive UTC times, whatever offset they arrived with.
+
+    Every entry gets a monotonically increasing sequence number (starting at
+    1 and never reused, even across clear()), so pollers can read deltas with
+    since(seq) in O(new entries).
+
+    A timestamp index and per-speaker posting lists make range(start, end),
+    by_speaker(name) and combined query() calls bisect instead of scanning.
+    Timestamps are indexed as a running maximum, so an entry that arrives
+    with an earlier timestamp than its predecessor is indexed at the
+    predecessor's time.
+
+    An incrementally updated BM25 keyword index lets search(query) surface
+    relevant older utterances without putting the whole transcript in a prompt.
+    Its postings are sealed, charged and spilled with their segment; searches
+    re-index spilled segments for the query terms only.
+
+    Live viewers subscribe() to receive each appended entry through a
+    bounded per-subscriber queue; publishing never blocks ingestion.
+
+    If a TranscriptWAL is given, its existing records are replayed on
+    construction and every later append/clear is logged to it, so a restarted
+    process can rebuild the live transcript.
+
+    The buffer records when it was created and when it last saw activity
+    (an append, or a touch() from a reader), so idle meetings can be found
+    and evicted; memory_bytes estimates what it holds in memory.
+
     Use snapshot() to read without clearing, or snapshot_and_clear() to
-    atomically drain the buffer (e.g., at meeting end).
+    atomically drain the buffer (e.g., at meeting end). Call close() when the
+    buffer is discarded to release its spill file and WAL, or detach() to free
+    it while keeping the WAL for a later replay.
     """
 
-    def __init__(self) -> None:
-        self._entries: list[TranscriptEntry] = []
+    def __init__(
+        self,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        budget: MemoryBudget | None = None,
+        spill_dir: str | None = None,
+        token_counter: Callable[[str], int] | None = None,
+        wal: TranscriptWAL | None = None,
+    ) -> None:
+        if segment_size < 1:
+            raise ValueError("segment_size must be >= 1")
+        self._segment_size = segment_size
+        self._budget = budget or get_memory_budget()
+        self._spill_dir = spill_dir or None
+        self._count_tokens = token_counter or count_tokens
+        self._speakers = StringTable()
+        self._languages = StringTable()
+        self._sealed: list[_Segment] = []
+        self._hot = EntryColumns()
+        # Rendered transcript lines of the hot segment
+        self._hot_lines: list[str] = []
+        self._count = 0
+        # Sequence number of the entry at position 0
+        self._base_seq = 1
+        # _token_prefix[i] = tokens in rendered lines [0, i) (incl. newlines)
+        self._token_prefix = array("q", [0])
+        # Running-max epoch-us timestamp per position, and positions per speaker
+        self._ts_index = array("q")
+        self._speaker_postings: dict[str, array] = {}
+        self._keywords = KeywordIndex()
+        self._fanout = TranscriptFanout()
+        self._spill_file = None
+        self._spill_path: str | None = None
+        self._finalizer: weakref.finalize | None = None
         self._lock = threading.Lock()
+        # Wall-clock creation time; monotonic time of the last append or touch()
+        self.created_at = time.time()
+        self._last_activity = time.monotonic()
+        # Open producers (e.g. streaming connections) that keep the meeting in use
+        self._holds = 0
+        self._wal = None
+        if wal is not None:
+            self._replay(wal)
+            self._wal = wal
+
+    # ── Writes ────────────────────────────────────────────────────────────────
 
     def append(self, entry: TranscriptEntry) -> None:
         """Append a new transcript entry (thread-safe)."""
+        subscribers = ()
+        with self._lock:
+            sealed = self._append_locked(entry)
+            if self._wal is not None:
+                self._wal.append(entry)
+            seq = self._base_seq + self._count - 1
+            # Publish under the lock so subscribers see entries in seq order
+            if self._fanout:
+                subscribers = self._fanout.publish(seq, entry)
+        if subscribers:
+            self._fanout.wake(subscribers)
+        if sealed is not None:
+            self._budget.charge(self, sealed)
+
+    def extend(self, entries: Sequence[TranscriptEntry]) -> int:
+        """
+        Append many entries (bulk imports, replays) and return the last seq.
+
+        Entries are appended in chunks of EXTEND_CHUNK_SIZE, each under its
+        own lock acquisition and logged to the WAL as one write, so a large
+        batch doesn't block readers for its whole duration; a concurrent
+        append may land between chunks. Lines are rendered and their tokens
+        counted before the lock is taken.
+        """
+        if not entries:
+            return self.last_seq
+        for start in range(0, len(entries), EXTEND_CHUNK_SIZE):
+            chunk = entries[start:start + EXTEND_CHUNK_SIZE]
+            lines = [render_line(entry) for entry in chunk]
+            tokens = [self._count_tokens(line) for line in lines]
+            sealed: list[_Segment] = []
+            subscribers = ()
+            with self._lock:
+                for entry, line, n_tokens in zip(chunk, lines, tokens):
+                    segment = self._append_locked(entry, line, n_tokens)
+                    if segment is not None:
+                        sealed.append(segment)
+                if self._wal is not None:
+                    self._wal.append_many(chunk)
+                last_seq = self._base_seq + self._count - 1
+                if self._fanout:
+                    subscribers = self._fanout.publish_many(last_seq - len(chunk) + 1, chunk)
+            if subscribers:
+                self._fanout.wake(subscribers)
+            for segment in sealed:
+                self._budget.charge(self, segment)
+        return last_seq
+
+    def subscribe(self, maxsize: int = DEFAULT_SUBSCRIBER_QUEUE) -> Subscription:
+        """
+        Subscribe to entries appended from now on (call from an event loop).
+        Close the returned Subscription when done.
+        """
+        return self._fanout.subscribe(maxsize)
+
+    def touch(self) -> None:
+        """Record activity that doesn't append (e.g. a question about the meeting)."""
+        self._last_activity = time.monotonic()
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Mark the buffer in use (e.g. by an open stream) until the block exits."""
+        with self._lock:
+            self._holds += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._holds -= 1
+            self.touch()
+
+    def _append_locked(
+        self, entry: TranscriptEntry, line: str | None = None, tokens: int | None = None
+    ) -> _Segment | None:
+        """
+        Store and index one entry; return the segment it sealed, if any
+        (caller holds lock). `line` is the entry's rendered line and `tokens`
+        its token count, if the caller already has them.
+        """
+        ts_us = to_epoch_us(entry.timestamp)
+        self._hot.append(
+            self._speakers.intern(entry.speaker),
+            self._languages.intern(entry.language),
+            ts_us,
+            entry.text,
+        )
+        self._ts_index.append(max(ts_us, self._ts_index[-1]) if self._count else ts_us)
+        postings = self._speaker_postings.get(entry.speaker.casefold())
+        if postings is None:
+            postings = self._speaker_postings[entry.speaker.casefold()] = array("I")
+        postings.append(self._count)
+        self._keywords.add(entry.text)
+        self._count += 1
+        self._last_activity = time.monotonic()
+        if line is None:
+            line = render_line(entry)
+        self._hot_lines.append(line)
+        if tokens is None:
+            tokens = self._count_tokens(line)
+        self._token_prefix.append(self._token_prefix[-1] + tokens + 1)
+        return self._seal_if_full()
+
+    def _replay(self, wal: TranscriptWAL) -> None:
+        """Rebuild contents from a WAL's records without re-logging them."""
+        for kind, entry in wal.replay():
+            with self._lock:
+                if kind == RECORD_CLEAR:
+                    self._reset()
+                    continue
+                sealed = self._append_locked(entry)
+            if sealed is not None:
+                self._budget.charge(self, sealed)
+
+    def _seal_if_full(self) -> _Segment | None:
+        if len(self._hot) < self._segment_size:
+            return None
+        segment = _Segment(self._hot, self._keywords.seal(), "\n".join(self._hot_lines))
+        self._sealed.append(segment)
+        self._hot = EntryColumns()
+        self._hot_lines = []
+        return segment
+
+    def _spill(self, segment: _Segment) -> None:
+        """Write a resident sealed segment to the spill file and drop it from memory."""
         with self._lock:
-            self._entries.append(entry)
+            if segment.dropped or segment.columns is None:
+                return
+            f = self._open_spill_file()
+            payload = segment.columns.to_bytes()
+            f.seek(0, os.SEEK_END)
+            segment.offset = f.tell()
+            f.write(payload)
+            f.flush()
+            segment.length = len(payload)
+            segment.columns = None
+            segment.postings = None
+            segment.text = None
+
+    def _open_spill_file(self):
+        if self._spill_file is None:
+            if self._spill_dir:
+                os.makedirs(self._spill_dir, exist_ok=True)
+            fd, path = tempfile.mkstemp(prefix="transcript-", suffix=".seg", dir=self._spill_dir)
+            self._spill_file = os.fdopen(fd, "w+b")
+            self._spill_path = path
+            self._finalizer = weakref.finalize(self, _remove_spill_file, self._spill_file, path)
+        return self._spill_file
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def _load(self, segment: _Segment) -> EntryColumns:
+        """Return a segment's columns, reading spilled ones from disk (caller holds lock)."""
+        if segment.columns is not None:
+            return segment.columns
+        self._spill_file.seek(segment.offset)
+        return EntryColumns.from_bytes(self._spill_file.read(segment.length))
+
+    def _materialize(self, columns: EntryColumns, start: int, stop: int) -> list[TranscriptEntry]:
+        return columns.entries(start, stop, self._speakers, self._languages)
+
+    def _iter_entries(self) -> Iterator[TranscriptEntry]:
+        """Yield all entries oldest-first, one segment at a time (caller holds lock)."""
+        for segment in self._sealed:
+            yield from self._materialize(self._load(segment), 0, segment.count)
+        yield from self._materialize(self._hot, 0, len(self._hot))
 
     def snapshot(self) -> list[TranscriptEntry]:
         """Return a shallow copy of all entries without clearing."""
         with self._lock:
-            return list(self._entries)
+            return list(self._iter_entries())
 
     def snapshot_and_clear(self) -> list[TranscriptEntry]:
         """Atomically return all entries and clear the buffer."""
         with self._lock:
-            entries = list(self._entries)
-            self._entries.clear()
+            entries = list(self._iter_entries())
+            self._reset()
+            if self._wal is not None:
+                self._wal.append_clear()
             return entries
 
     def clear(self) -> None:
         """Discard all buffered entries."""
         with self._lock:
-            self._entries.clear()
+            self._reset()
+            if self._wal is not None:
+                self._wal.append_clear()
+
+    def flush(self) -> None:
+        """Make every entry appended so far durable in the WAL (no-op without one)."""
+        if self._wal is not None:
+            self._wal.sync()
+
+    def close(self) -> None:
+        """Discard all entries, end live subscriptions and delete the spill file and WAL."""
+        self._release(delete_wal=True)
+
+    def detach(self) -> None:
+        """
+        Free this in-memory copy like close(), but keep the WAL on disk so a
+        new buffer can replay the transcript later.
+        """
+        self._release(delete_wal=False)
+
+    def _release(self, delete_wal: bool) -> None:
+        self._fanout.close()
+        with self._lock:
+            self._reset()
+            if self._wal is not None:
+                self._wal.close(delete=delete_wal)
+                self._wal = None
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+                self._spill_file = None
+                self._spill_path = None
+
+    def _reset(self) -> None:
+        for segment in self._sealed:
+            segment.dropped = True
+            if segment.columns is not None:
+                self._budget.release(segment)
+        self._sealed = []
+        self._hot = EntryColumns()
+        self._hot_lines = []
+        self._base_seq += self._count
+        self._count = 0
+        self._token_prefix = array("q", [0])
+        self._ts_index = array("q")
+        self._speaker_postings = {}
+        self._keywords = KeywordIndex()
+        if self._spill_file is not None:
+            self._spill_file.truncate(0)
+
+    def _slice(self, start: int, stop: int) -> list[TranscriptEntry]:
+        """
+        Return entries at positions [start, stop), loading only the segments
+        that overlap the range (caller holds lock). Sealed segments all hold
+        exactly `segment_size` entries, so the first one is found by division.
+        """
+        start = max(start, 0)
+        stop = min(stop, self._count)
+        if start >= stop:
+            return []
+        size = self._segment_size
+        sealed_total = len(self._sealed) * size
+        out: list[TranscriptEntry] = []
+        for idx in range(start // size, len(self._sealed)):
+            seg_start = idx * size
+            if seg_start >= stop:
+                break
+            columns = self._load(self._sealed[idx])
+            out.extend(self._materialize(columns, max(start - seg_start, 0), stop - seg_start))
+        if stop > sealed_total:
+            out.extend(
+                self._materialize(self._hot, max(start - sealed_total, 0), stop - sealed_total)
+            )
+        return out
+
+    def _take(self, positions: Iterable[int]) -> list[TranscriptEntry]:
+        """Materialize entries at ascending positions, loading each segment once (lock held)."""
+        size = self._segment_size
+        sealed_total = len(self._sealed) * size
+        out: list[TranscriptEntry] = []
+        loaded_idx, columns = -1, None
+        for pos in positions:
+            if pos >= sealed_total:
+                columns, local = self._hot, pos - sealed_total
+            else:
+                idx, local = divmod(pos, size)
+                if idx != loaded_idx:
+                    loaded_idx, columns = idx, self._load(self._sealed[idx])
+            out.append(columns.entry(local, self._speakers, self._languages))
+        return out
+
+    def _lines(self, start: int, stop: int) -> list[str]:
+        """
+        Render positions [start, stop) as transcript text pieces to join with
+        newlines, like _slice() (lock held). A resident sealed segment that
+        lies wholly inside the range contributes its cached text as one
+        piece; other sealed segments are rendered from their columns.
+        """
+        start = max(start, 0)
+        stop = min(stop, self._count)
+        if start >= stop:
+            return []
+        size = self._segment_size
+        sealed_total = len(self._sealed) * size
+        out: list[str] = []
+        for idx in range(start // size, len(self._sealed)):
+            seg_start = idx * size
+            if seg_start >= stop:
+                break
+            segment = self._sealed[idx]
+            if segment.text is not None and start <= seg_start and seg_start + size <= stop:
+                out.append(segment.text)
+                continue
+            columns = self._load(segment)
+            out.extend(columns.lines(max(start - seg_start, 0), stop - seg_start, self._speakers))
+        if stop > sealed_total:
+            out.extend(self._hot_lines[max(start - sealed_total, 0):stop - sealed_total])
+        return out
 
     def last_n(self, n: int) -> list[TranscriptEntry]:
         """Return the last N entries (for QA context window)."""
+        if n <= 0:
+            return []
+        with self._lock:
+            return self._slice(self._count - n, self._count)
+
+    def _tokens_tail_start(self, budget: int) -> int:
+        """Position of the first entry of the longest suffix within `budget` tokens."""
+        prefix = self._token_prefix
+        return min(bisect_left(prefix, prefix[-1] - budget, 0, self._count + 1), self._count)
+
+    def last_tokens(self, budget: int) -> list[TranscriptEntry]:
+        """Return the longest run of most recent entries whose rendered text fits `budget`."""
+        with self._lock:
+            return self._slice(self._tokens_tail_start(budget), self._count)
+
+    def last_tokens_text(self, budget: int) -> str:
+        """Return the most recent transcript text that fits within `budget` tokens."""
+        with self._lock:
+            return self._last_n_text(self._count - self._tokens_tail_start(budget))
+
+    @property
+    def total_tokens(self) -> int:
+        """Token cost of the full rendered transcript."""
+        with self._lock:
+            return self._token_prefix[-1]
+
+    def since(self, seq: int, limit: int | None = None) -> list[tuple[int, TranscriptEntry]]:
+        """
+        Return (seq, entry) pairs for entries with sequence number > seq, oldest
+        first, at most `limit` of them. Pass the last seen seq (or 0) to poll.
+        """
+        return self.query(since=seq, limit=limit)
+
+    def query(
+        self,
+        since: int = 0,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        speaker: str | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[int, TranscriptEntry]]:
+        """
+        Return (seq, entry) pairs matching all given filters, oldest first.
+
+        Args:
+            since: Only entries with sequence number > since.
+            start: Only entries at or after this time (naive UTC or aware).
+            end: Only entries before this time.
+            speaker: Only entries by this speaker (case-insensitive).
+            limit: Maximum number of results.
+        """
         with self._lock:
-            return list(self._entries[-n:])
+            lo = max(since + 1 - self._base_seq, 0)
+            hi = self._count
+            if start is not None:
+                lo = max(lo, bisect_left(self._ts_index, to_epoch_us(start)))
+            if end is not None:
+                hi = min(hi, bisect_left(self._ts_index, to_epoch_us(end)))
+            if lo >= hi:
+                return []
+            if speaker is None:
+                stop = hi if limit is None else min(hi, lo + max(limit, 0))
+                return list(enumerate(self._slice(lo, stop), start=self._base_seq + lo))
+            postings = self._speaker_postings.get(speaker.casefold())
+            if postings is None:
+                return []
+            i = bisect_left(postings, lo)
+            j = bisect_left(postings, hi)
+            if limit is not None:
+                j = min(j, i + max(limit, 0))
+            positions = postings[i:j]
+            base = self._base_seq
+            return [(base + pos, e) for pos, e in zip(positions, self._take(positions))]
+
+    def search(self, query: str, top_k: int = 5) -> list[tuple[int, TranscriptEntry, float]]:
+        """Return up to `top_k` (seq, entry, score) keyword matches for `query`, best first."""
+        with self._lock:
+            hits = self._keywords.search(query, top_k, self._sealed_postings)
+            if not hits:
+                return []
+            # Materialize in position order so each segment is loaded once
+            positions = sorted(pos for pos, _ in hits)
+            entries = dict(zip(positions, self._take(positions)))
+            base = self._base_seq
+            return [(base + pos, entries[pos], score) for pos, score in hits]
+
+    def _sealed_postings(self, terms: set[str]) -> Iterator[Postings]:
+        """Yield sealed segments' postings, re-indexing spilled ones for `terms` (lock held)."""
+        for idx, segment in enumerate(self._sealed):
+            if segment.postings is not None:
+                yield segment.postings
+                continue
+            columns = self._load(segment)
+            texts = (columns.text_at(i) for i in range(segment.count))
+            yield build_postings(texts, idx * self._segment_size, terms)
+
+    def range(self, start: datetime | None, end: datetime | None) -> list[TranscriptEntry]:
+        """Return entries with start <= timestamp < end (either bound may be None)."""
+        return [e for _, e in self.query(start=start, end=end)]
+
+    def by_speaker(
+        self,
+        name: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[TranscriptEntry]:
+        """Return entries spoken by `name`, optionally restricted to a time range."""
+        return [e for _, e in self.query(start=start, end=end, speaker=name)]
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent entry (0 if nothing was ever appended)."""
+        with self._lock:
+            return self._base_seq + self._count - 1
 
     def to_text(self, entries: Sequence[TranscriptEntry] | None = None) -> str:
         """
         Format entries as a readable transcript string.
         Uses current buffer contents if entries is None.
         """
-        source = entries if entries is not None else self.snapshot()
-        lines = [f"[{e.timestamp.strftime('%H:%M:%S')}] {e.speaker}: {e.text}" for e in source]
-        return "\n".join(lines)
+        if entries is not None:
+            return "\n".join(render_line(e) for e in entries)
+        with self._lock:
+            return "\n".join(self._lines(0, self._count))
+
+    def last_n_text(self, n: int) -> str:
+        """Return the last N entries rendered as transcript text."""
+        with self._lock:
+            return self._last_n_text(n)
+
+    def _last_n_text(self, n: int) -> str:
+        """Render the last N lines (caller holds lock)."""
+        if n <= 0:
+            return ""
+        return "\n".join(self._lines(self._count - n, self._count))
+
+    @property
+    def durable(self) -> bool:
+        """True if the transcript survives detach() (it is logged to a WAL)."""
+        return self._wal is not None
+
+    @property
+    def idle_s(self) -> float:
+        """Seconds since the last append or touch()."""
+        return time.monotonic() - self._last_activity
+
+    @property
+    def in_use(self) -> bool:
+        """True while a live viewer is subscribed or a producer holds the buffer."""
+        return self._holds > 0 or bool(self._fanout)
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Approximate bytes of transcript held in memory: resident segments
+        (columns, keyword postings and rendered text), the hot segment and
+        its rendered lines, the keyword index's
+        open postings and statistics, and the token/timestamp/speaker indexes.
+        Spilled segments are not counted.
+        """
+        with self._lock:
+            total = self._hot.nbytes + self._keywords.nbytes
+            total += sys.getsizeof(self._hot_lines) + sum(map(sys.getsizeof, self._hot_lines))
+            total += sum(s.nbytes for s in self._sealed if s.columns is not None)
+            arrays = [self._token_prefix, self._ts_index]
+            arrays.extend(self._speaker_postings.values())
+            return total + sum(a.itemsize * len(a) for a in arrays)
+
+    @property
+    def spilled_segments(self) -> int:
+        """Number of sealed segments currently held on disk rather than in memory."""
+        with self._lock:
+            return sum(1 for s in self._sealed if s.columns is None)
 
     def __len__(self) -> int:
         with self._lock:
-            return len(self._entries)
+            return self._count
+
+
+def _remove_spill_file(f, path: str) -> None:
+    f.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+SAMPLE_RATE = 16_000
+DEFAULT_FRAME_MS = 20
+# Speech is kept this long after the last speech frame (trailing consonants, short pauses)
+DEFAULT_HANGOVER_MS = 300
+# Audio kept from just before speech onset, so the first syllable isn't clipped
+DEFAULT_PREROLL_MS = 200
+# Silence sent after each utterance so the recognizer still detects its end
+DEFAULT_BOUNDARY_MS = 600
+# A frame is speech when its energy is this many times the noise floor...
+DEFAULT_ENERGY_RATIO = 4.0
+# ...or, for quieter unvoiced sounds ("s", "f"), this many times with a high zero-crossing rate
+DEFAULT_UNVOICED_RATIO = 2.0
+DEFAULT_UNVOICED_ZCR = 0.25
+# Floor for the noise estimate (mean square of int16 samples; ~-60 dBFS)
+MIN_NOISE_ENERGY = 1000.0
+# Per-frame growth allowed in the noise estimate (~+6 dB over 5 s of 20 ms frames)
+NOISE_RISE = 1.0056
+
+
+class VoiceActivityGate:
+    """
+    Energy + zero-crossing voice-activity detector that sits in front of
+    SpeechClient.push_audio() and drops silence.
+
+    Blocks of 16 kHz mono int16 PCM are split into `frame_ms` frames, and per-
+    frame energy and zero-crossing rate are computed with NumPy in one pass
+    per block. The noise floor follows the quietest frame of each block down
+    immediately and rises only slowly, so it tracks room noise but not
+    speech. A frame is speech if it is well above the noise floor,
+    or moderately above it with a high zero-crossing rate (unvoiced
+    consonants). Speech is extended by `hangover_ms` and preceded by
+    `preroll_ms` of the audio before it. Longer silences are replaced by
+    `boundary_ms` of digital silence, so the recognizer still sees where each
+    utterance ends but isn't fed (or billed for) the rest.
+
+    process() returns the bytes to push; it may be empty. Not thread-safe;
+    call it from one audio callback.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = SAMPLE_RATE,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        hangover_ms: int = DEFAULT_HANGOVER_MS,
+        preroll_ms: int = DEFAULT_PREROLL_MS,
+        boundary_ms: int = DEFAULT_BOUNDARY_MS,
+        energy_ratio: float = DEFAULT_ENERGY_RATIO,
+        unvoiced_ratio: float = DEFAULT_UNVOICED_RATIO,
+        unvoiced_zcr: float = DEFAULT_UNVOICED_ZCR,
+    ) -> None:
+        self.frame = sample_rate * frame_ms // 1000
+        self.hangover_frames = hangover_ms // frame_ms
+        self.energy_ratio = energy_ratio
+        self.unvoiced_ratio = unvoiced_ratio
+        self.unvoiced_zcr = unvoiced_zcr
+        self.noise_energy: float | None = None
+        self._boundary = bytes(2 * (sample_rate * boundary_ms // 1000))
+        self._preroll: deque[bytes] = deque(maxlen=preroll_ms // frame_ms)
+        self._pending = np.empty(0, dtype=np.int16)
+        # Frames since the last speech frame (hangover countdown carried across blocks)
+        self._since_speech = self.hangover_frames + 1
+        self._active = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.utterances = 0
+
+    def _classify(self, frames: np.ndarray) -> np.ndarray:
+        """Speech mask for a (n_frames, frame) int16 array."""
+        samples = frames.astype(np.float32)
+        energy = np.einsum("ij,ij->i", samples, samples) / self.frame
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame
+        floor = float(energy.min())
+        if self.noise_energy is not None:
+            floor = min(floor, self.noise_energy * NOISE_RISE ** energy.size)
+        noise = self.noise_energy = max(MIN_NOISE_ENERGY, floor)
+        loud = energy > noise * self.energy_ratio
+        unvoiced = (energy > noise * self.unvoiced_ratio) & (zcr > self.unvoiced_zcr)
+        return loud | unvoiced
+
+    def _smooth(self, speech: np.ndarray) -> np.ndarray:
+        """Extend speech by the hangover: a frame is kept if speech was seen in the last N."""
+        index = np.arange(speech.size)
+        # Position of the most recent speech frame at or before each frame, counting
+        # from the previous block's last speech frame
+        last = np.maximum.accumulate(np.where(speech, index, -self._since_speech - 1))
+        since = index - last
+        self._since_speech = int(since[-1])
+        return since <= self.hangover_frames
+
+    def process(self, block: np.ndarray | bytes) -> bytes:
+        """Gate one block of int16 PCM; return what should be pushed to the recognizer."""
+        if isinstance(block, (bytes, bytearray, memoryview)):
+            block = np.frombuffer(block, dtype=np.int16)
+        block = block.reshape(-1)
+        self.bytes_in += block.nbytes
+        if self._pending.size:
+            block = np.concatenate([self._pending, block])
+        usable = block.size - block.size % self.frame
+        self._pending = block[usable:].copy()
+        if not usable:
+            return b""
+        frames = block[:usable].reshape(-1, self.frame)
+        keep = self._smooth(self._classify(frames))
+
+        out = bytearray()
+        raw = frames.tobytes()
+        step = self.frame * 2
+        # Walk runs of kept / dropped frames (a handful per block)
+        edges = np.flatnonzero(np.diff(keep.astype(np.int8))) + 1
+        bounds = [0, *edges.tolist(), keep.size]
+        for start, stop in zip(bounds, bounds[1:]):
+            chunk = raw[start * step:stop * step]
+            if keep[start]:
+                if not self._active:
+                    self._active = True
+                    self.utterances += 1
+                    out += b"".join(self._preroll)
+                    self._preroll.clear()
+                out += chunk
+            else:
+                if self._active:
+                    self._active = False
+                    out += self._boundary
+                for i in range(max(0, stop - start - self._preroll.maxlen), stop - start):
+                    self._preroll.append(chunk[i * step:(i + 1) * step])
+        self.bytes_out += len(out)
+        return bytes(out)
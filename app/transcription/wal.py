@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import weakref
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from app.models.session import TranscriptEntry
+from app.transcription.columnar import from_epoch_us, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+# Default group-commit interval: entries become durable at most this long after append()
+DEFAULT_FLUSH_INTERVAL_S = 0.02
+
+WAL_SUFFIX = ".wal"
+
+_FRAME = struct.Struct("<II")  # payload length, crc32(payload)
+_RECORD = struct.Struct("<BqHHI")  # kind, ts_us, speaker len, language len, text len
+
+RECORD_ENTRY = 1
+RECORD_CLEAR = 2
+
+
+def encode_record(entry: TranscriptEntry | None) -> bytes:
+    """Encode an entry record, or a clear record if `entry` is None (unframed payload)."""
+    if entry is None:
+        return _RECORD.pack(RECORD_CLEAR, 0, 0, 0, 0)
+    speaker = entry.speaker.encode()
+    language = entry.language.encode()
+    text = entry.text.encode()
+    header = _RECORD.pack(
+        RECORD_ENTRY, to_epoch_us(entry.timestamp), len(speaker), len(language), len(text)
+    )
+    return b"".join((header, speaker, language, text))
+
+
+def decode_record(payload: bytes) -> tuple[int, TranscriptEntry | None]:
+    """Inverse of encode_record(): (kind, entry), with entry None for clear records."""
+    kind, ts_us, speaker_len, language_len, text_len = _RECORD.unpack_from(payload)
+    if kind != RECORD_ENTRY:
+        return kind, None
+    pos = _RECORD.size
+    speaker = payload[pos:pos + speaker_len].decode()
+    pos += speaker_len
+    language = payload[pos:pos + language_len].decode()
+    pos += language_len
+    text = payload[pos:pos + text_len].decode()
+    entry = TranscriptEntry.model_construct(
+        speaker=speaker, text=text, language=language, timestamp=from_epoch_us(ts_us)
+    )
+    return kind, entry
+
+
+def frame(payload: bytes) -> bytes:
+    """Prefix a record payload with its length and CRC32."""
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def iter_frames(raw: bytes, pos: int = 0) -> Iterator[tuple[bytes, int]]:
+    """
+    Yield (payload, end offset) for each intact frame in `raw` from `pos`,
+    stopping at the first partial or corrupt one.
+    """
+    while pos + _FRAME.size <= len(raw):
+        length, crc = _FRAME.unpack_from(raw, pos)
+        payload = raw[pos + _FRAME.size:pos + _FRAME.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            return
+        pos += _FRAME.size + length
+        yield payload, pos
+
+
+class TranscriptWAL:
+    """
+    Append-only write-ahead log for one meeting's transcript.
+
+    append() only copies the encoded record into an in-memory pending buffer;
+    a shared background committer writes and fsyncs every registered log
+    once per flush interval (group commit), so durability costs one fsync
+    per interval rather than one per entry. Each record is framed with its
+    length and CRC32 so a torn tail left by a crash is detected and trimmed
+    on replay.
+    """
+
+    def __init__(self, path: str | Path, committer: GroupCommitter | None = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self._committer = committer or get_group_committer()
+        self._committer.register(self)
+
+    def append(self, entry: TranscriptEntry) -> None:
+        with self._lock:
+            self._pending += frame(encode_record(entry))
+
+    def append_many(self, entries: Iterable[TranscriptEntry]) -> None:
+        data = b"".join(frame(encode_record(entry)) for entry in entries)
+        with self._lock:
+            self._pending += data
+
+    def append_clear(self) -> None:
+        """Log that the buffer was cleared (entries before this record are dropped on replay)."""
+        with self._lock:
+            self._pending += frame(encode_record(None))
+
+    def sync(self) -> None:
+        """Write and fsync everything appended so far."""
+        with self._io_lock:
+            with self._lock:
+                if not self._pending or self._closed:
+                    return
+                data, self._pending = self._pending, bytearray()
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def replay(self) -> Iterator[tuple[int, TranscriptEntry | None]]:
+        """
+        Yield (kind, entry) for each intact record on disk, oldest first.
+
+        A trailing partial or corrupt record (crash mid-write) is truncated
+        away so later appends continue from the last good record.
+        """
+        raw = self.path.read_bytes()
+        pos = 0
+        for payload, pos in iter_frames(raw):
+            yield decode_record(payload)
+        if pos != len(raw):
+            logger.warning(
+                "Truncating %d trailing bytes of corrupt WAL '%s'", len(raw) - pos, self.path
+            )
+            with self._io_lock:
+                self._file.truncate(pos)
+
+    def close(self, delete: bool = False) -> None:
+        """Flush and close the log; delete the file if the transcript is no longer needed."""
+        self._committer.unregister(self)
+        self.sync()
+        with self._io_lock:
+            self._closed = True
+            self._file.close()
+        if delete:
+            self.path.unlink(missing_ok=True)
+
+
+class GroupCommitter:
+    """Background thread that syncs every registered TranscriptWAL once per interval."""
+
+    def __init__(self, interval_s: float = DEFAULT_FLUSH_INTERVAL_S) -> None:
+        self.interval_s = interval_s
+        self._logs: weakref.WeakSet[TranscriptWAL] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, wal: TranscriptWAL) -> None:
+        with self._lock:
+            self._logs.add(wal)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="transcript-wal-commit", daemon=True
+                )
+                self._thread.start()
+
+    def unregister(self, wal: TranscriptWAL) -> None:
+        with self._lock:
+            self._logs.discard(wal)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            with self._lock:
+                logs = list(self._logs)
+            for wal in logs:
+                try:
+                    wal.sync()
+                except Exception:
+                    logger.exception("WAL group commit failed for '%s'", wal.path)
+
+    def sync_all(self) -> None:
+        with self._lock:
+            logs = list(self._logs)
+        for wal in logs:
+            wal.sync()
+
+    def stop(self) -> None:
+        """Sync all logs and stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sync_all()
+
+
+_committer: GroupCommitter | None = None
+
+
+def get_group_committer() -> GroupCommitter:
+    global _committer
+    if _committer is None:
+        _committer = GroupCommitter()
+    return _committer
+
+
+def wal_path(wal_dir: str | Path, meeting_id: str) -> Path:
+    """Location of a meeting's WAL inside `wal_dir`."""
+    if not meeting_id or Path(meeting_id).name != meeting_id:
+        raise ValueError(f"Invalid meeting id for WAL file name: {meeting_id!r}")
+    return Path(wal_dir) / f"{meeting_id}{WAL_SUFFIX}"
+
+
+def list_wal_meetings(wal_dir: str | Path) -> list[str]:
+    """Meeting ids with a WAL in `wal_dir` (meetings that were live at the last shutdown)."""
+    directory = Path(wal_dir)
+    if not directory.is_dir():
+        return []
+    return sorted(p.stem for p in directory.glob(f"*{WAL_SUFFIX}"))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Encoding used by gpt-4o / gpt-4o-mini deployments
+DEFAULT_ENCODING = "o200k_base"
+
+# Rough characters-per-token ratio used when the tiktoken encoding is unavailable
+_FALLBACK_CHARS_PER_TOKEN = 4
+
+
+@lru_cache
+def _get_encoder(encoding_name: str) -> Callable[[str], list[int]] | None:
+    """Load a tiktoken encoding once; return None if it cannot be loaded (e.g. offline)."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(encoding_name).encode_ordinary
+    except Exception as exc:
+        logger.warning(
+            "tiktoken encoding '%s' unavailable (%s); using a character-based estimate",
+            encoding_name,
+            exc,
+        )
+        return None
+
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """
+    Count the tokens `text` costs in a model prompt.
+
+    Falls back to a ~4 characters per token estimate when the tiktoken
+    encoding files cannot be loaded, so callers never fail on token counting.
+    """
+    encode = _get_encoder(encoding_name)
+    if encode is None:
+        return max(1, -(-len(text) // _FALLBACK_CHARS_PER_TOKEN)) if text else 0
+    return len(encode(text))
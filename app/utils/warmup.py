@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Literal
+
+logger = logging.getLogger(__name__)
+
+StepStatus = Literal["pending", "running", "ready", "failed", "deferred"]
+
+
+@dataclass
+class _Step:
+    name: str
+    init: Callable[[], Awaitable[Any]]
+    critical: bool
+    lazy: bool
+    status: StepStatus = "pending"
+    latency_ms: float | None = None
+    error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class Warmup:
+    """
+    Named async initialization steps (create DB containers, ensure an index, ...)
+    run concurrently at startup, with per-step timing for a readiness probe.
+
+    A lazy step is skipped by start() and runs the first time ensure() asks
+    for it, so slow non-critical setup stays off the cold-start path.
+    Concurrent ensure() calls share one run; a failed step is retried by the
+    next ensure(). start() raises if a critical step fails; non-critical
+    failures are logged and reported by status().
+    """
+
+    def __init__(self) -> None:
+        self._steps: dict[str, _Step] = {}
+
+    def add(
+        self,
+        name: str,
+        init: Callable[[], Awaitable[Any]],
+        critical: bool = True,
+        lazy: bool = False,
+    ) -> None:
+        self._steps[name] = _Step(name, init, critical, lazy, "deferred" if lazy else "pending")
+
+    async def start(self) -> None:
+        eager = [step for step in self._steps.values() if not step.lazy]
+        results = await asyncio.gather(
+            *(self.ensure(step.name) for step in eager), return_exceptions=True
+        )
+        for step, result in zip(eager, results):
+            if isinstance(result, BaseException):
+                if step.critical:
+                    raise result
+                logger.warning("Non-critical init '%s' failed: %s", step.name, result)
+
+    async def ensure(self, *names: str) -> None:
+        """Run the named steps if they haven't completed yet, concurrently."""
+        await asyncio.gather(*(self._run(self._steps[name]) for name in names))
+
+    async def _run(self, step: _Step) -> None:
+        if step.status == "ready":
+            return
+        if step.task is None or step.task.done():
+            step.task = asyncio.ensure_future(self._init(step))
+        await asyncio.shield(step.task)
+
+    async def _init(self, step: _Step) -> None:
+        step.status, step.error = "running", None
+        started = time.perf_counter()
+        try:
+            await step.init()
+        except Exception as exc:
+            step.status, step.error = "failed", str(exc) or type(exc).__name__
+            raise
+        finally:
+            step.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        step.status = "ready"
+        logger.info("Initialized '%s' in %.0f ms", step.name, step.latency_ms)
+
+    @property
+    def ready(self) -> bool:
+        """True once every critical step has completed."""
+        return all(s.status == "ready" for s in self._steps.values() if s.critical)
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        return {
+            s.name: {
+                "status": s.status,
+                "critical": s.critical,
+                "lazy": s.lazy,
+                "latency_ms": s.latency_ms,
+                "error": s.error,
+            }
+            for s in self._steps.values()
+        }
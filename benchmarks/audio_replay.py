@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Benchmark: transcription latency, replaying a recording instead of a live mic.
+
+Streams a 16 kHz mono 16-bit WAV (or headerless .pcm) file through a
+recognizer's push_audio() in 100 ms blocks, as scripts/local_meeting.py does
+with the microphone, optionally through the voice-activity gate, and appends
+recognized entries to a TranscriptBuffer. Per utterance it reports the time
+from pushing the utterance's last audio to the recognizer enqueuing its
+TranscriptEntry, and to the entry being in the buffer.
+
+Backends (--recognizer):
+  - azure: SpeechClient (needs AZURE_SPEECH_KEY / AZURE_SPEECH_REGION)
+  - fake:  FakeRecognizer, one deterministic result per --fake-seconds of
+           pushed audio, optionally with text from an NDJSON --script
+
+Usage:
+    python benchmarks/audio_replay.py recordings/standup.wav --speed 1
+    python benchmarks/audio_replay.py recordings/standup.wav --recognizer fake --speed 0
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.transcription.bulk import parse_ndjson
+from app.transcription.fake_speech import BYTES_PER_SECOND, FakeRecognizer
+from app.transcription.recognizer_pool import Recognizer, _recognizer_factory
+from app.transcription.replay import load_audio, replay
+from app.transcription.vad import VoiceActivityGate
+
+
+def _recognizer(args: argparse.Namespace) -> Recognizer:
+    if args.recognizer == "fake":
+        script = parse_ndjson(args.script.read_bytes()) if args.script else None
+        return FakeRecognizer(
+            speaker_name=args.speaker,
+            script=script,
+            bytes_per_result=int(args.fake_seconds * BYTES_PER_SECOND),
+        )
+    return _recognizer_factory(args.recognizer)(args.speaker)
+
+
+async def run(args: argparse.Namespace) -> None:
+    audio = load_audio(args.audio)
+    report = await replay(
+        audio,
+        _recognizer(args),
+        speed=args.speed,
+        vad=None if args.no_vad else VoiceActivityGate(),
+    )
+    for u in report.utterances:
+        print(
+            f"  {u.audio_end_s:>8.2f}s  recognized {u.recognized_ms:>7.1f} ms  "
+            f"buffered {u.buffered_ms:>7.1f} ms  {u.text[:50]}"
+        )
+    print(json.dumps(report.summary(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("audio", type=Path, help="16 kHz mono 16-bit .wav or .pcm file")
+    parser.add_argument("--recognizer", choices=["azure", "fake"], default="fake")
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="Playback speed: 1 = real time, 4 = 4x, 0 = as fast as possible",
+    )
+    parser.add_argument("--no-vad", action="store_true", help="Push silence too")
+    parser.add_argument("--speaker", default="Replay")
+    parser.add_argument("--fake-seconds", type=float, default=1.0)
+    parser.add_argument("--script", type=Path, help="NDJSON transcript for the fake recognizer")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
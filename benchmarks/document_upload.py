@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Benchmark: peak memory of parallel large document uploads, buffered vs streamed.
+
+Runs N concurrent uploads of an M MB file through FastAPI's UploadFile, once
+the original way (read the whole file, then upload the bytes) and once with
+staged-block streaming (app.storage.blob_client.stage_blocks). Blob Storage
+is simulated by a client that sleeps per block to mimic network time and
+keeps nothing, so the figures are this process's own traced allocations.
+
+Usage:
+    python benchmarks/document_upload.py --uploads 8 --size-mb 200 --block-mb 4
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from starlette.datastructures import UploadFile
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.storage.blob_client import stage_blocks
+
+# Simulated upload bandwidth per request
+_MB_PER_S = 400
+
+
+class _FakeBlobClient:
+    async def stage_block(self, block_id: str, data: bytes, length: int) -> None:
+        await asyncio.sleep(length / (_MB_PER_S * 1024 * 1024))
+
+    async def upload_blob(self, data: bytes) -> None:
+        # The SDK splits large bytes into blocks itself; the bytes stay alive throughout
+        await asyncio.sleep(len(data) / (_MB_PER_S * 1024 * 1024))
+
+
+async def _buffered(upload: UploadFile, block_size: int) -> None:
+    data = await upload.read()
+    await _FakeBlobClient().upload_blob(data)
+
+
+async def _streamed(upload: UploadFile, block_size: int) -> None:
+    await stage_blocks(_FakeBlobClient(), upload, block_size=block_size)
+
+
+def _uploads(path: Path, n: int) -> list[UploadFile]:
+    return [UploadFile(file=open(path, "rb"), filename="deck.pdf") for _ in range(n)]
+
+
+async def _run(upload, uploads: list[UploadFile], block_size: int) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(upload(u, block_size) for u in uploads))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    for u in uploads:
+        await u.close()
+    return peak / 1024 / 1024, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uploads", type=int, default=8, help="Concurrent uploads")
+    parser.add_argument("--size-mb", type=int, default=200, help="Size of each file")
+    parser.add_argument("--block-mb", type=int, default=4)
+    args = parser.parse_args()
+    block_size = args.block_mb * 1024 * 1024
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
+        chunk = bytes(range(256)) * 4096  # 1 MB
+        for _ in range(args.size_mb):
+            f.write(chunk)
+        f.flush()
+        path = Path(f.name)
+
+        print(f"{args.uploads} x {args.size_mb} MB uploads, {args.block_mb} MB blocks")
+        for name, upload in (("buffered", _buffered), ("streamed", _streamed)):
+            peak, elapsed = asyncio.run(_run(upload, _uploads(path, args.uploads), block_size))
+            print(f"{name:>9}: peak {peak:>9,.1f} MB  {elapsed:>6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
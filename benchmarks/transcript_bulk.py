@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark: bulk transcript ingestion (replaying a recorded meeting).
+
+Pushes N lines into an active meeting buffer in one request each way, through
+the ASGI app in-process (no network, lifespan off):
+  - POST /meetings/{id}/transcript with a JSON array (pydantic validation,
+    one TranscriptEntry built and validated per line)
+  - POST /meetings/{id}/transcript/bulk with NDJSON
+  - POST /meetings/{id}/transcript/bulk with the columnar JSON payload
+and reports request size, parse time and lines/sec for each. Uses orjson
+when installed (pip install "meetingbot[fast]"), else the stdlib json module.
+
+Usage:
+    python benchmarks/transcript_bulk.py --lines 100000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from pydantic import TypeAdapter
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app import main as api
+from app.transcription import bulk
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+MEETING_ID = "bench-meeting"
+SPEAKERS = ["Aisyah", "Ben", "Chong", "Devi"]
+
+
+def _lines(n: int) -> list[dict]:
+    return [
+        {"speaker": SPEAKERS[i % 4], "text": f"utterance {i} about the Q3 roadmap", "language": "en-US"}
+        for i in range(n)
+    ]
+
+
+def _columnar(lines: list[dict]) -> bytes:
+    return json.dumps({
+        "speakers": SPEAKERS,
+        "speaker": [SPEAKERS.index(line["speaker"]) for line in lines],
+        "text": [line["text"] for line in lines],
+        "language": "en-US",
+    }).encode()
+
+
+def _parse_time(parse, body: bytes) -> float:
+    start = time.perf_counter()
+    parse(body)
+    return time.perf_counter() - start
+
+
+async def _post(
+    client: httpx.AsyncClient, label: str, path: str, body: bytes, content_type: str, parse
+) -> None:
+    api._active_buffers[MEETING_ID] = TranscriptBuffer(token_counter=lambda text: len(text) // 4)
+    parse_s = _parse_time(parse, body)
+    start = time.perf_counter()
+    resp = await client.post(path, content=body, headers={"Content-Type": content_type})
+    elapsed = time.perf_counter() - start
+    resp.raise_for_status()
+    total = len(api._active_buffers[MEETING_ID])
+    print(
+        f"{label:<22} {len(body) / 1e6:>6.1f} MB  parse {parse_s * 1000:>6.0f} ms  "
+        f"{total / elapsed:>10,.0f} lines/s  ({total} lines, {elapsed:.2f}s)"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    lines = _lines(args.lines)
+    array = json.dumps(lines).encode()
+    ndjson = "\n".join(json.dumps(line) for line in lines).encode()
+    columnar = _columnar(lines)
+    validate = TypeAdapter(list[api.TranscriptLine]).validate_json
+
+    print(f"JSON parser: {bulk._loads.__module__}")
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        base = f"/meetings/{MEETING_ID}/transcript"
+        await _post(client, "pydantic array", base, array, "application/json", validate)
+        await _post(
+            client, "bulk NDJSON", f"{base}/bulk", ndjson, "application/x-ndjson", bulk.parse_ndjson
+        )
+        await _post(
+            client, "bulk columnar", f"{base}/bulk", columnar, "application/json",
+            bulk.parse_columnar,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=100_000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
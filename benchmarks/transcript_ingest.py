@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Load test: transcript ingestion over REST versus the WebSocket stream.
+
+Starts the API in-process with uvicorn (lifespan off, so no Azure calls),
+seeds an active meeting buffer, and pushes N lines through:
+  - POST /meetings/{id}/transcript, one line per request and in batches of 5
+    (the old scripts/local_meeting.py behaviour)
+  - WS /meetings/{id}/stream, one line per frame waiting for each ack, and
+    pipelined in frames of 5 lines
+from several concurrent clients, reporting lines/sec for each.
+
+Usage:
+    python benchmarks/transcript_ingest.py --lines 5000 --clients 4
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+import websockets
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app import main as api
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+MEETING_ID = "bench-meeting"
+
+
+def _line(i: int) -> dict:
+    return {"speaker": f"Speaker{i % 4}", "text": f"utterance {i} about the Q3 roadmap"}
+
+
+def _start_server() -> tuple[uvicorn.Server, str]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    config = uvicorn.Config(
+        api.app, host="127.0.0.1", port=port, lifespan="off", log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, f"127.0.0.1:{port}"
+
+
+async def _rest_client(host: str, n: int, batch: int) -> None:
+    async with httpx.AsyncClient(base_url=f"http://{host}") as client:
+        for start in range(0, n, batch):
+            lines = [_line(i) for i in range(start, min(start + batch, n))]
+            resp = await client.post(f"/meetings/{MEETING_ID}/transcript", json=lines)
+            resp.raise_for_status()
+
+
+async def _ws_client(host: str, n: int, batch: int) -> None:
+    async with websockets.connect(f"ws://{host}/meetings/{MEETING_ID}/stream") as ws:
+        for start in range(0, n, batch):
+            frame = "\n".join(json.dumps(_line(i)) for i in range(start, min(start + batch, n)))
+            await ws.send(frame)
+            await ws.recv()
+
+
+async def _measure(label: str, client, host: str, lines: int, clients: int, batch: int) -> None:
+    api._active_buffers[MEETING_ID] = TranscriptBuffer(token_counter=lambda text: len(text) // 4)
+    per_client = lines // clients
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, per_client, batch) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    total = len(api._active_buffers[MEETING_ID])
+    print(f"{label:<28} {total / elapsed:>10,.0f} lines/s  ({total} lines, {elapsed:.2f}s)")
+
+
+async def run(args: argparse.Namespace) -> None:
+    server, host = _start_server()
+    try:
+        await _measure("REST, 1 line/request", _rest_client, host, args.lines, args.clients, 1)
+        await _measure("REST, 5 lines/request", _rest_client, host, args.lines, args.clients, 5)
+        await _measure("WS, 1 line/frame", _ws_client, host, args.lines, args.clients, 1)
+        await _measure("WS, 5 lines/frame", _ws_client, host, args.lines, args.clients, 5)
+    finally:
+        server.should_exit = True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=4)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
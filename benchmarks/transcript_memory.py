@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Benchmark: transcript memory footprint, list of models vs columnar buffer.
+
+Measures traced allocations for N entries held as a plain list of
+TranscriptEntry models (the original TranscriptBuffer layout) and as the
+columnar TranscriptBuffer, with spilling disabled so every entry is resident.
+The rendered-text cache and token prefix sums are reported separately.
+
+Usage:
+    python benchmarks/transcript_memory.py --sizes 10000,100000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import MemoryBudget, TranscriptBuffer
+
+_SPEAKERS = ["Aisyah", "Ali", "Bob", "Charlie", "Mei Ling", "Ravi"]
+
+
+def _entries(n: int) -> list[TranscriptEntry]:
+    return [
+        TranscriptEntry(
+            speaker=_SPEAKERS[i % len(_SPEAKERS)],
+            text=f"Item {i}: we need the budget approved by Friday lah, boleh?",
+            language="ms-MY" if i % 3 == 0 else "en-US",
+        )
+        for i in range(n)
+    ]
+
+
+def _measure(build) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, obj
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+
+    print(
+        f"{'entries':>10} {'list[model] MB':>15} {'columnar MB':>12} "
+        f"{'of which cols MB':>17} {'B/entry':>9}"
+    )
+    for n in (int(s) for s in args.sizes.split(",")):
+        # Models are serialized to JSON first so both builds start from the wire format
+        raw = [e.model_dump_json() for e in _entries(n)]
+
+        models_bytes, models = _measure(
+            lambda: [TranscriptEntry.model_validate_json(r) for r in raw]
+        )
+        del models
+
+        def build_buffer():
+            buf = TranscriptBuffer(budget=MemoryBudget(limit_bytes=1 << 40), token_counter=len)
+            for r in raw:
+                buf.append(TranscriptEntry.model_validate_json(r))
+            return buf
+
+        buffer_bytes, buf = _measure(build_buffer)
+        cols = sum(s.nbytes for s in buf._sealed) + buf._hot.nbytes
+        mb = 1024 * 1024
+        print(
+            f"{n:>10} {models_bytes / mb:>15.1f} {buffer_bytes / mb:>12.1f} "
+            f"{cols / mb:>17.1f} {cols / n:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Benchmark: transcript rendering cost versus transcript length.
+
+Compares rendering materialized TranscriptEntry objects (snapshot() then
+render_line) against TranscriptBuffer.to_text(), which joins the lines
+rendered on append (one cached string per sealed segment), and
+last_n_text(50), which renders only the tail, simulating a QA call after
+every new utterance.
+
+Usage:
+    python benchmarks/transcript_render.py --sizes 1000,10000,50000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer, render_line
+
+
+def _fill(n: int) -> TranscriptBuffer:
+    buf = TranscriptBuffer()
+    for i in range(n):
+        buf.append(TranscriptEntry(speaker=f"Speaker{i % 7}", text=f"utterance number {i} lah"))
+    return buf
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,50000,100000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'entries':>10} {'entry render ms':>16} {'cached to_text ms':>18} "
+        f"{'last_n_text(50) ms':>20}"
+    )
+    for n in (int(s) for s in args.sizes.split(",")):
+        buf = _fill(n)
+
+        def full():
+            buf.append(TranscriptEntry(speaker="Asker", text="new line"))
+            "\n".join(render_line(e) for e in buf.snapshot())
+
+        # One new utterance between each QA call, as in a live meeting
+        def cached():
+            buf.append(TranscriptEntry(speaker="Asker", text="new line"))
+            buf.to_text()
+
+        def tail():
+            buf.append(TranscriptEntry(speaker="Asker", text="new line"))
+            buf.last_n_text(50)
+
+        full_ms = _time(full, args.repeat)
+        cached_ms, tail_ms = _time(cached, args.repeat), _time(tail, args.repeat)
+        print(f"{n:>10} {full_ms:>16.3f} {cached_ms:>18.3f} {tail_ms:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
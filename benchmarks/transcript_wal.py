@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Benchmark: TranscriptBuffer append throughput with the write-ahead log on.
+
+Appends N entries from several writer threads (one per simulated meeting)
+with durability off, and with a WAL using group commit at the configured
+flush interval. Throughput includes the final sync, so every entry counted
+is on disk.
+
+Usage:
+    python benchmarks/transcript_wal.py --entries 100000 --meetings 4 --flush-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.wal import GroupCommitter, TranscriptWAL, wal_path
+
+
+def _run(buffers: list[TranscriptBuffer], per_meeting: int) -> float:
+    entries = [
+        TranscriptEntry(speaker=f"Speaker{i % 5}", text=f"utterance {i}: kita proceed plan B")
+        for i in range(per_meeting)
+    ]
+
+    def writer(buf: TranscriptBuffer) -> None:
+        for e in entries:
+            buf.append(e)
+
+    threads = [threading.Thread(target=writer, args=(b,)) for b in buffers]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for b in buffers:
+        b.flush()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100_000, help="Total entries")
+    parser.add_argument("--meetings", type=int, default=4)
+    parser.add_argument("--flush-ms", type=float, default=20)
+    args = parser.parse_args()
+    per_meeting = args.entries // args.meetings
+    total = per_meeting * args.meetings
+
+    def counter(text: str) -> int:
+        return len(text) // 4
+
+    plain = [TranscriptBuffer(token_counter=counter) for _ in range(args.meetings)]
+    elapsed = _run(plain, per_meeting)
+    print(f"durability off : {total / elapsed:>10,.0f} entries/s")
+
+    committer = GroupCommitter(interval_s=args.flush_ms / 1000)
+    with tempfile.TemporaryDirectory() as wal_dir:
+        durable = [
+            TranscriptBuffer(
+                token_counter=counter,
+                wal=TranscriptWAL(wal_path(wal_dir, f"m{i}"), committer=committer),
+            )
+            for i in range(args.meetings)
+        ]
+        elapsed = _run(durable, per_meeting)
+        size = sum(wal_path(wal_dir, f"m{i}").stat().st_size for i in range(args.meetings))
+        print(
+            f"WAL ({args.flush_ms:g} ms)  : {total / elapsed:>10,.0f} entries/s  "
+            f"({size / total:.0f} B/entry on disk)"
+        )
+        committer.stop()
+        for b in durable:
+            b.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,13 +26,19 @@ from __future__ import annotations
 import argparse
 import asyncio
 import getpass
+import json
 import os
 import sys
 import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 import numpy as np
+import websockets
+
+if TYPE_CHECKING:
+    from app.transcription.vad import VoiceActivityGate
 
 # Load .env from project root before anything else
 _project_root = Path(__file__).parent.parent
@@ -73,6 +79,11 @@ def parse_args() -> argparse.Namespace:
         default="http://localhost:8000",
         help="MeetingBot API base URL (default: http://localhost:8000)",
     )
+    parser.add_argument(
+        "--no-vad",
+        action="store_true",
+        help="Send all microphone audio to Azure Speech instead of dropping silence",
+    )
     return parser.parse_args()
 
 
@@ -90,16 +101,25 @@ def api_get(base: str, path: str) -> dict:
     return resp.json()
 
 
+def ws_url(base: str, path: str) -> str:
+    """Map an http(s) API base URL to the ws(s) URL for `path`."""
+    return f"{base.replace('http', 'ws', 1)}{path}"
+
+
 # ── Mic → Speech pipeline ──────────────────────────────────────────────────────
 
 class MicCapture:
     """
     Captures laptop microphone audio using sounddevice and feeds raw PCM bytes
-    to an Azure SpeechClient push stream.
+    to an Azure SpeechClient push stream. With a VoiceActivityGate, silence
+    is dropped before it is pushed.
     """
 
-    def __init__(self, speech_client: SpeechClient) -> None:
+    def __init__(
+        self, speech_client: SpeechClient, vad: VoiceActivityGate | None = None
+    ) -> None:
         self._client = speech_client
+        self._vad = vad
         self._stream: sd.InputStream | None = None
 
     def _callback(
@@ -112,7 +132,12 @@ class MicCapture:
         if status:
             print(f"\n[mic] {status}", file=sys.stderr)
         # sounddevice delivers float32 when dtype='float32'; we configured int16 directly
-        self._client.push_audio(indata.tobytes())
+        if self._vad is None:
+            self._client.push_audio(indata.tobytes())
+            return
+        audio = self._vad.process(indata[:, 0])
+        if audio:
+            self._client.push_audio(audio)
 
     def start(self) -> None:
         self._stream = sd.InputStream(
@@ -129,6 +154,9 @@ class MicCapture:
             self._stream.stop()
             self._stream.close()
         self._client.close_audio()
+        if self._vad is not None and self._vad.bytes_in:
+            saved = 1 - self._vad.bytes_out / self._vad.bytes_in
+            print(f"[mic] Voice-activity gate dropped {saved:.0%} of the captured audio")
 
 
 # ── Terminal input loop ────────────────────────────────────────────────────────
@@ -189,44 +217,76 @@ async def stream_transcript(
 ) -> None:
     """
     Consumes TranscriptEntry objects from the SpeechClient stream,
-    prints them to the terminal, appends to the buffer, and batch-pushes
-    to the API so the backend buffer stays in sync.
+    prints them to the terminal, appends to the buffer, and streams each
+    line to the API over the meeting's WebSocket as soon as it is recognized.
+    Falls back to the REST endpoint if the socket cannot be opened or drops.
     """
-    batch: list[dict] = []
-
-    async for entry in speech_client.stream():
-        if stop_event.is_set():
-            break
-
-        ts = entry.timestamp.strftime("%H:%M:%S")
-        lang_tag = f"[{entry.language}]" if entry.language != "en-US" else ""
-        print(f"  [{ts}] {entry.speaker}{lang_tag}: {entry.text}")
-
-        buffer.append(entry)
-        batch.append({"speaker": entry.speaker, "text": entry.text, "language": entry.language})
+    ws = None
+    try:
+        ws = await websockets.connect(ws_url(api_base, f"/meetings/{meeting_id}/stream"))
+    except Exception as exc:
+        print(f"\n[warn] Transcript stream unavailable, using REST: {exc}", file=sys.stderr)
 
-        # Push to API in batches of 5 to keep backend buffer in sync
-        if len(batch) >= 5:
+    try:
+        async for entry in speech_client.stream():
+            if stop_event.is_set():
+                break
+
+            ts = entry.timestamp.strftime("%H:%M:%S")
+            lang_tag = f"[{entry.language}]" if entry.language != "en-US" else ""
+            print(f"  [{ts}] {entry.speaker}{lang_tag}: {entry.text}")
+
+            buffer.append(entry)
+            line = {"speaker": entry.speaker, "text": entry.text, "language": entry.language}
+
+            if ws is not None:
+                try:
+                    await ws.send(json.dumps(line))
+                    await ws.recv()  # ack: the server has appended the line
+                    continue
+                except websockets.ConnectionClosed as exc:
+                    print(f"\n[warn] Transcript stream closed, using REST: {exc}", file=sys.stderr)
+                    ws = None
             try:
-                api_post(
-                    api_base,
-                    f"/meetings/{meeting_id}/transcript",
-                    json=batch,
-                )
+                api_post(api_base, f"/meetings/{meeting_id}/transcript", json=[line])
             except Exception as exc:
                 print(f"\n[warn] Transcript sync failed: {exc}", file=sys.stderr)
-            batch.clear()
-
-    # Flush remaining
-    if batch:
-        try:
-            api_post(api_base, f"/meetings/{meeting_id}/transcript", json=batch)
-        except Exception:
-            pass
+    finally:
+        if ws is not None:
+            await ws.close()
 
 
 # ── End meeting + print summary ───────────────────────────────────────────────
 
+# Seconds between polls of the end-of-meeting job, and how long to wait for it
+END_POLL_INTERVAL_S = 2.0
+END_TIMEOUT_S = 600.0
+
+
+async def end_meeting(api_base: str, meeting_id: str) -> dict:
+    """
+    End the meeting, wait for its background job (minutes, SharePoint,
+    Planner) to finish and return the stored minutes.
+    """
+    accepted = api_post(api_base, f"/meetings/{meeting_id}/end")
+    job = {"status": accepted["status"]}
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + END_TIMEOUT_S
+    last_stage = None
+    while job["status"] not in ("succeeded", "failed"):
+        if loop.time() > deadline:
+            raise TimeoutError(f"end-of-meeting job {accepted['job_id']} still {job['status']}")
+        await asyncio.sleep(END_POLL_INTERVAL_S)
+        job = api_get(api_base, accepted["status_url"])
+        stages = job.get("stages") or []
+        if stages and stages[-1]["name"] != last_stage:
+            last_stage = stages[-1]["name"]
+            print(f"[bot] … {last_stage}")
+    if job["status"] == "failed":
+        raise RuntimeError(job.get("error") or "end-of-meeting job failed")
+    return api_get(api_base, f"/meetings/{meeting_id}/minutes")
+
+
 def print_minutes(minutes: dict) -> None:
     print("\n" + "=" * 60)
     print(f"  MEETING MINUTES: {minutes.get('title', 'Meeting')}")
@@ -296,7 +356,11 @@ async def run(args: argparse.Namespace) -> None:
 
     speech_client = SpeechClient(speaker_name=args.speaker)
     buffer = TranscriptBuffer()
-    mic = MicCapture(speech_client)
+    # Imported here: app/ is importable only once the project root is on sys.path
+    from app.transcription.vad import VoiceActivityGate
+
+    vad = None if args.no_vad else VoiceActivityGate()
+    mic = MicCapture(speech_client, vad=vad)
     stop_event = asyncio.Event()
 
     mic.start()
@@ -314,8 +378,7 @@ async def run(args: argparse.Namespace) -> None:
     # End meeting
     print("\n[bot] Generating meeting minutes…")
     try:
-        minutes = api_post(api_base, f"/meetings/{meeting_id}/end")
-        print_minutes(minutes)
+        print_minutes(await end_meeting(api_base, meeting_id))
     except Exception as exc:
         print(f"[error] Failed to end meeting: {exc}")
 
@@ -9,6 +9,7 @@ Skipped automatically if MEETINGBOT_API_URL is not set or if Azure vars are miss
 from __future__ import annotations
 
 import os
+import time
 import uuid
 
 import httpx
@@ -93,16 +94,37 @@ def test_qa_with_transcript_context(meeting_session):
     assert "Alice" in result["answer"] or "summary" in result["answer"].lower()
 
 
+def _wait_for_end_job(status_url: str, timeout_s: float = 600.0) -> dict:
+    """Poll an end-of-meeting job until it succeeds or fails."""
+    deadline = time.monotonic() + timeout_s
+    while True:
+        job = _api(status_url, method="GET")
+        if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(2.0)
+
+
 @pytest.mark.integration
-def test_end_meeting_returns_minutes(meeting_session):
-    """POST /meetings/{id}/end returns a MeetingMinutes object."""
+def test_end_meeting_runs_a_job_that_produces_minutes(meeting_session):
+    """POST /meetings/{id}/end returns 202 with a job; the finished job holds the minutes."""
     meeting_id = meeting_session["meeting_id"]
-    minutes = _api(f"/meetings/{meeting_id}/end")
-
+    resp = httpx.post(f"{API_BASE}/meetings/{meeting_id}/end", timeout=60.0)
+    assert resp.status_code == 202
+    accepted = resp.json()
+    assert accepted["status"] in ("queued", "running", "succeeded")
+    assert accepted["status_url"] == f"/meetings/{meeting_id}/end/status"
+
+    job = _wait_for_end_job(accepted["status_url"])
+    assert job["id"] == accepted["job_id"]
+    assert job["status"] == "succeeded", job.get("error")
+    assert {stage["name"] for stage in job["stages"]} >= {"minutes", "planner", "persist"}
+
+    minutes = job["result"]
     assert minutes.get("meeting_id") == meeting_id
     assert "summary" in minutes
     assert isinstance(minutes.get("action_items"), list)
     assert isinstance(minutes.get("key_decisions"), list)
+    assert _api(f"/meetings/{meeting_id}/minutes", method="GET")["meeting_id"] == meeting_id
 
     # At least one action item should reference Alice and the report
     action_titles = [item.get("title", "") for item in minutes["action_items"]]
@@ -113,17 +135,18 @@ def test_end_meeting_returns_minutes(meeting_session):
 
 
 @pytest.mark.integration
-def test_ended_meeting_is_not_active():
-    """A second /end call on the same meeting should return 404 or 409."""
-    # Create a fresh short-lived meeting and end it twice
+def test_ending_a_meeting_twice_returns_the_same_job():
+    """A second /end call on the same meeting returns the job the first one started."""
     session = _api(
         "/meetings",
         json={"title": "End-twice test", "participants": []},
     )
     mid = session["meeting_id"]
-    _api(f"/meetings/{mid}/end")
-
-    with pytest.raises(httpx.HTTPStatusError) as exc_info:
-        _api(f"/meetings/{mid}/end")
-
-    assert exc_info.value.response.status_code in (404, 409, 400)
+    first = _api(f"/meetings/{mid}/end")
+    second = _api(f"/meetings/{mid}/end")
+    assert second["job_id"] == first["job_id"]
+
+    job = _wait_for_end_job(first["status_url"])
+    assert job["status"] == "succeeded", job.get("error")
+    # Still the same job once it has finished
+    assert _api(f"/meetings/{mid}/end")["job_id"] == first["job_id"]
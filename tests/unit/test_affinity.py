@@ -0,0 +1,157 @@
+"""Unit tests for the consistent-hash ring and meeting affinity routing."""
+from __future__ import annotations
+
+import uuid
+
+import httpx
+import pytest
+
+from app.state.affinity import (
+    FORWARDED_HEADER,
+    AffinityRouter,
+    HashRing,
+    MeetingAffinityMiddleware,
+    RedisMembership,
+    StaticMembership,
+)
+
+_KEYS = [str(uuid.UUID(int=i)) for i in range(3000)]
+
+
+def test_ring_spreads_keys_across_nodes():
+    ring = HashRing(["http://a", "http://b", "http://c"])
+    counts = {}
+    for key in _KEYS:
+        counts[ring.owner(key)] = counts.get(ring.owner(key), 0) + 1
+    assert set(counts) == {"http://a", "http://b", "http://c"}
+    assert all(600 < n < 1400 for n in counts.values())
+
+
+def test_adding_a_node_only_moves_keys_to_it():
+    ring = HashRing(["http://a", "http://b", "http://c"])
+    before = {key: ring.owner(key) for key in _KEYS}
+    assert ring.set_nodes(["http://a", "http://b", "http://c", "http://d"]) is True
+    moved = [key for key in _KEYS if ring.owner(key) != before[key]]
+    assert all(ring.owner(key) == "http://d" for key in moved)
+    assert 400 < len(moved) < 1200  # about a quarter
+    assert ring.set_nodes(["http://d", "http://c", "http://b", "http://a"]) is False
+
+
+def test_empty_ring_has_no_owner():
+    assert HashRing().owner("m1") is None
+
+
+def test_router_rebalances_on_membership_change():
+    membership = StaticMembership(["http://b"])
+    calls = []
+    router = AffinityRouter("http://a/", membership, on_rebalance=calls.append)
+    assert router.refresh() is True
+    assert router.ring.nodes == {"http://a", "http://b"}
+    assert router.refresh() is False
+    membership.leave("http://b")
+    assert router.refresh() is True
+    assert all(router.is_local(key) for key in _KEYS[:50])
+    assert len(calls) == 2 and calls[-1]("m1") is True
+
+
+class _HashClient:
+    """Stands in for RespClient with just the hash commands RedisMembership uses."""
+
+    def __init__(self) -> None:
+        self.hash: dict[bytes, bytes] = {}
+
+    def execute(self, cmd: str, key: str, *args: str):
+        if cmd == "HSET":
+            self.hash[args[0].encode()] = args[1].encode()
+        elif cmd == "HDEL":
+            self.hash.pop(args[0].encode(), None)
+        elif cmd == "HGETALL":
+            return [item for pair in self.hash.items() for item in pair]
+
+
+def test_redis_membership_expires_silent_nodes():
+    client = _HashClient()
+    membership = RedisMembership(client, ttl_s=15.0)
+    membership.join("http://a")
+    membership.join("http://b")
+    client.hash[b"http://c"] = b"0.000"  # last heartbeat long ago
+    assert membership.members() == {"http://a", "http://b"}
+    membership.leave("http://b")
+    assert membership.members() == {"http://a"}
+
+
+def _echo_app(name: str):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        forwarded = dict(scope["headers"]).get(FORWARDED_HEADER, b"")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"x-served-by", name.encode()), (b"x-forwarded-from", forwarded)],
+        })
+        await send({"type": "http.response.body", "body": body or scope["path"].encode()})
+
+    return app
+
+
+@pytest.fixture
+def router():
+    router = AffinityRouter("http://a", StaticMembership(["http://b"]))
+    router.refresh()
+    return router
+
+
+def _owned_by(router: AffinityRouter, node: str) -> str:
+    return next(key for key in _KEYS if router.owner(key) == node)
+
+
+async def _client(router, upstream: httpx.AsyncBaseTransport) -> httpx.AsyncClient:
+    middleware = MeetingAffinityMiddleware(
+        _echo_app("a"), lambda: router, client=httpx.AsyncClient(transport=upstream)
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://a")
+
+
+async def test_middleware_forwards_to_owner(router):
+    client = await _client(router, httpx.ASGITransport(app=_echo_app("b")))
+    remote = _owned_by(router, "http://b")
+    resp = await client.post(f"/meetings/{remote}/transcript?x=1", content=b"payload")
+    assert resp.headers["x-served-by"] == "b"
+    assert resp.headers["x-forwarded-from"] == "http://a"
+    assert resp.content == b"payload"
+
+    local = _owned_by(router, "http://a")
+    resp = await client.get(f"/meetings/{local}/transcript")
+    assert resp.headers["x-served-by"] == "a"
+    resp = await client.get("/health")
+    assert resp.headers["x-served-by"] == "a"
+
+
+async def test_middleware_serves_already_forwarded_requests_locally(router):
+    client = await _client(router, httpx.ASGITransport(app=_echo_app("b")))
+    remote = _owned_by(router, "http://b")
+    resp = await client.get(
+        f"/meetings/{remote}/transcript", headers={FORWARDED_HEADER.decode(): "http://b"}
+    )
+    assert resp.headers["x-served-by"] == "a"
+
+
+async def test_middleware_returns_502_when_owner_is_down(router):
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = await _client(router, httpx.MockTransport(refuse))
+    resp = await client.get(f"/meetings/{_owned_by(router, 'http://b')}/transcript")
+    assert resp.status_code == 502
+
+
+async def test_middleware_is_transparent_without_router():
+    middleware = MeetingAffinityMiddleware(_echo_app("a"), lambda: None)
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://a")
+    resp = await client.get("/meetings/m1/transcript")
+    assert resp.headers["x-served-by"] == "a"
@@ -0,0 +1,124 @@
+"""Unit tests for the per-meeting semantic QA answer cache."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.agents import qa_agent
+from app.agents.answer_cache import SemanticAnswerCache
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+# Stand-in embeddings: paraphrases share a direction, other topics are orthogonal
+_VECTORS = {
+    "when is the deadline": [1.0, 0.0, 0.0],
+    "bila deadline?": [0.98, 0.2, 0.0],
+    "what is the budget": [0.0, 0.0, 1.0],
+    "who owns the launch": [0.0, 1.0, 0.0],
+}
+
+
+async def _embed(text: str) -> list[float]:
+    return _VECTORS[text]
+
+
+@pytest.fixture
+def cache():
+    return SemanticAnswerCache(_embed, similarity=0.9)
+
+
+@pytest.fixture
+def buffer():
+    buf = TranscriptBuffer()
+    buf.append(TranscriptEntry(speaker="Alice", text="The deadline is Friday."))
+    return buf
+
+
+async def _store(cache, buffer, question, answer, meeting_id="m1"):
+    vector = await cache.embed(question)
+    cache.store(meeting_id, question, vector, answer, buffer, buffer.last_seq)
+
+
+async def test_paraphrase_hits_and_other_questions_miss(cache, buffer):
+    await _store(cache, buffer, "when is the deadline", "Friday.")
+
+    assert cache.lookup("m1", await cache.embed("bila deadline?"), buffer) == "Friday."
+    assert cache.lookup("m1", await cache.embed("what is the budget"), buffer) is None
+    assert cache.lookup("m2", await cache.embed("when is the deadline"), buffer) is None
+    stats = cache.stats()
+    assert (stats["lookups"], stats["hits"], stats["hit_rate"]) == (3, 1, 0.333)
+
+
+async def test_relevant_new_transcript_entry_invalidates(cache, buffer):
+    await _store(cache, buffer, "when is the deadline", "Friday.")
+    await _store(cache, buffer, "what is the budget", "RM 50k.")
+
+    buffer.append(TranscriptEntry(speaker="Bob", text="Lunch is here lah."))
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) == "Friday."
+
+    buffer.append(TranscriptEntry(speaker="Bob", text="Deadline moved to Monday."))
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) is None
+    assert cache.lookup("m1", await cache.embed("what is the budget"), buffer) == "RM 50k."
+    assert cache.stats()["invalidations"] == 1
+
+
+async def test_entry_said_while_answering_is_not_missed(cache, buffer):
+    await _store(cache, buffer, "what is the budget", "RM 50k.")
+    seq_at_start = buffer.last_seq
+    buffer.append(TranscriptEntry(speaker="Bob", text="The deadline is now Monday."))
+    # Another lookup checks the new entry before the deadline answer is stored
+    cache.lookup("m1", await cache.embed("what is the budget"), buffer)
+
+    vector = await cache.embed("when is the deadline")
+    cache.store("m1", "when is the deadline", vector, "Friday.", buffer, seq_at_start)
+    assert cache.lookup("m1", vector, buffer) is None
+
+
+async def test_document_invalidation_and_ttl(cache, buffer):
+    await _store(cache, buffer, "when is the deadline", "Friday.")
+    cache.invalidate("m1")
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) is None
+
+    cache.ttl_s = 0.0
+    await _store(cache, buffer, "when is the deadline", "Friday.")
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) is None
+
+
+async def test_lru_eviction_per_meeting_and_across_meetings(buffer):
+    cache = SemanticAnswerCache(_embed, max_entries=2, max_meetings=2)
+    await _store(cache, buffer, "when is the deadline", "Friday.")
+    await _store(cache, buffer, "what is the budget", "RM 50k.")
+    # Touch the deadline answer so the budget answer is least recently used
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer)
+    await _store(cache, buffer, "who owns the launch", "Aisyah.")
+    assert cache.lookup("m1", await cache.embed("what is the budget"), buffer) is None
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) == "Friday."
+
+    await _store(cache, buffer, "when is the deadline", "Next week.", meeting_id="m2")
+    await _store(cache, buffer, "when is the deadline", "Tomorrow.", meeting_id="m3")
+    assert cache.lookup("m1", await cache.embed("when is the deadline"), buffer) is None
+    assert cache.stats()["meetings"] == 2 and cache.stats()["evictions"] == 3
+
+
+async def test_answer_cached_skips_agent_on_hit(cache, buffer):
+    coalesced = AsyncMock(return_value="Friday.")
+    with (
+        patch.object(qa_agent, "get_answer_cache", return_value=cache),
+        patch.object(qa_agent, "answer_coalesced", coalesced),
+    ):
+        first = await qa_agent.answer_cached("when is the deadline", "m1", "c1", buffer)
+        second = await qa_agent.answer_cached("bila deadline?", "m1", "c2", buffer)
+    assert first == second == "Friday."
+    assert coalesced.await_count == 1
+
+
+async def test_answer_cached_falls_through_when_embedding_fails(buffer):
+    cache = SemanticAnswerCache(AsyncMock(side_effect=NotImplementedError))
+    coalesced = AsyncMock(return_value="Friday.")
+    with (
+        patch.object(qa_agent, "get_answer_cache", return_value=cache),
+        patch.object(qa_agent, "answer_coalesced", coalesced),
+    ):
+        assert await qa_agent.answer_cached("when is the deadline", "m1", "c1", buffer) == "Friday."
+    assert cache.stats()["entries"] == 0
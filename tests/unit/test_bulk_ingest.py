@@ -0,0 +1,121 @@
+"""Unit tests for bulk transcript ingestion (NDJSON and columnar payloads)."""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.state.base import InProcessStore
+from app.transcription.bulk import BulkFormatError, parse_columnar, parse_ndjson
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.wal import GroupCommitter, TranscriptWAL, wal_path
+
+
+def _ndjson(*records: dict) -> bytes:
+    return "\n".join(json.dumps(r) for r in records).encode()
+
+
+def test_ndjson_lines_become_entries():
+    body = _ndjson(
+        {"speaker": "Aisyah", "text": "Boleh kita mula?", "language": "ms-MY"},
+        {"speaker": "Ben", "text": "Sure", "timestamp": "2025-03-01T09:00:05+00:00"},
+    ) + b"\n\n"
+    entries = parse_ndjson(body)
+    assert [(e.speaker, e.text, e.language) for e in entries] == [
+        ("Aisyah", "Boleh kita mula?", "ms-MY"),
+        ("Ben", "Sure", "en-US"),
+    ]
+    assert entries[1].timestamp == datetime(2025, 3, 1, 9, 0, 5, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (b'{"speaker": "A", "text": "ok"}\n{"speaker": "B", "text": ', "line 2: invalid JSON"),
+        (b'{"speaker": "A", "text": "ok"}\n\n[1, 2]', "line 3: Input should be a valid dictionary"),
+        (b'{"speaker": "A", "text": "a"}, {"speaker": "B", "text": "b"}', "line 1: invalid JSON"),
+        (b'{"speaker": "A", "text": 5}', "line 1: text: Input should be a valid string"),
+        (b'{"speaker": "A", "text": "a", "timestamp": "soon"}', "line 1: timestamp: Input should be a valid datetime"),
+    ],
+)
+def test_ndjson_errors_name_the_line(body, message):
+    with pytest.raises(BulkFormatError, match=message):
+        parse_ndjson(body)
+
+
+def test_columnar_payload_becomes_entries():
+    body = json.dumps({
+        "speakers": ["Aisyah", "Ben"],
+        "speaker": [0, 1, 0],
+        "text": ["Hai semua", "Hi", "Jom mula"],
+        "language": ["ms-MY", "en-US", "ms-MY"],
+    }).encode()
+    entries = parse_columnar(body)
+    assert [(e.speaker, e.text, e.language) for e in entries] == [
+        ("Aisyah", "Hai semua", "ms-MY"),
+        ("Ben", "Hi", "en-US"),
+        ("Aisyah", "Jom mula", "ms-MY"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ([], "payload: Input should be an object"),
+        ({"speakers": ["A"], "speaker": [0, 0], "text": ["x"]}, "'speaker' has 2 values"),
+        ({"speakers": ["A"], "speaker": [1], "text": ["x"]}, "must be indexes into 'speakers'"),
+        ({"speakers": ["A"], "speaker": [0], "text": ["x"], "language": ["en", "ms"]},
+         "'language' has 2 values"),
+    ],
+)
+def test_columnar_errors(payload, message):
+    with pytest.raises(BulkFormatError, match=message):
+        parse_columnar(json.dumps(payload).encode())
+
+
+async def test_bulk_endpoint_appends_in_order_and_logs_one_batch(tmp_path):
+    from app import main
+
+    committer = GroupCommitter(interval_s=60)
+    path = wal_path(tmp_path, "m1")
+    store = InProcessStore()
+    store["m1"] = TranscriptBuffer(wal=TranscriptWAL(path, committer))
+    ndjson = _ndjson(*({"speaker": "A", "text": f"line {i}"} for i in range(3)))
+    columnar = {"speakers": ["B"], "speaker": [0, 0], "text": ["col 0", "col 1"]}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+    ) as client:
+        with patch.object(main, "_active_buffers", store):
+            first = await client.post(
+                "/meetings/m1/transcript/bulk",
+                content=ndjson,
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            second = await client.post("/meetings/m1/transcript/bulk", json=columnar)
+            bad = await client.post(
+                "/meetings/m1/transcript/bulk",
+                content=b"not json",
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            unsupported = await client.post(
+                "/meetings/m1/transcript/bulk",
+                content=b"x",
+                headers={"Content-Type": "text/plain"},
+            )
+            missing = await client.post("/meetings/nope/transcript/bulk", json=columnar)
+
+    assert first.json() == {"buffered": 3, "total": 3, "last_seq": 3}
+    assert second.json() == {"buffered": 2, "total": 5, "last_seq": 5}
+    assert bad.status_code == 422 and "line 1" in bad.json()["detail"]
+    assert unsupported.status_code == 415 and missing.status_code == 404
+
+    store["m1"].flush()
+    recovered = TranscriptBuffer(wal=TranscriptWAL(path, committer))
+    assert [e.text for e in recovered.snapshot()] == [
+        "line 0", "line 1", "line 2", "col 0", "col 1",
+    ]
+    committer.stop()
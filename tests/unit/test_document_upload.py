@@ -0,0 +1,207 @@
+"""Unit tests for streaming document upload (staged blocks) and spooled ingestion."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.jobs import ingest_document
+from app.models.job import Job
+from app.rag.ingest_pipeline import IngestProgress
+from app.storage.blob_client import stage_blocks
+
+
+class _Reader:
+    """Async reader over in-memory bytes, yielding to the loop on each read."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buf = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        await asyncio.sleep(0)
+        return self._buf.read(size)
+
+
+class _BlobClient:
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.blocks: dict[str, bytes] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._fail_on = fail_on
+
+    async def stage_block(self, block_id: str, data: bytes, length: int) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self._fail_on is not None and len(self.blocks) == self._fail_on:
+                raise OSError("connection reset")
+            assert length == len(data)
+            self.blocks[block_id] = data
+        finally:
+            self.in_flight -= 1
+
+
+async def test_stage_blocks_splits_stream_in_order_with_bounded_concurrency():
+    data = bytes(range(256)) * 41  # 10 496 bytes, last block partial
+    client = _BlobClient()
+    block_ids, size = await stage_blocks(client, _Reader(data), block_size=1024, concurrency=3)
+
+    assert size == len(data) and len(block_ids) == 11
+    assert len({len(b) for b in block_ids}) == 1  # Azure requires equal-length ids
+    assert [int(base64.b64decode(b)) for b in block_ids] == list(range(11))
+    assert b"".join(client.blocks[b] for b in block_ids) == data
+    assert 1 < client.max_in_flight <= 3
+
+
+async def test_stage_blocks_empty_stream():
+    assert await stage_blocks(_BlobClient(), _Reader(b""), block_size=1024) == ([], 0)
+
+
+async def test_stage_blocks_propagates_block_failure():
+    with pytest.raises(ExceptionGroup) as info:
+        await stage_blocks(_BlobClient(fail_on=2), _Reader(b"x" * 8192), block_size=1024)
+    assert info.group_contains(OSError)
+
+
+@pytest.fixture
+def job():
+    return Job(
+        kind=ingest_document.JOB_KIND,
+        meeting_id="m1",
+        payload=ingest_document.build_payload("m1/abc_deck.pdf", "deck.pdf"),
+    )
+
+
+def _blob_store(can_sign: bool) -> MagicMock:
+    store = MagicMock(can_sign=can_sign)
+    store.get_sas_url.return_value = "https://acct.blob.core.windows.net/docs/m1?sig"
+
+    async def download_to_file(blob_name, f):
+        f.write(b"%PDF-1.7 ...")
+        f.seek(0)
+        return 12
+
+    store.download_to_file = AsyncMock(side_effect=download_to_file)
+    return store
+
+
+@pytest.fixture
+def settings():
+    return MagicMock(doc_spool_max_mb=1, doc_ingest_queue_size=4, doc_ingest_batch_size=16)
+
+
+async def test_ingest_reads_document_from_sas_url(job, settings):
+    store = _blob_store(can_sign=True)
+    pipeline = AsyncMock(return_value=IngestProgress(pages_analyzed=3, chunks_indexed=7))
+    with (
+        patch.object(ingest_document, "get_blob_store", return_value=store),
+        patch.object(ingest_document, "get_settings", return_value=settings),
+        patch.object(ingest_document, "run_ingest_pipeline", pipeline),
+    ):
+        result = await ingest_document.run(job)
+
+    assert result == {"blob_name": "m1/abc_deck.pdf", "pages_analyzed": 3, "chunks_indexed": 7}
+    store.download_to_file.assert_not_awaited()
+    kwargs = pipeline.await_args.kwargs
+    assert kwargs["file_bytes"] is None and kwargs["url_source"].startswith("https://")
+    assert job.stages == []
+
+
+async def test_ingest_streams_blob_through_spooled_file(job, settings):
+    store = _blob_store(can_sign=False)
+    seen = {}
+
+    async def pipeline(file_bytes, **kwargs):
+        seen["content"] = file_bytes.read()
+        seen["url_source"] = kwargs["url_source"]
+        return IngestProgress()
+
+    with (
+        patch.object(ingest_document, "get_blob_store", return_value=store),
+        patch.object(ingest_document, "get_settings", return_value=settings),
+        patch.object(ingest_document, "run_ingest_pipeline", pipeline),
+    ):
+        await ingest_document.run(job)
+
+    assert seen == {"content": b"%PDF-1.7 ...", "url_source": None}
+    assert [s.name for s in job.stages] == ["download"]
+
+
+class _SessionStore:
+    """Cosmos stand-in for one session doc; etag-conditioned patches fail if it changed."""
+
+    def __init__(self, doc: dict) -> None:
+        self.doc = doc
+        self.patches: list[list[dict]] = []
+
+    async def get(self, container, item_id):
+        return dict(self.doc)
+
+    async def patch(self, container, item_id, operations, etag=None):
+        from app.storage.cosmos_client import CosmosAccessConditionFailedError
+
+        if etag is not None and etag != self.doc["_etag"]:
+            raise CosmosAccessConditionFailedError(message="Precondition Failed")
+        self.patches.append(operations)
+        for op in operations:
+            if op["path"] == "/documents":
+                self.doc["documents"] = op["value"]
+        self.doc["_etag"] = str(int(self.doc["_etag"]) + 1)
+
+
+async def test_documents_map_is_created_only_if_still_missing():
+    from app import main
+
+    store = _SessionStore({"id": "m1", "_etag": "1"})
+    stale = dict(store.doc)
+    # Another upload created the map (with its document) after our read
+    store.doc.update(documents={"d1": {"id": "d1"}}, _etag="2")
+    await main._ensure_documents_map(store, "m1", stale)
+    assert store.doc["documents"] == {"d1": {"id": "d1"}} and store.patches == []
+
+    fresh = _SessionStore({"id": "m2", "_etag": "5"})
+    await main._ensure_documents_map(fresh, "m2", dict(fresh.doc))
+    assert fresh.doc["documents"] == {}
+
+
+async def test_upload_idempotency_key_is_scoped_to_the_meeting():
+    from app import main
+
+    store = AsyncMock()
+    store.get.side_effect = lambda container, item_id: (
+        {"id": item_id, "_etag": "1", "documents": {}} if item_id == "m2" else None
+    )
+    blob_store = MagicMock()
+    blob_store.upload_stream = AsyncMock(return_value=("m2/doc/a.pdf", 3))
+    # m1 already used the key for its own upload
+    earlier = Job(kind=ingest_document.JOB_KIND, meeting_id="m1", payload={"blob_name": "m1/x"})
+    m1_key = ingest_document.idempotency_key("m1", "k")
+    find_job = AsyncMock(side_effect=lambda key: earlier if key == m1_key else None)
+    submit_job = AsyncMock(return_value=Job(kind=ingest_document.JOB_KIND, meeting_id="m2"))
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+    ) as client:
+        with (
+            patch.object(main, "get_cosmos_store", return_value=store),
+            patch.object(main, "get_blob_store", return_value=blob_store),
+            patch.object(main, "_warm", AsyncMock()),
+            patch.object(main, "_find_job", find_job),
+            patch.object(main, "_submit_job", submit_job),
+        ):
+            headers = {"Idempotency-Key": "k"}
+            files = {"file": ("a.pdf", b"pdf")}
+            missing = await client.post("/meetings/nope/documents", files=files, headers=headers)
+            other = await client.post("/meetings/m2/documents", files=files, headers=headers)
+
+    # The session check runs before the key is looked up
+    assert missing.status_code == 404
+    assert [c.args[0] for c in find_job.await_args_list] == ["ingest_document:m2:k"]
+    # Another meeting's upload under the same key is not returned
+    assert other.status_code == 202 and other.json()["blob_name"] == "m2/doc/a.pdf"
+    assert submit_job.await_args.args[3] == "ingest_document:m2:k"
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+
+def _entry(text: str) -> TranscriptEntry:
+    return TranscriptEntry(speaker="Alice", text=text)
+
+
+async def test_subscriber_receives_each_append_once():
+    buf = TranscriptBuffer()
+    buf.append(_entry("before"))
+    sub = buf.subscribe()
+    buf.append(_entry("one"))
+    buf.append(_entry("two"))
+    events, dropped = await sub.get(timeout=1)
+    assert [(e.seq, e.entry.text) for e in events] == [(2, "one"), (3, "two")]
+    assert dropped == 0
+    assert await sub.get(timeout=0.01) == ([], 0)
+    sub.close()
+
+
+async def test_event_json_is_shared_across_subscribers():
+    buf = TranscriptBuffer()
+    a, b = buf.subscribe(), buf.subscribe()
+    buf.append(_entry("hello"))
+    (ea,), _ = await a.get(timeout=1)
+    (eb,), _ = await b.get(timeout=1)
+    assert ea is eb
+    assert '"seq": 1' in ea.json() and '"text": "hello"' in ea.json()
+
+
+async def test_slow_subscriber_drops_oldest_without_blocking():
+    buf = TranscriptBuffer()
+    slow = buf.subscribe(maxsize=3)
+    fast = buf.subscribe()
+    for i in range(10):
+        buf.append(_entry(f"line {i}"))
+    events, dropped = await slow.get(timeout=1)
+    assert [e.seq for e in events] == [8, 9, 10]
+    assert dropped == 7
+    # The gap can be backfilled from the buffer itself
+    assert [seq for seq, _ in buf.since(0, limit=7)] == list(range(1, 8))
+    events, dropped = await fast.get(timeout=1)
+    assert len(events) == 10 and dropped == 0
+
+
+async def test_append_from_another_thread_wakes_subscriber():
+    buf = TranscriptBuffer()
+    sub = buf.subscribe()
+    threading.Timer(0.05, buf.append, args=(_entry("from thread"),)).start()
+    events, _ = await sub.get(timeout=2)
+    assert [e.entry.text for e in events] == ["from thread"]
+
+
+async def test_close_ends_subscriptions():
+    buf = TranscriptBuffer()
+    sub = buf.subscribe()
+    waiter = asyncio.ensure_future(sub.get())
+    await asyncio.sleep(0)
+    buf.close()
+    assert await asyncio.wait_for(waiter, 1) == ([], 0)
+    assert sub.closed
+
+
+async def test_unsubscribed_buffer_skips_publish():
+    buf = TranscriptBuffer()
+    sub = buf.subscribe()
+    sub.close()
+    buf.append(_entry("nobody listening"))
+    assert len(buf._fanout) == 0
+
+
+async def test_wakeups_fire_after_the_buffer_lock_is_released(monkeypatch):
+    buf = TranscriptBuffer()
+    sub = buf.subscribe()
+    held = []
+    wake = type(sub)._wake
+    monkeypatch.setattr(type(sub), "_wake", lambda s: (held.append(buf._lock.locked()), wake(s)))
+    buf.append(_entry("one"))
+    buf.extend([_entry("two"), _entry("three")])
+    assert held == [False, False]
+    events, _ = await sub.get(timeout=1)
+    assert [e.seq for e in events] == [1, 2, 3]
+
+
+async def test_subscriber_on_a_closed_loop_is_dropped():
+    buf = TranscriptBuffer()
+    live = buf.subscribe()
+    subs = []
+
+    async def subscribe():
+        subs.append(buf.subscribe())
+
+    def other_loop():
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(subscribe())
+        loop.close()
+
+    thread = threading.Thread(target=other_loop)
+    thread.start()
+    thread.join()
+    assert len(buf._fanout) == 2
+    buf.append(_entry("still delivered"))
+    assert len(buf._fanout) == 1
+    assert subs[0].closed
+    events, _ = await live.get(timeout=1)
+    assert [e.entry.text for e in events] == ["still delivered"]
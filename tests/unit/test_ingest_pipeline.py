@@ -0,0 +1,167 @@
+"""Unit tests for the staged document ingestion pipeline and its progress reporting."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.jobs import ingest_document
+from app.models.job import Job
+from app.rag import ingest_pipeline
+from app.rag.document_processor import DocumentChunk
+from app.rag.ingest_pipeline import run_ingest_pipeline
+
+
+def _chunk_page(text, source, meeting_id, page, doc_type):
+    # Two chunks per page
+    return [
+        DocumentChunk(text=f"{text}/{i}", source=source, page=page, chunk_index=i,
+                      meeting_id=meeting_id, doc_type=doc_type)
+        for i in range(2)
+    ]
+
+
+def _analyzer(n_pages: int):
+    async def analyze(file_bytes, url_source=None):
+        for page in range(1, n_pages + 1):
+            await asyncio.sleep(0)
+            yield page, f"p{page}"
+
+    return analyze
+
+
+@pytest.fixture
+def indexed():
+    return []
+
+
+@pytest.fixture
+def stubs(indexed):
+    async def embed(chunks):
+        return [[float(len(c.text))] for c in chunks]
+
+    async def index(chunks, embeddings):
+        assert len(chunks) == len(embeddings)
+        indexed.append([c.text for c in chunks])
+
+    with (
+        patch.object(ingest_pipeline, "analyze_document", _analyzer(5)),
+        patch.object(ingest_pipeline, "chunk_page", _chunk_page),
+        patch.object(ingest_pipeline, "embed_chunks", embed),
+        patch.object(ingest_pipeline, "index_chunks", index),
+    ):
+        yield
+
+
+async def test_pipeline_indexes_every_chunk_in_order(stubs, indexed):
+    stages, reports = [], []
+
+    def track(name):
+        stages.append(name)
+        return contextlib.nullcontext()
+
+    async def on_progress(progress):
+        reports.append((progress.pages_analyzed, progress.chunks_indexed))
+
+    progress = await run_ingest_pipeline(
+        b"%PDF", "deck.pdf", "m1", on_progress=on_progress, track=track, batch_size=4
+    )
+
+    assert [len(batch) for batch in indexed] == [4, 4, 2]
+    assert [t for batch in indexed for t in batch][:3] == ["p1/0", "p1/1", "p2/0"]
+    assert (progress.pages_analyzed, progress.chunks_total, progress.chunks_indexed) == (5, 10, 10)
+    assert sorted(stages) == ["analyze", "chunk", "embed", "index"]
+    assert reports[-1] == (5, 10)
+
+
+async def test_pipeline_backpressure_bounds_analysis_ahead_of_indexing(stubs, indexed):
+    release = asyncio.Event()
+    seen = {}
+
+    async def slow_index(chunks, embeddings):
+        await release.wait()
+        indexed.append(chunks)
+
+    async def on_progress(progress):
+        seen["progress"] = progress
+
+    with (
+        patch.object(ingest_pipeline, "analyze_document", _analyzer(100)),
+        patch.object(ingest_pipeline, "index_chunks", slow_index),
+    ):
+        task = asyncio.create_task(run_ingest_pipeline(
+            b"", "deck.pdf", "m1", on_progress=on_progress, queue_size=1, batch_size=2
+        ))
+        for _ in range(100):
+            await asyncio.sleep(0)
+        # One page per batch: a few held by stages and queues, not all 100
+        assert 0 < seen["progress"].pages_analyzed <= 8
+        release.set()
+        progress = await task
+    assert progress.chunks_indexed == 200
+
+
+async def test_pipeline_stage_failure_cancels_the_rest(stubs):
+    async def broken_embed(chunks):
+        raise RuntimeError("embedding quota exceeded")
+
+    with patch.object(ingest_pipeline, "embed_chunks", broken_embed):
+        with pytest.raises(ExceptionGroup) as info:
+            await run_ingest_pipeline(b"", "deck.pdf", "m1")
+    assert info.group_contains(RuntimeError, match="quota")
+
+
+def _job(document_id: str | None = "doc1") -> Job:
+    return Job(
+        kind=ingest_document.JOB_KIND,
+        meeting_id="m1",
+        payload=ingest_document.build_payload("m1/doc1_deck.pdf", "deck.pdf", document_id),
+    )
+
+
+@pytest.fixture
+def cosmos():
+    store = MagicMock(patch=AsyncMock())
+    settings = MagicMock(doc_spool_max_mb=1, doc_ingest_queue_size=4, doc_ingest_batch_size=16)
+    blob_store = MagicMock(can_sign=True)
+    blob_store.get_sas_url.return_value = "https://acct.blob.core.windows.net/docs/m1?sig"
+    with (
+        patch.object(ingest_document, "get_cosmos_store", return_value=store),
+        patch.object(ingest_document, "get_settings", return_value=settings),
+        patch.object(ingest_document, "get_blob_store", return_value=blob_store),
+    ):
+        yield store
+
+
+def _written(store) -> list[dict]:
+    return [call.args[2][0]["value"] for call in store.patch.await_args_list]
+
+
+async def test_job_reports_document_progress_to_session(stubs, cosmos):
+    job = _job()
+    result = await ingest_document.run(job)
+
+    writes = _written(cosmos)
+    assert cosmos.patch.await_args.args[2][0]["path"] == "/documents/doc1"
+    assert writes[0]["status"] == "processing"
+    assert writes[-1]["status"] == "ready" and writes[-1]["chunks_indexed"] == 10
+    assert writes[-1]["job_id"] == job.id
+    # Throttled: a 5-page document doesn't write once per page
+    assert len(writes) < 5
+    assert result["chunks_indexed"] == 10
+    assert {s.name for s in job.stages} == {"analyze", "chunk", "embed", "index"}
+
+
+async def test_job_reports_failure_to_session(stubs, cosmos):
+    with patch.object(ingest_pipeline, "embed_chunks", AsyncMock(side_effect=RuntimeError("429"))):
+        with pytest.raises(ExceptionGroup):
+            await ingest_document.run(_job())
+    last = _written(cosmos)[-1]
+    assert (last["status"], last["error"]) == ("failed", "429")
+
+
+async def test_job_without_document_id_skips_session_updates(stubs, cosmos):
+    await ingest_document.run(_job(document_id=None))
+    cosmos.patch.assert_not_awaited()
@@ -0,0 +1,137 @@
+"""Unit tests for the SQLite job queue and the standalone worker."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.jobs.queue import JobQueue
+from app.jobs.runner import stage
+from app.jobs.worker import Worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = JobQueue(tmp_path / "jobs.db")
+    yield q
+    q.close()
+
+
+def test_enqueue_is_idempotent(queue):
+    first = queue.enqueue("demo", "m1", {"n": 1}, idempotency_key="k1")
+    again = queue.enqueue("demo", "m1", {"n": 2}, idempotency_key="k1")
+    assert again.id == first.id
+    assert again.payload == {"n": 1}
+    assert queue.latest("demo", "m1").id == first.id
+
+
+def test_claim_leases_each_job_once(queue, tmp_path):
+    job = queue.enqueue("demo", "m1", {})
+    other = JobQueue(tmp_path / "jobs.db")  # e.g. a second worker process
+    claimed = queue.claim("w1")
+    assert claimed.id == job.id and claimed.status == "running" and claimed.attempts == 1
+    assert other.claim("w2") is None
+    other.close()
+
+
+def test_claim_filters_by_kind(queue):
+    queue.enqueue("other", "m1", {})
+    assert queue.claim("w1", kinds=["demo"]) is None
+    assert queue.claim("w1", kinds=["other"]) is not None
+
+
+def test_failed_attempt_is_retried_with_backoff(queue):
+    queue.enqueue("demo", "m1", {}, max_attempts=2)
+    job = queue.claim("w1")
+    job.checkpoint["step"] = "done"
+    assert queue.fail(job, "boom", "w1", backoff_s=60) is True
+    assert queue.claim("w1") is None  # not due yet
+    stored = queue.get(job.id)
+    assert stored.status == "queued" and stored.error == "boom"
+    assert stored.checkpoint == {"step": "done"}
+
+    queue.fail(job, "boom", "w1", backoff_s=0)  # not ours any more: ignored
+    queue._conn.execute("UPDATE jobs SET run_after = 0")
+    job = queue.claim("w1")
+    assert job.attempts == 2
+    assert queue.fail(job, "boom again", "w1") is False
+    assert queue.get(job.id).status == "failed"
+
+
+def test_permanently_failed_job_is_requeued_by_same_key(queue):
+    queue.enqueue("demo", "m1", {"n": 1}, idempotency_key="k1", max_attempts=1)
+    job = queue.claim("w1")
+    queue.fail(job, "boom", "w1")
+    again = queue.enqueue("demo", "m1", {"n": 2}, idempotency_key="k1")
+    assert again.id == job.id and again.status == "queued" and again.attempts == 0
+    assert again.payload == {"n": 1}
+
+
+def test_expired_lease_is_reclaimed(queue):
+    queue.enqueue("demo", "m1", {}, max_attempts=2)
+    job = queue.claim("w1", lease_s=-1)  # worker "died" immediately
+    reclaimed = queue.claim("w2")
+    assert reclaimed.id == job.id and reclaimed.attempts == 2
+    assert queue.heartbeat(job, "w1") is False
+    assert queue.heartbeat(reclaimed, "w2") is True
+
+
+def test_expired_lease_on_last_attempt_fails_job(queue):
+    queue.enqueue("demo", "m1", {}, max_attempts=1)
+    job = queue.claim("w1", lease_s=-1)
+    assert queue.claim("w2") is None
+    assert queue.get(job.id).status == "failed"
+
+
+async def test_worker_runs_jobs_and_records_results(queue):
+    calls = []
+
+    async def handler(job):
+        async with stage(job, "work"):
+            calls.append(job.payload["n"])
+            if job.payload["n"] == 2 and job.attempts == 1:
+                raise RuntimeError("transient")
+        return {"n": job.payload["n"]}
+
+    ids = [queue.enqueue("demo", f"m{n}", {"n": n}).id for n in range(3)]
+    worker = Worker(queue, concurrency=2, backoff_s=0, poll_interval_s=0.01)
+    with patch.dict("app.jobs.worker.HANDLERS", {"demo": handler}, clear=True):
+        task = asyncio.create_task(worker.run())
+        for _ in range(200):
+            if all(queue.get(i).status == "succeeded" for i in ids):
+                break
+            await asyncio.sleep(0.01)
+        worker.stop()
+        await asyncio.wait_for(task, 2)
+
+    jobs = [queue.get(i) for i in ids]
+    assert [j.result for j in jobs] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert jobs[2].attempts == 2
+    assert [s.status for s in jobs[2].stages] == ["failed", "succeeded"]
+    assert sorted(calls) == [0, 1, 2, 2]
+
+
+async def test_worker_stopped_while_slots_are_busy_claims_nothing_more(queue):
+    release = asyncio.Event()
+
+    async def handler(job):
+        await release.wait()
+        return {"n": job.payload["n"]}
+
+    first = queue.enqueue("demo", "m1", {"n": 0})
+    worker = Worker(queue, concurrency=1, backoff_s=0, poll_interval_s=0.01)
+    with patch.dict("app.jobs.worker.HANDLERS", {"demo": handler}, clear=True):
+        task = asyncio.create_task(worker.run())
+        for _ in range(200):
+            if queue.get(first.id).status == "running":
+                break
+            await asyncio.sleep(0.01)
+        # Queued while the only slot is busy, then the worker is stopped
+        second = queue.enqueue("demo", "m2", {"n": 1})
+        worker.stop()
+        release.set()
+        await asyncio.wait_for(task, 2)
+
+    assert queue.get(first.id).status == "succeeded"
+    assert queue.get(second.id).status == "queued"
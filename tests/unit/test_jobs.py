@@ -0,0 +1,265 @@
+"""Unit tests for the background job runner and the end-of-meeting pipeline."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.agents import minutes_agent
+from app.jobs.end_meeting import finalize_meeting
+from app.jobs.runner import JobRunner, stage
+from app.models.job import Job
+from app.models.minutes import ActionItem, MeetingMinutes
+from app.models.session import DocumentStatus, MeetingSession
+from app.storage.cosmos_client import CosmosAccessConditionFailedError
+
+
+@pytest.fixture
+def session():
+    return MeetingSession(id="test-meeting-123", title="Q3 Planning", participants=["Alice"])
+
+
+@pytest.fixture
+def minutes():
+    return MeetingMinutes(
+        meeting_id="test-meeting-123",
+        title="Q3 Planning",
+        summary="Mobile first.",
+        action_items=[ActionItem(title="Draft roadmap", pic="Alice")],
+    )
+
+
+def _store() -> AsyncMock:
+    """A Cosmos store mock whose session reads return a stored session."""
+    store = AsyncMock()
+    store.get.return_value = {"id": "test-meeting-123", "_etag": "1"}
+    return store
+
+
+async def _wait(job: Job) -> Job:
+    while job.status in ("queued", "running"):
+        await asyncio.sleep(0.01)
+    return job
+
+
+async def test_runner_returns_before_job_finishes():
+    release = asyncio.Event()
+
+    async def work(job):
+        await release.wait()
+        return {"ok": True}
+
+    runner = JobRunner()
+    job = runner.submit("demo", "m1", work)
+    await asyncio.sleep(0)
+    assert job.status == "running"
+    assert runner.latest("demo", "m1") is job
+    release.set()
+    await _wait(job)
+    assert job.status == "succeeded" and job.result == {"ok": True}
+    assert job.finished_at is not None
+
+
+async def test_runner_records_failure_and_stages():
+    async def work(job):
+        async with stage(job, "optional", required=False):
+            raise RuntimeError("flaky")
+        async with stage(job, "required"):
+            raise ValueError("boom")
+
+    runner = JobRunner()
+    job = await _wait(runner.submit("demo", "m1", work))
+    assert job.status == "failed" and job.error == "boom"
+    assert [(s.name, s.status) for s in job.stages] == [
+        ("optional", "failed"),
+        ("required", "failed"),
+    ]
+
+
+async def test_runner_forgets_oldest_finished_jobs():
+    async def work(job):
+        return None
+
+    runner = JobRunner(history=2)
+    jobs = [runner.submit("demo", f"m{i}", work) for i in range(3)]
+    for job in jobs:
+        await _wait(job)
+    runner.submit("demo", "m3", work)
+    assert runner.get(jobs[0].id) is None
+    assert runner.latest("demo", "m0") is None
+
+
+async def test_shutdown_cancels_jobs_past_timeout():
+    async def work(job):
+        await asyncio.sleep(60)
+
+    runner = JobRunner()
+    job = runner.submit("demo", "m1", work)
+    await runner.shutdown(timeout=0.01)
+    assert job.status == "failed" and job.error == "cancelled"
+
+
+async def test_finalize_meeting_runs_upload_and_planner_concurrently(session, minutes):
+    both_started = asyncio.Barrier(2)
+    store = _store()
+
+    async def upload(m):
+        await both_started.wait()
+        return "https://sharepoint/minutes.docx"
+
+    async def assign(m):
+        await both_started.wait()
+        m.action_items[0].planner_task_id = "task-1"
+        return m
+
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=store),
+        patch.object(minutes_agent, "generate_minutes", AsyncMock(return_value=minutes)),
+        patch("app.jobs.end_meeting.upload_minutes", upload),
+        patch("app.jobs.end_meeting.task_agent.assign_tasks", assign),
+    ):
+        job = Job(kind="end_meeting", meeting_id=session.id)
+        result = await asyncio.wait_for(finalize_meeting(job, session, None), timeout=2)
+
+    assert result["sharepoint_url"] == "https://sharepoint/minutes.docx"
+    assert result["action_items"][0]["planner_task_id"] == "task-1"
+    assert session.status == "ended"
+    assert store.upsert.await_count == 1  # the minutes; the session is patched
+    assert store.patch.await_count == 1
+    assert [s.status for s in job.stages] == ["succeeded"] * 4
+
+
+async def test_finalize_meeting_patches_only_end_fields_of_the_session(session, minutes):
+    # An ingestion job has patched a document's status since the session was built
+    stored = session.model_dump(mode="json")
+    stored["documents"] = {
+        "d1": DocumentStatus(id="d1", filename="a.pdf", blob_name="b", status="ready").model_dump(
+            mode="json"
+        )
+    }
+    store = AsyncMock()
+    store.get.side_effect = [{**stored, "_etag": "1"}, {**stored, "_etag": "2"}]
+    store.patch.side_effect = [CosmosAccessConditionFailedError(), None]
+
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=store),
+        patch.object(minutes_agent, "generate_minutes", AsyncMock(return_value=minutes)),
+        patch("app.jobs.end_meeting.upload_minutes", AsyncMock(return_value=None)),
+        patch("app.jobs.end_meeting.task_agent.assign_tasks", AsyncMock(side_effect=lambda m: m)),
+    ):
+        await finalize_meeting(Job(kind="end_meeting", meeting_id=session.id), session, None)
+
+    # Retried against the re-read etag; only the end-of-meeting fields are written
+    assert [c.kwargs["etag"] for c in store.patch.await_args_list] == ["1", "2"]
+    container, item_id, operations = store.patch.await_args.args
+    assert (container, item_id) == ("meeting_sessions", session.id)
+    assert {op["path"]: op["value"] for op in operations} == {
+        "/status": "ended",
+        "/ended_at": session.ended_at.isoformat(),
+        "/minutes_id": session.id,
+    }
+    assert store.upsert.await_count == 1
+    assert store.upsert.await_args.args[0] == "minutes"
+
+
+async def test_finalize_meeting_tolerates_sharepoint_failure(session, minutes):
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=_store()),
+        patch.object(minutes_agent, "generate_minutes", AsyncMock(return_value=minutes)),
+        patch("app.jobs.end_meeting.upload_minutes", AsyncMock(side_effect=RuntimeError("403"))),
+        patch("app.jobs.end_meeting.task_agent.assign_tasks", AsyncMock(side_effect=lambda m: m)),
+    ):
+        job = Job(kind="end_meeting", meeting_id=session.id)
+        result = await finalize_meeting(job, session, None)
+
+    assert result["sharepoint_url"] is None
+    assert {s.name: s.status for s in job.stages}["sharepoint"] == "failed"
+
+
+async def test_finalize_meeting_marks_upload_cancelled_when_planner_fails(session, minutes):
+    async def slow_upload(m):
+        await asyncio.sleep(60)
+
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=_store()),
+        patch.object(minutes_agent, "generate_minutes", AsyncMock(return_value=minutes)),
+        patch("app.jobs.end_meeting.upload_minutes", slow_upload),
+        patch(
+            "app.jobs.end_meeting.task_agent.assign_tasks",
+            AsyncMock(side_effect=RuntimeError("Planner 500")),
+        ),
+    ):
+        job = Job(kind="end_meeting", meeting_id=session.id)
+        with pytest.raises(ExceptionGroup):
+            await asyncio.wait_for(finalize_meeting(job, session, None), timeout=2)
+
+    stages = {s.name: s for s in job.stages}
+    assert stages["planner"].status == "failed"
+    assert stages["sharepoint"].status == "cancelled"
+    assert stages["sharepoint"].finished_at is not None
+
+
+async def test_runner_dedupes_by_idempotency_key_and_restarts_failed():
+    attempts = []
+
+    async def work(job):
+        attempts.append(job.payload["n"])
+        if len(attempts) == 1:
+            raise RuntimeError("transient")
+        return {"n": job.payload["n"]}
+
+    runner = JobRunner()
+    job = await _wait(runner.submit("demo", "m1", work, {"n": 1}, idempotency_key="k"))
+    assert job.status == "failed"
+    again = await _wait(runner.submit("demo", "m1", work, {"n": 2}, idempotency_key="k"))
+    assert again is job and job.status == "succeeded" and job.attempts == 2
+    assert attempts == [1, 1]
+    assert runner.submit("demo", "m1", work, {"n": 3}, idempotency_key="k") is job
+
+
+async def test_end_meeting_job_rebuilds_transcript_from_payload(session, minutes):
+    from app.jobs import end_meeting
+    from app.models.session import TranscriptEntry
+    from app.transcription.transcript_buffer import TranscriptBuffer
+
+    live = TranscriptBuffer()
+    live.append(TranscriptEntry(speaker="Alice", text="Mobile first lah."))
+    payload = end_meeting.build_payload(session, live)
+    job = Job(kind="end_meeting", meeting_id=session.id, payload=payload)
+    seen = []
+
+    async def generate(session, buffer):
+        seen.append(buffer.to_text())
+        return minutes
+
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=_store()),
+        patch.object(minutes_agent, "generate_minutes", generate),
+        patch("app.jobs.end_meeting.upload_minutes", AsyncMock(return_value=None)),
+        patch("app.jobs.end_meeting.task_agent.assign_tasks", AsyncMock(side_effect=lambda m: m)),
+    ):
+        await end_meeting.run(job)
+    assert seen == [live.to_text()]
+
+
+async def test_finalize_meeting_retry_skips_completed_stages(session, minutes):
+    store = _store()
+    store.upsert.side_effect = [RuntimeError("cosmos down"), None, None, None]
+    assign = AsyncMock(side_effect=lambda m: m)
+    generate = AsyncMock(return_value=minutes)
+    job = Job(kind="end_meeting", meeting_id=session.id)
+
+    with (
+        patch("app.jobs.end_meeting.get_cosmos_store", return_value=store),
+        patch.object(minutes_agent, "generate_minutes", generate),
+        patch("app.jobs.end_meeting.upload_minutes", AsyncMock(return_value="https://sp/doc")),
+        patch("app.jobs.end_meeting.task_agent.assign_tasks", assign),
+    ):
+        with pytest.raises(ExceptionGroup):
+            await finalize_meeting(job, session, None)
+        result = await finalize_meeting(job, session, None)
+
+    assert generate.await_count == 1
+    assert assign.await_count == 1  # no duplicate Planner tasks on retry
+    assert result["sharepoint_url"] == "https://sp/doc"
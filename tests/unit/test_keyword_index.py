@@ -0,0 +1,99 @@
+"""Unit tests for the transcript keyword index and search_transcript tool."""
+from __future__ import annotations
+
+import pytest
+
+from app.models.session import TranscriptEntry
+from app.transcription.keyword_index import KeywordIndex, tokenize
+from app.transcription.transcript_buffer import MemoryBudget, TranscriptBuffer
+
+
+def test_tokenize_drops_manglish_particles_and_stopwords():
+    assert tokenize("Deadline Friday lah, boleh kan?") == ["deadline", "friday"]
+    assert tokenize("Kanak-kanak and the budget") == ["kanak", "kanak", "budget"]
+
+
+def test_negations_are_kept():
+    assert tokenize("Not approved, tak jadi") == ["not", "approved", "tak", "jadi"]
+    index = KeywordIndex()
+    index.add("budget approved")
+    index.add("budget not approved yet")
+    assert index.search("not approved")[0][0] == 1
+
+
+def test_bm25_ranks_rarer_and_denser_matches_higher():
+    index = KeywordIndex()
+    index.add("budget review next week")
+    index.add("the vendor contract budget budget budget")
+    index.add("lunch menu")
+    hits = index.search("budget contract", top_k=5)
+    assert [pos for pos, _ in hits] == [1, 0]
+    assert hits[0][1] > hits[1][1] > 0
+
+
+def test_search_with_no_matches_or_empty_index():
+    index = KeywordIndex()
+    assert index.search("anything") == []
+    index.add("hello world")
+    assert index.search("lah kan") == []
+    assert index.search("hello", top_k=0) == []
+
+
+def test_buffer_search_finds_spilled_utterances(tmp_path):
+    buf = TranscriptBuffer(
+        segment_size=2, budget=MemoryBudget(limit_bytes=0), spill_dir=str(tmp_path)
+    )
+    buf.append(TranscriptEntry(speaker="Aisyah", text="The deadline for the tender is 30 June"))
+    for i in range(10):
+        buf.append(TranscriptEntry(speaker="Bob", text=f"filler discussion {i}"))
+    hits = buf.search("tender deadline")
+    assert [(seq, e.speaker) for seq, e, _ in hits] == [(1, "Aisyah")]
+
+
+def test_spilled_search_scores_match_resident_search(tmp_path):
+    texts = [f"item {i} budget {'vendor' if i % 4 == 0 else 'travel'}" for i in range(30)]
+    resident = TranscriptBuffer(segment_size=4)
+    spilled = TranscriptBuffer(
+        segment_size=4, budget=MemoryBudget(limit_bytes=0), spill_dir=str(tmp_path)
+    )
+    for text in texts:
+        resident.append(TranscriptEntry(speaker="A", text=text))
+        spilled.append(TranscriptEntry(speaker="A", text=text))
+    assert spilled.spilled_segments == 7
+    expected = [(seq, score) for seq, _, score in resident.search("vendor budget", top_k=10)]
+    assert [(seq, score) for seq, _, score in spilled.search("vendor budget", top_k=10)] == expected
+
+
+def test_sealed_postings_are_charged_to_the_budget():
+    budget = MemoryBudget(limit_bytes=1 << 30)
+    buf = TranscriptBuffer(segment_size=4, budget=budget)
+    for i in range(4):
+        buf.append(TranscriptEntry(speaker="A", text=f"distinct words number{i} here"))
+    [segment] = buf._sealed
+    assert segment.postings and "number3" in segment.postings
+    assert budget.used_bytes == segment.nbytes > segment.columns.nbytes
+
+
+def test_buffer_search_resets_on_clear():
+    buf = TranscriptBuffer()
+    buf.append(TranscriptEntry(speaker="A", text="secret project codename"))
+    buf.clear()
+    buf.append(TranscriptEntry(speaker="A", text="weather chat"))
+    assert buf.search("codename") == []
+    assert [seq for seq, _, _ in buf.search("weather")] == [2]
+
+
+@pytest.mark.asyncio
+async def test_search_transcript_tool_formats_hits_chronologically():
+    from app.agents.tools.search_tools import execute_search_transcript_tool
+
+    buf = TranscriptBuffer()
+    buf.append(TranscriptEntry(speaker="Aisyah", text="Budget approved at 2 million"))
+    buf.append(TranscriptEntry(speaker="Bob", text="Budget budget budget concerns"))
+    out = await execute_search_transcript_tool({"query": "budget", "meeting_id": "m1"}, buf)
+    lines = out.splitlines()
+    assert lines[0].startswith("(#1) [") and "Aisyah: Budget approved" in lines[0]
+    assert lines[1].startswith("(#2) [")
+
+    missing = await execute_search_transcript_tool({"query": "budget", "meeting_id": "m1"}, None)
+    assert "No live transcript" in missing
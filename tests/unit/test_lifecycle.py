@@ -0,0 +1,202 @@
+"""Unit tests for idle-meeting tracking, eviction and the live-meetings admin report."""
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.models.session import TranscriptEntry
+from app.state.base import InProcessStore
+from app.state.lifecycle import MeetingLifecycle
+from app.transcription.transcript_buffer import MemoryBudget, TranscriptBuffer
+from app.transcription.wal import GroupCommitter, TranscriptWAL, wal_path
+
+
+@pytest.fixture
+def committer():
+    c = GroupCommitter(interval_s=60)
+    yield c
+    c.stop()
+
+
+@pytest.fixture
+def wal_store(tmp_path, committer):
+    def factory(meeting_id: str) -> TranscriptBuffer:
+        return TranscriptBuffer(wal=TranscriptWAL(wal_path(tmp_path, meeting_id), committer))
+
+    return InProcessStore(factory)
+
+
+def _entry(text: str = "Hello") -> TranscriptEntry:
+    return TranscriptEntry(speaker="Alice", text=text)
+
+
+def test_buffer_tracks_activity_and_memory():
+    buf = TranscriptBuffer(segment_size=4)
+    empty = buf.memory_bytes
+    for i in range(10):
+        buf.append(_entry(f"line {i}"))
+    assert buf.memory_bytes > empty
+    assert buf.idle_s < 1
+
+    buf._last_activity -= 100
+    assert buf.idle_s >= 100
+    buf.touch()
+    assert buf.idle_s < 1
+
+    assert not buf.in_use
+    with buf.hold():
+        assert buf.in_use
+    assert not buf.in_use
+
+
+def test_memory_bytes_counts_keyword_index_and_drops_spilled_segments(tmp_path):
+    texts = [f"topic{i} budget vendor contract" for i in range(10)]
+    resident = TranscriptBuffer(segment_size=4)
+    spilling = TranscriptBuffer(
+        segment_size=4, budget=MemoryBudget(limit_bytes=0), spill_dir=str(tmp_path)
+    )
+    for text in texts:
+        resident.append(_entry(text))
+        spilling.append(_entry(text))
+    segments = sum(s.nbytes for s in resident._sealed)
+    assert resident.memory_bytes > segments + resident._hot.nbytes + resident._keywords.nbytes
+    # Spilled segments take their keyword postings with them
+    assert spilling.memory_bytes == resident.memory_bytes - segments
+
+
+async def test_subscribed_buffer_is_in_use():
+    buf = TranscriptBuffer()
+    sub = buf.subscribe()
+    assert buf.in_use
+    sub.close()
+    assert not buf.in_use
+
+
+def test_evicted_meeting_is_reloaded_from_its_wal(wal_store):
+    buf = wal_store.create("m1")
+    for i in range(3):
+        buf.append(_entry(f"line {i}"))
+
+    assert wal_store.evict("m1")
+    assert wal_store.local_meetings() == [] and "m1" in wal_store and len(wal_store) == 1
+
+    reloaded = wal_store["m1"]
+    assert reloaded is not buf
+    assert [e.text for e in reloaded.snapshot()] == ["line 0", "line 1", "line 2"]
+    assert reloaded.last_seq == 3
+    assert wal_store.local_meetings() == ["m1"]
+
+
+def test_concurrent_lookups_reload_an_evicted_meeting_once(tmp_path, committer):
+    builds = []
+
+    def slow_factory(meeting_id: str) -> TranscriptBuffer:
+        builds.append(meeting_id)
+        time.sleep(0.02)  # a WAL replay
+        return TranscriptBuffer(wal=TranscriptWAL(wal_path(tmp_path, meeting_id), committer))
+
+    store = InProcessStore(slow_factory)
+    store.create("m1").append(_entry("before eviction"))
+    assert store.evict("m1")
+    builds.clear()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        buffers = list(pool.map(lambda _: store["m1"], range(8)))
+    assert builds == ["m1"]
+    assert all(b is buffers[0] for b in buffers)
+    assert [e.text for e in buffers[0].snapshot()] == ["before eviction"]
+    buffers[0].close()
+
+
+def test_buffer_without_wal_is_not_evicted():
+    store = InProcessStore()
+    buf = store.create("m1")
+    buf.append(_entry())
+    assert not store.evict("m1")
+    assert store.get("m1") is buf and len(buf) == 1
+
+
+async def test_sweep_hands_over_only_idle_unused_meetings():
+    store = InProcessStore()
+    for meeting_id in ("idle", "active", "watched"):
+        store.create(meeting_id).append(_entry())
+    store["idle"]._last_activity -= 600
+    store["watched"]._last_activity -= 600
+    sub = store["watched"].subscribe()
+
+    async def on_idle(meeting_id: str, buffer: TranscriptBuffer) -> None:
+        del store[meeting_id]
+        buffer.close()
+
+    lifecycle = MeetingLifecycle(store, on_idle, idle_timeout_s=300)
+    assert await lifecycle.sweep() == ["idle"]
+    assert sorted(store) == ["active", "watched"] and lifecycle.evicted == 1
+    sub.close()
+
+
+async def test_failed_eviction_is_retried_on_next_sweep():
+    store = InProcessStore()
+    store.create("m1")._last_activity -= 600
+    on_idle = AsyncMock(side_effect=[RuntimeError("cosmos down"), None])
+
+    lifecycle = MeetingLifecycle(store, on_idle, idle_timeout_s=300, interval_s=0.01)
+    await lifecycle.start()
+    await asyncio.sleep(0.05)
+    await lifecycle.stop()
+
+    assert on_idle.await_count >= 2
+    assert lifecycle.evicted >= 1
+
+
+async def test_idle_meeting_is_checkpointed_or_ended(wal_store):
+    from app import main
+
+    wal_store.create("kept").append(_entry())
+    wal_store.create("ended").append(_entry())
+    cosmos = MagicMock(get=AsyncMock(return_value={"id": "ended"}))
+    finalize = AsyncMock(return_value=SimpleNamespace(id="job-1"))
+
+    def settings(action: str):
+        return SimpleNamespace(meeting_idle_action=action, meeting_state_backend="memory")
+
+    with (
+        patch.object(main, "_active_buffers", wal_store),
+        patch.object(main, "get_cosmos_store", return_value=cosmos),
+        patch.object(main, "_finalize_meeting", finalize),
+    ):
+        with patch.object(main, "get_settings", return_value=settings("checkpoint")):
+            await main._evict_idle_meeting("kept", wal_store["kept"])
+        with patch.object(main, "get_settings", return_value=settings("end")):
+            await main._evict_idle_meeting("ended", wal_store["ended"])
+
+    assert "kept" in wal_store and wal_store.local_meetings() == []
+    finalize.assert_awaited_once_with("ended", {"id": "ended"})
+    assert "ended" not in wal_store
+
+
+async def test_admin_endpoint_lists_meetings_largest_first():
+    from app import main
+
+    store = InProcessStore()
+    store.create("small").append(_entry())
+    big = store.create("big")
+    for i in range(50):
+        big.append(_entry(f"a much longer line of transcript number {i}"))
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+    ) as client:
+        with patch.object(main, "_active_buffers", store):
+            response = await client.get("/admin/meetings")
+
+    body = response.json()
+    assert [m["meeting_id"] for m in body["meetings"]] == ["big", "small"]
+    big = body["meetings"][0]
+    assert big["entries"] == 50 and big["memory_bytes"] > 0 and big["age_s"] >= 0
+    assert body["memory_bytes"] == sum(m["memory_bytes"] for m in body["meetings"])
@@ -0,0 +1,274 @@
+"""Unit tests for the meeting-state backends (in-process, shared-memory, Redis protocol)."""
+from __future__ import annotations
+
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+import pytest
+
+from app.models.session import TranscriptEntry
+from app.state.base import InProcessStore
+from app.state.redis_store import RedisStore
+from app.state.resp import RespClient, RespError
+from app.state.shm import SharedMemoryStore
+from app.transcription.replicated import ReplicatedTranscriptBuffer
+
+
+class _RespStandIn(socketserver.ThreadingTCPServer):
+    """Just enough of a Redis server (lists and sets) to exercise RedisStore."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.lists: dict[bytes, list[bytes]] = defaultdict(list)
+        self.sets: dict[bytes, set[bytes]] = defaultdict(set)
+        self.commands: Counter[bytes] = Counter()
+        self.lock = threading.Lock()
+
+    def run(self, cmd: bytes, args: list[bytes]):
+        lists, sets = self.lists, self.sets
+        self.commands[cmd] += 1
+        if cmd == b"PING":
+            return "PONG"
+        if cmd == b"RPUSH":
+            lists[args[0]].extend(args[1:])
+            return len(lists[args[0]])
+        if cmd == b"LRANGE":
+            items = lists.get(args[0], [])
+            start, stop = int(args[1]), int(args[2])
+            return items[start:None if stop == -1 else stop + 1]
+        if cmd == b"DEL":
+            return sum(1 for k in args if lists.pop(k, None) is not None)
+        if cmd == b"SADD":
+            before = len(sets[args[0]])
+            sets[args[0]].update(args[1:])
+            return len(sets[args[0]]) - before
+        if cmd == b"SREM":
+            before = len(sets[args[0]])
+            sets[args[0]].difference_update(args[1:])
+            return before - len(sets[args[0]])
+        if cmd == b"SISMEMBER":
+            return int(args[1] in sets.get(args[0], set()))
+        if cmd == b"SMEMBERS":
+            return sorted(sets.get(args[0], set()))
+        if cmd == b"SCARD":
+            return len(sets.get(args[0], set()))
+        raise RespError(f"ERR unknown command '{cmd.decode()}'")
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            try:
+                with self.server.lock:
+                    reply = self.server.run(args[0].upper(), args[1:])
+            except RespError as exc:
+                self.wfile.write(b"-%s\r\n" % str(exc).encode())
+                continue
+            self.wfile.write(_encode_reply(reply))
+
+
+def _encode_reply(value) -> bytes:
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(_encode_reply(v) for v in value)
+
+
+@pytest.fixture
+def resp_stand_in():
+    server = _RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def resp_server(resp_stand_in):
+    return f"redis://127.0.0.1:{resp_stand_in.server_address[1]}/0"
+
+
+@pytest.fixture(params=["shm", "redis"])
+def two_workers(request, tmp_path):
+    """Two stores over the same shared state, standing in for two API worker processes."""
+    if request.param == "shm":
+        stores = [SharedMemoryStore(tmp_path / "shm"), SharedMemoryStore(tmp_path / "shm")]
+    else:
+        url = request.getfixturevalue("resp_server")
+        # No membership caching, so a meeting ended on one worker is gone on the other at once
+        stores = [RedisStore(RespClient(url), membership_ttl_s=0) for _ in range(2)]
+    yield stores
+    for store in stores:
+        store.close()
+
+
+def _entry(speaker: str, text: str) -> TranscriptEntry:
+    return TranscriptEntry(speaker=speaker, text=text)
+
+
+def test_in_process_store_is_a_mapping():
+    store = InProcessStore()
+    buf = store.create("m1")
+    assert store.get("m1") is buf and "m1" in store and list(store) == ["m1"]
+    assert store.pop("m1") is buf
+    assert store.get("m1") is None
+
+
+def test_appends_on_one_worker_are_read_on_another(two_workers):
+    a, b = two_workers
+    a.create("m1")
+    a["m1"].append(_entry("Alice", "Budget approved for Q3."))
+    b["m1"].append(_entry("Bob", "Hiring freeze lifted."))
+    a["m1"].append(_entry("Alice", "Ship the mobile app first."))
+
+    for store in (a, b):
+        buf = store["m1"]
+        assert isinstance(buf, ReplicatedTranscriptBuffer)
+        assert len(buf) == 3 and buf.last_seq == 3
+        assert [seq for seq, _ in buf.since(0)] == [1, 2, 3]
+        assert [e.text for e in buf.by_speaker("alice")] == [
+            "Budget approved for Q3.",
+            "Ship the mobile app first.",
+        ]
+        assert buf.search("hiring")[0][1].speaker == "Bob"
+    assert a["m1"].to_text() == b["m1"].to_text()
+    assert list(a) == list(b) == ["m1"]
+
+
+def test_bulk_extend_is_one_batch_in_the_shared_log(two_workers):
+    a, b = two_workers
+    a.create("m1").append(_entry("Alice", "first"))
+    assert b["m1"].extend([_entry("Bob", f"bulk {i}") for i in range(3)]) == 4
+    assert [(seq, e.text) for seq, e in a["m1"].since(0)] == [
+        (1, "first"), (2, "bulk 0"), (3, "bulk 1"), (4, "bulk 2"),
+    ]
+
+
+def test_token_totals_include_other_workers_appends(two_workers):
+    a, b = two_workers
+    a.create("m1").append(_entry("Alice", "Budget approved for Q3."))
+    before = b["m1"].total_tokens
+    a["m1"].append(_entry("Alice", "Ship the mobile app first."))
+    assert isinstance(before, int) and b["m1"].total_tokens > before
+    assert b["m1"].total_tokens == a["m1"].total_tokens
+
+
+def test_clear_is_replicated_and_seq_keeps_increasing(two_workers):
+    a, b = two_workers
+    a.create("m1").append(_entry("Alice", "one"))
+    assert len(b["m1"]) == 1
+    b["m1"].clear()
+    a["m1"].append(_entry("Alice", "two"))
+    assert [(seq, e.text) for seq, e in b["m1"].since(0)] == [(2, "two")]
+
+
+def test_closing_a_meeting_ends_it_everywhere(two_workers):
+    a, b = two_workers
+    a.create("m1").append(_entry("Alice", "one"))
+    assert b.get("m1") is not None
+    buf = a.pop("m1")
+    buf.close()
+    assert a.get("m1") is None
+    assert b.get("m1") is None
+    assert list(b) == []
+
+
+def test_redis_store_caches_membership_of_local_replicas(resp_stand_in, resp_server):
+    a = RedisStore(RespClient(resp_server), membership_ttl_s=60)
+    b = RedisStore(RespClient(resp_server), membership_ttl_s=0.05)
+    a.create("m1")
+    b["m1"]
+    checks = resp_stand_in.commands[b"SISMEMBER"]
+    for _ in range(5):
+        a["m1"]
+        b["m1"]
+    assert resp_stand_in.commands[b"SISMEMBER"] == checks
+
+    a.pop("m1").close()
+    assert a.get("m1") is None
+    # b trusts its replica until the TTL runs out, then notices the meeting ended
+    assert b.get("m1") is not None
+    time.sleep(0.1)
+    assert b.get("m1") is None
+    a.close()
+    b.close()
+
+
+async def test_subscriber_sees_entries_appended_by_another_worker(two_workers):
+    a, b = two_workers
+    a.create("m1")
+    sub = b["m1"].subscribe()
+    a["m1"].append(_entry("Alice", "from worker a"))
+    events, _ = await sub.get(timeout=2)
+    assert [(e.seq, e.entry.text) for e in events] == [(1, "from worker a")]
+    sub.close()
+
+
+def test_shm_store_orders_concurrent_appends_from_two_processes(tmp_path):
+    store = SharedMemoryStore(tmp_path)
+    buf = store.create("m1")
+    child = subprocess.Popen([
+        sys.executable,
+        "-c",
+        "import sys; from app.state.shm import SharedMemoryStore;"
+        "from app.models.session import TranscriptEntry;"
+        "buf = SharedMemoryStore(sys.argv[1])['m1'];"
+        "[buf.append(TranscriptEntry(speaker='Child', text=f'c{i}')) for i in range(200)]",
+        str(tmp_path),
+    ])
+    for i in range(200):
+        buf.append(_entry("Parent", f"p{i}"))
+    assert child.wait(timeout=60) == 0
+
+    other = SharedMemoryStore(tmp_path)
+    assert len(buf) == len(other["m1"]) == 400
+    assert buf.to_text() == other["m1"].to_text()
+    texts = [e.text for e in buf.snapshot()]
+    assert [t for t in texts if t.startswith("c")] == [f"c{i}" for i in range(200)]
+    store.close()
+    other.close()
+
+
+def test_shm_log_skips_partially_written_frame(tmp_path):
+    a = SharedMemoryStore(tmp_path)
+    a.create("m1").append(_entry("Alice", "complete"))
+    with open(tmp_path / "m1.log", "ab") as f:
+        f.write(b"\x40\x00\x00\x00")  # header of a frame still being written
+    b = SharedMemoryStore(tmp_path)
+    assert [e.text for e in b["m1"].snapshot()] == ["complete"]
+    a.close()
+    b.close()
+
+
+def test_resp_client_round_trip_and_errors(resp_server):
+    client = RespClient(resp_server)
+    assert client.execute("PING") == "PONG"
+    assert client.execute("RPUSH", "k", b"\x00binary\r\n", "text") == 2
+    assert client.execute("LRANGE", "k", 0, -1) == [b"\x00binary\r\n", b"text"]
+    with pytest.raises(RespError, match="unknown command"):
+        client.execute("FLUSHALL")
+    assert client.execute("PING") == "PONG"  # connection still usable after an error reply
+    client.close()
+
+
+def test_resp_client_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        RespClient("http://localhost:6379")
@@ -41,3 +41,281 @@ async def test_qa_answer_without_buffer_raises_not_implemented():
             buffer=None,
         )
 
+
+class _FakeStream:
+    """Stands in for a Foundry agent event stream: iterates (event_type, data, None)."""
+
+    def __init__(self, events):
+        self._events = events
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return iter([(event_type, data, None) for event_type, data in self._events])
+
+
+def _fake_foundry(first, after_tools):
+    from types import SimpleNamespace as NS
+    from unittest.mock import MagicMock
+
+    client = MagicMock()
+    client.agents.create_thread.return_value = NS(id="t1")
+    client.agents.create_stream.return_value = _FakeStream(first)
+    submitted = []
+
+    def submit(client, thread_id, run_id, outputs):
+        submitted.append((thread_id, run_id, outputs))
+        return _FakeStream(after_tools)
+
+    return client, submitted, submit
+
+
+async def test_stream_agent_thread_runs_tools_and_streams_the_answer():
+    from types import SimpleNamespace as NS
+    from unittest.mock import patch
+
+    from app.agents import base
+
+    call = NS(id="call1", function=NS(name="search_transcript", arguments='{"query": "launch"}'))
+    first = [
+        ("thread.run.step.created", NS(type="tool_calls", step_details=NS(tool_calls=[call]))),
+        ("thread.run.requires_action", NS(
+            id="run1", required_action=NS(submit_tool_outputs=NS(tool_calls=[call]))
+        )),
+    ]
+    after = [
+        ("thread.message.delta", NS(text="Launch is ")),
+        ("thread.message.delta", NS(text="Q3.")),
+    ]
+    client, submitted, submit = _fake_foundry(first, after)
+
+    async def execute_tool(name, arguments):
+        return f"{name}: {arguments['query']} -> Q3"
+
+    with (
+        patch.object(base, "get_foundry_client", return_value=client),
+        patch.object(base, "_submit_tool_outputs_stream", submit),
+    ):
+        stream = base.stream_agent_thread("a1", "When?", execute_tool=execute_tool)
+        events = [e async for e in stream]
+
+    assert [(e.type, e.tool or e.text) for e in events] == [
+        ("tool_call", "search_transcript"),
+        ("token", "Launch is "),
+        ("token", "Q3."),
+        ("done", "Launch is Q3."),
+    ]
+    assert submitted == [
+        ("t1", "run1", [{"tool_call_id": "call1", "output": "search_transcript: launch -> Q3"}])
+    ]
+    client.agents.create_message.assert_called_once_with(
+        thread_id="t1", role="user", content="When?"
+    )
+
+
+async def test_stream_agent_thread_continues_on_an_agent_event_handler():
+    from types import SimpleNamespace as NS
+    from unittest.mock import patch
+
+    import azure.ai.projects.models as sdk_models
+
+    from app.agents import base
+
+    class FakeAgentEventHandler:
+        """Stands in for the SDK's AgentEventHandler: iterates the continued stream."""
+
+        def __init__(self):
+            self.events = []
+
+        def __iter__(self):
+            return iter(self.events)
+
+    call = NS(id="call1", function=NS(name="web_search", arguments="{}"))
+    first = [
+        ("thread.run.requires_action", NS(
+            id="run1", required_action=NS(submit_tool_outputs=NS(tool_calls=[call]))
+        )),
+    ]
+    client, _, _ = _fake_foundry(first, [])
+    handlers = []
+
+    def submit_tool_outputs_to_stream(thread_id, run_id, tool_outputs, event_handler):
+        handlers.append(event_handler)
+        event_handler.events.append(("thread.message.delta", NS(text="Sunny."), None))
+
+    client.agents.submit_tool_outputs_to_stream.side_effect = submit_tool_outputs_to_stream
+
+    async def execute_tool(name, arguments):
+        return "sunny"
+
+    with (
+        patch.object(base, "get_foundry_client", return_value=client),
+        patch.object(sdk_models, "AgentEventHandler", FakeAgentEventHandler, create=True),
+    ):
+        events = [e async for e in base.stream_agent_thread("a1", "Weather?", None, execute_tool)]
+
+    assert [(e.type, e.text) for e in events] == [("token", "Sunny."), ("done", "Sunny.")]
+    assert [type(h) for h in handlers] == [FakeAgentEventHandler]
+
+
+async def test_stream_agent_thread_raises_when_the_run_fails():
+    from types import SimpleNamespace as NS
+    from unittest.mock import patch
+
+    from app.agents import base
+
+    client, _, _ = _fake_foundry([("thread.run.failed", NS(last_error="rate limited"))], [])
+    with patch.object(base, "get_foundry_client", return_value=client):
+        with pytest.raises(RuntimeError, match="rate limited"):
+            async for _ in base.stream_agent_thread("a1", "When?"):
+                pass
+
+
+async def test_qa_answer_stream_gives_transcript_context_and_records_the_turn(buffer):
+    from unittest.mock import AsyncMock, patch
+
+    from app.agents import qa_agent
+    from app.agents.base import AgentEvent
+
+    seen = {}
+
+    async def fake_stream(agent_id, message, thread_id=None, execute_tool=None):
+        seen.update(message=message, thread_id=thread_id)
+        seen["tool"] = await execute_tool("search_transcript", {"query": "launch"})
+        yield AgentEvent("token", text="Q3.")
+        yield AgentEvent("done", text="Q3.")
+
+    record = AsyncMock()
+    with (
+        patch.object(qa_agent, "create_or_get_agent", AsyncMock(return_value="a1")),
+        patch.object(qa_agent, "stream_agent_thread", fake_stream),
+        patch.object(qa_agent, "_record_turn", record),
+        patch.object(qa_agent, "get_settings") as settings,
+    ):
+        settings.return_value.qa_transcript_token_budget = 4000
+        events = [
+            e async for e in qa_agent.answer_stream("When is the launch?", "m1", "c1", buffer)
+        ]
+
+    assert [e.type for e in events] == ["token", "done"]
+    assert "targeting Q3" in seen["message"] and "When is the launch?" in seen["message"]
+    assert seen["thread_id"] == "c1" and "targeting Q3" in seen["tool"]
+    record.assert_awaited_once_with("m1", "c1", "When is the launch?", "Q3.")
+
+
+async def test_iterate_in_thread_yields_items_as_they_are_emitted():
+    import threading
+
+    from app.agents.base import iterate_in_thread
+
+    received_first = threading.Event()
+
+    def produce(emit):
+        emit("first")
+        # Only continues once the consumer has seen "first": nothing is batched up
+        assert received_first.wait(timeout=5)
+        emit("second")
+
+    items = []
+    async for item in iterate_in_thread(produce):
+        items.append(item)
+        received_first.set()
+    assert items == ["first", "second"]
+
+
+async def test_iterate_in_thread_reraises_producer_error():
+    from app.agents.base import iterate_in_thread
+
+    def produce(emit):
+        emit("partial")
+        raise RuntimeError("Agent run failed")
+
+    items = []
+    with pytest.raises(RuntimeError, match="Agent run failed"):
+        async for item in iterate_in_thread(produce):
+            items.append(item)
+    assert items == ["partial"]
+
+
+async def test_iterate_in_thread_stops_producer_when_consumer_leaves():
+    import threading
+
+    from app.agents.base import iterate_in_thread
+
+    stopped = threading.Event()
+    emitted = []
+
+    def produce(emit):
+        try:
+            for i in range(10_000):
+                emit(i)
+                emitted.append(i)
+                threading.Event().wait(0.001)
+        finally:
+            stopped.set()
+
+    stream = iterate_in_thread(produce)
+    async for item in stream:
+        break
+    await stream.aclose()
+    assert stopped.wait(timeout=5)
+    assert len(emitted) < 10_000
+
+
+async def test_qa_stream_endpoint_sends_progress_tokens_and_done():
+    from unittest.mock import patch
+
+    import httpx
+
+    from app.agents import qa_agent
+    from app.agents.base import AgentEvent
+    from app.main import app
+
+    async def fake_stream(**kwargs):
+        yield AgentEvent("tool_call", tool="search_meeting_docs")
+        yield AgentEvent("token", text="Launch is ")
+        yield AgentEvent("token", text="in Q3.")
+        yield AgentEvent("done", text="Launch is in Q3.")
+
+    with patch.object(qa_agent, "answer_stream", fake_stream):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.post("/meetings/m1/qa/stream", json={"question": "When?"})
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [
+        block.splitlines()[0].removeprefix("event: ")
+        for block in resp.text.split("\n\n")
+        if block.startswith("event:")
+    ]
+    assert events == ["progress", "token", "token", "done"]
+    assert "Searching meeting documents" in resp.text
+    assert '"conversation_id": "m1"' in resp.text
+
+
+async def test_qa_stream_endpoint_reports_errors_in_band():
+    from unittest.mock import patch
+
+    import httpx
+
+    from app.agents import qa_agent
+    from app.agents.base import AgentEvent
+    from app.main import app
+
+    async def failing_stream(**kwargs):
+        yield AgentEvent("token", text="Partial")
+        raise RuntimeError("Agent run failed: rate limited")
+
+    with patch.object(qa_agent, "answer_stream", failing_stream):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.post("/meetings/m1/qa/stream", json={"question": "When?"})
+
+    assert resp.status_code == 200
+    assert "event: error" in resp.text and "rate limited" in resp.text
@@ -0,0 +1,226 @@
+"""Unit tests for the server-side speech recognizer pool and the audio WebSocket."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.models.session import TranscriptEntry
+from app.state.base import InProcessStore
+from app.transcription.fake_speech import BYTES_PER_SECOND, FakeRecognizer
+from app.transcription.recognizer_pool import PoolExhausted, RecognizerPool
+from app.transcription.transcript_buffer import TranscriptBuffer
+
+SECOND = b"\0" * BYTES_PER_SECOND
+
+
+def _pool(**kwargs) -> RecognizerPool:
+    return RecognizerPool(lambda speaker: FakeRecognizer(speaker_name=speaker), **kwargs)
+
+
+async def _until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not reached")
+
+
+async def test_fake_recognizer_emits_script_per_second_of_audio():
+    script = [TranscriptEntry(speaker="Aisyah", text=t) for t in ("Selamat pagi", "Jom mula")]
+    fake = FakeRecognizer(script=script)
+    fake.push_audio(SECOND[:1000])
+    fake.push_audio(SECOND)  # crosses the first boundary
+    fake.push_audio(SECOND * 3)  # second entry, then the script runs out
+    await fake.stop()
+    assert [e.text async for e in fake.stream()] == ["Selamat pagi", "Jom mula"]
+
+
+async def test_session_appends_recognized_entries_and_drains_on_exit():
+    pool = _pool()
+    buf = TranscriptBuffer()
+    async with pool.session("m1", buf, speaker="Ben") as session:
+        assert buf.in_use
+        session.push(SECOND * 2)
+        await _until(lambda: len(buf) == 2)
+        session.push(SECOND)
+    assert [(e.speaker, e.text) for e in buf.snapshot()] == [
+        ("Ben", "utterance 1"), ("Ben", "utterance 2"), ("Ben", "utterance 3"),
+    ]
+    assert session.entries == 3 and not buf.in_use
+    assert pool.stats() == {
+        "active": 0, "queued": 0, "max_active": 8, "sessions": 1, "rejected": 0,
+    }
+
+
+async def test_sessions_queue_in_order_when_recognizers_are_busy():
+    pool = _pool(max_active=1)
+    buf = TranscriptBuffer()
+    order: list[str] = []
+    positions: list[int] = []
+    first_open = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def first():
+        async with pool.session("m1", buf):
+            order.append("first")
+            first_open.set()
+            await release_first.wait()
+
+    async def queued(name: str):
+        async def on_queued(position: int) -> None:
+            positions.append(position)
+
+        async with pool.session("m1", buf, on_queued=on_queued):
+            order.append(name)
+
+    task = asyncio.create_task(first())
+    await first_open.wait()
+    waiting = [asyncio.create_task(queued("second")), asyncio.create_task(queued("third"))]
+    await _until(lambda: pool.stats()["queued"] == 2)
+    assert pool.stats()["active"] == 1
+    release_first.set()
+    await asyncio.gather(task, *waiting)
+
+    assert order == ["first", "second", "third"] and positions == [1, 2]
+    assert pool.stats()["active"] == 0 and pool.stats()["queued"] == 0
+
+
+async def test_full_queue_and_timeout_are_rejected():
+    pool = _pool(max_active=1, max_queued=1, queue_timeout_s=0.05)
+    buf = TranscriptBuffer()
+    async with pool.session("m1", buf):
+        waiter = asyncio.create_task(pool.session("m2", buf).__aenter__())
+        await _until(lambda: pool.stats()["queued"] == 1)
+        with pytest.raises(PoolExhausted, match="queued"):
+            async with pool.session("m3", buf):
+                pass
+        with pytest.raises(PoolExhausted, match="no recognizer free"):
+            await waiter
+    assert pool.stats() == {
+        "active": 0, "queued": 0, "max_active": 1, "sessions": 1, "rejected": 2,
+    }
+
+
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    pool = _pool(max_active=1)
+    buf = TranscriptBuffer()
+    async with pool.session("m1", buf):
+        waiter = asyncio.create_task(pool.session("m2", buf).__aenter__())
+        await _until(lambda: pool.stats()["queued"] == 1)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert pool.stats()["active"] == 0 and pool.stats()["queued"] == 0
+    async with pool.session("m3", buf):
+        assert pool.stats()["active"] == 1
+
+
+def test_audio_endpoint_recognizes_into_the_meeting():
+    from app import main
+
+    store = InProcessStore()
+    store.create("m1")
+    client = TestClient(main.app)
+    with (
+        patch.object(main, "_active_buffers", store),
+        patch.object(main, "get_recognizer_pool", return_value=_pool()),
+    ):
+        with client.websocket_connect("/meetings/m1/audio?speaker=Chong") as ws:
+            assert ws.receive_json() == {"status": "recognizing"}
+            ws.send_bytes(SECOND * 2)
+            ws.send_text("stop")
+            assert ws.receive_json() == {"status": "stopped", "entries": 2}
+    assert [(e.speaker, e.text) for e in store["m1"].snapshot()] == [
+        ("Chong", "utterance 1"), ("Chong", "utterance 2"),
+    ]
+
+
+def test_audio_endpoint_turns_streams_away_when_exhausted():
+    from app import main
+
+    store = InProcessStore()
+    store.create("m1")
+    client = TestClient(main.app)
+    with (
+        patch.object(main, "_active_buffers", store),
+        patch.object(main, "get_recognizer_pool", return_value=_pool(max_active=0, max_queued=0)),
+    ):
+        with client.websocket_connect("/meetings/m1/audio") as ws:
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                ws.receive_json()
+    assert exc_info.value.code == 1013
+
+
+class _FakeSdkRecognizer:
+    """Speech SDK recognizer stand-in: records which thread each blocking call ran on."""
+
+    class _Signal:
+        def __init__(self) -> None:
+            self.handlers = []
+
+        def connect(self, handler) -> None:
+            self.handlers.append(handler)
+
+        def fire(self, evt=None) -> None:
+            for handler in self.handlers:
+                handler(evt)
+
+    def __init__(self) -> None:
+        self.recognized = self._Signal()
+        self.canceled = self._Signal()
+        self.session_stopped = self._Signal()
+        self.threads: dict[str, int] = {}
+
+    def start_continuous_recognition(self) -> None:
+        self.threads["start"] = threading.get_ident()
+
+    def stop_continuous_recognition(self) -> None:
+        self.threads["stop"] = threading.get_ident()
+
+
+async def test_speech_client_keeps_sdk_calls_off_the_loop_and_drains_after_stop():
+    from types import SimpleNamespace as NS
+
+    from app.transcription import speech_client
+
+    sdk = _FakeSdkRecognizer()
+    built_on = []
+
+    def build(push_stream):
+        built_on.append(threading.get_ident())
+        return sdk
+
+    with patch.object(speech_client, "_build_recognizer", build):
+        client = speech_client.SpeechClient(speaker_name="Ben")
+        received: list[str] = []
+
+        async def consume():
+            async for entry in client.stream():
+                received.append(entry.text)
+
+        task = asyncio.create_task(consume())
+        await _until(lambda: "start" in sdk.threads)
+        await client.stop()
+        # A final result arrives after the audio has ended: still delivered
+        result = NS(
+            reason=speech_client.speechsdk.ResultReason.RecognizedSpeech,
+            text=" Last words. ", offset=0, duration=0,
+        )
+        with patch.object(
+            speech_client.speechsdk, "AutoDetectSourceLanguageResult",
+            return_value=NS(language="en-US"),
+        ):
+            sdk.recognized.fire(NS(result=result))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        sdk.session_stopped.fire()
+        await asyncio.wait_for(task, 1)
+
+    assert received == ["Last words."]
+    loop_thread = threading.get_ident()
+    assert loop_thread not in (built_on[0], sdk.threads["start"], sdk.threads["stop"])
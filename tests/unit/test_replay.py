@@ -0,0 +1,71 @@
+"""Unit tests for the offline audio replay harness."""
+from __future__ import annotations
+
+import wave
+
+import numpy as np
+import pytest
+
+from app.models.session import TranscriptEntry
+from app.transcription.fake_speech import BYTES_PER_SECOND, FakeRecognizer
+from app.transcription.replay import load_audio, replay
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription.vad import SAMPLE_RATE, VoiceActivityGate
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (3000 * np.sin(2 * np.pi * 200 * t)).astype(np.int16)
+
+
+async def test_replay_times_each_utterance_into_the_buffer():
+    buf = TranscriptBuffer()
+    script = [TranscriptEntry(speaker="Aisyah", text=t) for t in ("Selamat pagi", "Jom mula")]
+    report = await replay(
+        np.zeros(3 * SAMPLE_RATE, dtype=np.int16),
+        FakeRecognizer(script=script),
+        buffer=buf,
+        speed=0,
+    )
+    assert [e.text for e in buf.snapshot()] == ["Selamat pagi", "Jom mula"]
+    assert [(u.text, u.audio_end_s) for u in report.utterances] == [
+        ("Selamat pagi", 1.0), ("Jom mula", 2.0),
+    ]
+    assert all(0 <= u.recognized_ms <= u.buffered_ms for u in report.utterances)
+    summary = report.summary()
+    assert summary["utterances"] == 2 and summary["audio_s"] == 3.0
+    assert summary["bytes_pushed"] == summary["bytes_in"] == 3 * BYTES_PER_SECOND
+    assert set(summary["buffered_ms"]) == {"p50", "p95", "max"}
+
+
+async def test_replay_paces_audio_and_pushes_through_the_gate():
+    audio = np.concatenate([np.zeros(SAMPLE_RATE // 2, dtype=np.int16), _speech(0.5)])
+    report = await replay(
+        audio,
+        FakeRecognizer(bytes_per_result=BYTES_PER_SECOND // 4),
+        speed=10,
+        vad=VoiceActivityGate(),
+    )
+    assert report.wall_s >= 0.09  # 1 s of audio at 10x
+    assert 0 < report.bytes_pushed < report.bytes_in
+    assert len(report.utterances) == report.bytes_pushed // (BYTES_PER_SECOND // 4)
+
+
+def test_load_audio_reads_wav_and_raw_pcm(tmp_path):
+    samples = _speech(0.1)
+    with wave.open(str(tmp_path / "a.wav"), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    (tmp_path / "a.pcm").write_bytes(samples.tobytes())
+    assert np.array_equal(load_audio(tmp_path / "a.wav"), samples)
+    assert np.array_equal(load_audio(tmp_path / "a.pcm"), samples)
+
+    with wave.open(str(tmp_path / "b.wav"), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(44_100)
+        wav.writeframes(b"\0" * 8)
+    with pytest.raises(ValueError, match="16 kHz mono"):
+        load_audio(tmp_path / "b.wav")
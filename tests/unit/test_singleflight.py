@@ -0,0 +1,145 @@
+"""Unit tests for single-flight request coalescing and coalesced QA answers."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.agents import qa_agent
+from app.models.session import TranscriptEntry
+from app.transcription.transcript_buffer import TranscriptBuffer
+from app.utils.singleflight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await release.wait()
+        return "Friday"
+
+    callers = [asyncio.create_task(flight.do("deadline", work)) for _ in range(5)]
+    other = asyncio.create_task(flight.do("budget", work))
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*callers, other) == ["Friday"] * 6
+    assert runs == 2
+    assert flight.stats() == {"calls": 6, "executions": 2, "coalesced": 4, "in_flight": 0}
+
+    # Finished flights are forgotten: a later call runs again
+    assert await flight.do("deadline", work) == "Friday" and runs == 3
+
+
+async def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight()
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0)
+        raise RuntimeError("rate limited")
+
+    results = await asyncio.gather(
+        flight.do("q", flaky), flight.do("q", flaky), return_exceptions=True
+    )
+    assert [str(r) for r in results] == ["rate limited", "rate limited"] and attempts == 1
+    with pytest.raises(RuntimeError):
+        await flight.do("q", flaky)
+    assert attempts == 2
+
+
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await release.wait()
+            return 42
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == 42
+    assert first.cancelled() and not cancelled.is_set()
+
+
+async def test_work_is_cancelled_when_every_caller_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_normalize_question():
+    assert qa_agent.normalize_question("  What's the DEADLINE?? ") == "what's the deadline"
+    assert qa_agent.normalize_question("what's  the\tdeadline") == "what's the deadline"
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+async def test_answer_coalesced_keys_on_question_and_transcript_version():
+    buffer = TranscriptBuffer()
+    buffer.append(TranscriptEntry(speaker="Alice", text="Deadline is Friday."))
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_answer(question, meeting_id, conversation_id, buffer=None):
+        calls.append(conversation_id)
+        await release.wait()
+        return f"answer for {conversation_id}"
+
+    variants = ["What's the deadline?", "what's the deadline", "WHAT'S THE DEADLINE"]
+    with (
+        patch.object(qa_agent, "answer", fake_answer),
+        patch.object(qa_agent, "_single_flight", SingleFlight()),
+    ):
+        same = [
+            asyncio.create_task(qa_agent.answer_coalesced(q, "m1", f"c{i}", buffer))
+            for i, q in enumerate(variants)
+        ]
+        other_meeting = asyncio.create_task(
+            qa_agent.answer_coalesced("What's the deadline?", "m2", "c9", None)
+        )
+        # The transcript version is read in a worker thread; wait until all four joined
+        await _until(lambda: qa_agent._single_flight.stats()["calls"] == 4)
+        buffer.append(TranscriptEntry(speaker="Bob", text="Actually, Monday."))
+        after_new_speech = asyncio.create_task(
+            qa_agent.answer_coalesced("What's the deadline?", "m1", "c5", buffer)
+        )
+        await _until(lambda: qa_agent._single_flight.stats()["calls"] == 5)
+        release.set()
+        answers = await asyncio.gather(*same, other_meeting, after_new_speech)
+
+        assert answers == ["answer for c0"] * 3 + ["answer for c9", "answer for c5"]
+        # c0 and c9 start concurrently (only c0 reads a buffer first), then c5
+        assert sorted(calls[:2]) == ["c0", "c9"] and calls[2:] == ["c5"]
+        assert qa_agent.coalescing_stats()["coalesced"] == 2
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import threading
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from app.models.session import TranscriptEntry
-from app.transcription.transcript_buffer import TranscriptBuffer
+from app.transcription import transcript_buffer
+from app.transcription.columnar import EntryColumns, StringTable, to_epoch_us
+from app.transcription.transcript_buffer import MemoryBudget, TranscriptBuffer
 
 
 def _entry(speaker: str = "Alice", text: str = "Hello") -> TranscriptEntry:
@@ -83,3 +86,345 @@ def test_clear():
     buf.append(_entry())
     buf.clear()
     assert len(buf) == 0
+
+
+# ── Segmentation / spill-to-disk ──────────────────────────────────────────────
+
+def _spilling_buffer(tmp_path, budget_bytes: int = 0) -> TranscriptBuffer:
+    return TranscriptBuffer(
+        segment_size=4,
+        budget=MemoryBudget(limit_bytes=budget_bytes),
+        spill_dir=str(tmp_path),
+    )
+
+
+def test_sealed_segments_spill_when_over_budget(tmp_path):
+    buf = _spilling_buffer(tmp_path)
+    for i in range(10):
+        buf.append(_entry(text=str(i)))
+    assert buf.spilled_segments == 2
+    assert len(buf) == 10
+    assert [e.text for e in buf.snapshot()] == [str(i) for i in range(10)]
+
+
+def test_segments_stay_resident_within_budget(tmp_path):
+    buf = _spilling_buffer(tmp_path, budget_bytes=10 * 1024 * 1024)
+    for i in range(10):
+        buf.append(_entry(text=str(i)))
+    assert buf.spilled_segments == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_last_n_spans_spilled_segments(tmp_path):
+    buf = _spilling_buffer(tmp_path)
+    for i in range(10):
+        buf.append(_entry(text=str(i)))
+    assert [e.text for e in buf.last_n(7)] == [str(i) for i in range(3, 10)]
+    assert [e.text for e in buf.last_n(100)] == [str(i) for i in range(10)]
+    assert buf.last_n(0) == []
+
+
+def test_spilled_entries_round_trip(tmp_path):
+    buf = _spilling_buffer(tmp_path)
+    originals = [
+        TranscriptEntry(speaker="Aisyah", text=f"ayat {i}", language="ms-MY") for i in range(8)
+    ]
+    for e in originals:
+        buf.append(e)
+    assert buf.snapshot() == originals
+    assert buf.to_text() == buf.to_text(originals)
+
+
+def test_budget_is_shared_across_buffers(tmp_path):
+    budget = MemoryBudget(limit_bytes=10 * 1024 * 1024)
+    first = TranscriptBuffer(segment_size=4, budget=budget, spill_dir=str(tmp_path))
+    second = TranscriptBuffer(segment_size=4, budget=budget, spill_dir=str(tmp_path))
+    for i in range(4):
+        first.append(_entry(text=str(i)))
+    budget.limit_bytes = budget.used_bytes
+    for i in range(4):
+        second.append(_entry(text=str(i)))
+    # The oldest segment (first buffer's) is spilled to make room for the second
+    assert first.spilled_segments == 1
+    assert second.spilled_segments == 0
+    assert [e.text for e in first.snapshot()] == ["0", "1", "2", "3"]
+
+
+def test_clear_releases_budget_and_close_removes_spill_file(tmp_path):
+    budget = MemoryBudget(limit_bytes=10 * 1024 * 1024)
+    buf = TranscriptBuffer(segment_size=2, budget=budget, spill_dir=str(tmp_path))
+    for i in range(6):
+        buf.append(_entry(text=str(i)))
+    assert budget.used_bytes > 0
+    buf.clear()
+    assert budget.used_bytes == 0
+    assert len(buf) == 0
+
+    spilling = _spilling_buffer(tmp_path)
+    for i in range(8):
+        spilling.append(_entry(text=str(i)))
+    assert list(tmp_path.iterdir())
+    spilling.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+# ── Rendered text ─────────────────────────────────────────────────────────────
+
+def test_to_text_renders_columns_like_render_line(tmp_path):
+    buf = _spilling_buffer(tmp_path)
+    stamps = [datetime(2025, 3, 4, 23, 59, 59, 999_999), datetime(1969, 12, 31, 1, 2, 3)]
+    for i in range(11):
+        entry = TranscriptEntry(
+            speaker=f"S{i % 3}", text=f"baris {i} — ok", timestamp=stamps[i % 2]
+        )
+        buf.append(entry)
+    assert buf.spilled_segments
+    assert buf.to_text() == buf.to_text(buf.snapshot())
+    buf.append(_entry("Late", "arrival"))
+    assert buf.to_text() == buf.to_text(buf.snapshot())
+    assert buf.to_text().endswith("Late: arrival")
+
+
+def test_aware_timestamps_render_in_utc_resident_or_spilled(tmp_path):
+    myt = timezone(timedelta(hours=8))
+    entries = [
+        TranscriptEntry(
+            speaker="Aisyah", text=f"ayat {i}", timestamp=datetime(2025, 3, 4, 7, i, tzinfo=myt)
+        )
+        for i in range(6)
+    ]
+    expected = "\n".join(f"[23:{i:02d}:00] Aisyah: ayat {i}" for i in range(6))
+    assert TranscriptBuffer().to_text(entries) == expected
+
+    resident = TranscriptBuffer(segment_size=4, budget=MemoryBudget(limit_bytes=10 * 1024 * 1024))
+    spilled = _spilling_buffer(tmp_path)
+    for buf in (resident, spilled):
+        buf.extend(entries)
+        assert buf.to_text() == expected
+        assert buf.last_n_text(3) == "\n".join(expected.split("\n")[3:])
+        assert buf.to_text(buf.snapshot()) == expected
+    assert resident.spilled_segments == 0
+    assert spilled.spilled_segments == 1
+    assert spilled.snapshot()[0].timestamp == datetime(2025, 3, 3, 23, 0)
+
+
+def test_to_text_reuses_segment_renders_and_charges_them(tmp_path, monkeypatch):
+    budget = MemoryBudget(limit_bytes=10 * 1024 * 1024)
+    buf = TranscriptBuffer(segment_size=4, budget=budget, spill_dir=str(tmp_path))
+    for i in range(10):
+        buf.append(_entry(text=f"line {i}"))
+    expected = buf.to_text(buf.snapshot())
+    # Resident segments and the hot segment are never re-rendered
+    monkeypatch.setattr(EntryColumns, "lines", lambda *a: pytest.fail("re-rendered"))
+    assert buf.to_text() == expected
+    segment = buf._sealed[0]
+    assert segment.text == "\n".join(expected.split("\n")[:4])
+    assert budget.used_bytes == sum(s.nbytes for s in buf._sealed)
+    assert segment.nbytes > segment.columns.nbytes + len(segment.text)
+
+    monkeypatch.undo()
+    budget.limit_bytes = 0
+    buf.append(_entry(text="line 10"))
+    buf.append(_entry(text="line 11"))
+    assert buf.spilled_segments == 3
+    assert all(s.text is None for s in buf._sealed)
+    assert buf.to_text() == buf.to_text(buf.snapshot())
+    assert buf.last_n_text(5) == buf.to_text(buf.last_n(5))
+
+
+def test_last_n_text_is_tail_of_transcript():
+    buf = TranscriptBuffer()
+    for i in range(10):
+        buf.append(_entry(text=f"t{i}"))
+    assert buf.last_n_text(3) == buf.to_text(buf.last_n(3))
+    assert buf.last_n_text(50) == buf.to_text()
+    assert buf.last_n_text(0) == ""
+    buf.append(_entry(text="t10"))
+    assert buf.last_n_text(4) == buf.to_text(buf.last_n(4))
+
+
+def test_rendered_text_reset_on_clear():
+    buf = TranscriptBuffer()
+    buf.append(_entry(text="before"))
+    buf.to_text()
+    buf.clear()
+    buf.append(_entry(text="after"))
+    assert "before" not in buf.to_text()
+    assert buf.last_n_text(1).endswith("after")
+
+
+# ── Sequence numbers / since() ────────────────────────────────────────────────
+
+def test_since_returns_only_new_entries(tmp_path):
+    buf = _spilling_buffer(tmp_path)
+    for i in range(10):
+        buf.append(_entry(text=str(i)))
+    assert buf.last_seq == 10
+    page = buf.since(0)
+    assert [seq for seq, _ in page] == list(range(1, 11))
+    assert [(seq, e.text) for seq, e in buf.since(6)] == [(7, "6"), (8, "7"), (9, "8"), (10, "9")]
+    assert [seq for seq, _ in buf.since(2, limit=3)] == [3, 4, 5]
+    assert buf.since(10) == []
+
+
+def test_seq_is_monotonic_across_clear():
+    buf = TranscriptBuffer()
+    assert buf.last_seq == 0
+    buf.append(_entry(text="a"))
+    buf.append(_entry(text="b"))
+    buf.clear()
+    buf.append(_entry(text="c"))
+    assert buf.last_seq == 3
+    assert [(seq, e.text) for seq, e in buf.since(0)] == [(3, "c")]
+
+
+# ── Token-budgeted windows ────────────────────────────────────────────────────
+
+def _word_counter(text: str) -> int:
+    return len(text.split())
+
+
+def test_last_tokens_returns_longest_fitting_suffix(tmp_path):
+    buf = TranscriptBuffer(
+        segment_size=4,
+        budget=MemoryBudget(limit_bytes=0),
+        spill_dir=str(tmp_path),
+        token_counter=_word_counter,
+    )
+    # Each rendered line is "[HH:MM:SS] A: <words>" → 2 + len(words) tokens, +1 newline
+    for words in (["x"] * 10, ["y"], ["z"] * 3, ["w"]):
+        buf.append(_entry("A", " ".join(words)))
+    assert buf.total_tokens == 13 + 4 + 6 + 4
+    assert [e.text for e in buf.last_tokens(10)] == ["z z z", "w"]
+    assert [e.text for e in buf.last_tokens(9)] == ["w"]
+    assert buf.last_tokens(3) == []
+    assert len(buf.last_tokens(10_000)) == 4
+    assert buf.last_tokens_text(10) == buf.to_text(buf.last_tokens(10))
+
+
+def test_default_token_counter_is_used_at_append():
+    buf = TranscriptBuffer()
+    buf.append(_entry("Alice", "Good morning everyone"))
+    assert buf.total_tokens > 0
+    assert buf.last_tokens_text(buf.total_tokens) == buf.to_text()
+
+
+# ── Columnar storage ──────────────────────────────────────────────────────────
+
+def test_columnar_round_trip_preserves_fields(tmp_path):
+    aware = datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=timezone(timedelta(hours=8)))
+    entries = [
+        TranscriptEntry(speaker="Aisyah", text="Boleh kita mula? 🚀", language="ms-MY"),
+        TranscriptEntry(speaker="Bob", text="", language="en-US", timestamp=aware),
+    ]
+    speakers, languages, cols = StringTable(), StringTable(), EntryColumns()
+    for e in entries:
+        speaker_id, language_id = speakers.intern(e.speaker), languages.intern(e.language)
+        cols.append(speaker_id, language_id, to_epoch_us(e.timestamp), e.text)
+    restored = EntryColumns.from_bytes(cols.to_bytes()).entries(0, 2, speakers, languages)
+    assert restored[0] == entries[0]
+    assert restored[1].text == ""
+    # Aware timestamps are normalised to naive UTC, like TranscriptEntry's default
+    assert restored[1].timestamp == datetime(2024, 5, 1, 1, 30, 15, 123456)
+
+
+def test_speakers_and_languages_are_interned():
+    buf = TranscriptBuffer()
+    for i in range(100):
+        buf.append(_entry("Alice" if i % 2 else "Bob", str(i)))
+    assert len(buf._speakers) == 2
+    assert len(buf._languages) == 1
+
+
+# ── Time-range and speaker indexes ────────────────────────────────────────────
+
+_T0 = datetime(2024, 5, 1, 9, 0, 0)
+
+
+def _timed_buffer(tmp_path) -> TranscriptBuffer:
+    buf = _spilling_buffer(tmp_path)
+    for i in range(12):
+        speaker = ["Aisyah", "Bob", "Chen"][i % 3]
+        ts = _T0 + timedelta(minutes=i)
+        buf.append(TranscriptEntry(speaker=speaker, text=str(i), timestamp=ts))
+    return buf
+
+
+def test_range_uses_half_open_interval(tmp_path):
+    buf = _timed_buffer(tmp_path)
+    got = buf.range(_T0 + timedelta(minutes=3), _T0 + timedelta(minutes=7))
+    assert [e.text for e in got] == ["3", "4", "5", "6"]
+    assert [e.text for e in buf.range(_T0 + timedelta(minutes=10), None)] == ["10", "11"]
+    assert buf.range(_T0 + timedelta(hours=1), None) == []
+
+
+def test_by_speaker_is_case_insensitive_and_combines_with_range(tmp_path):
+    buf = _timed_buffer(tmp_path)
+    assert [e.text for e in buf.by_speaker("aisyah")] == ["0", "3", "6", "9"]
+    recent = buf.by_speaker("Aisyah", start=_T0 + timedelta(minutes=4))
+    assert [e.text for e in recent] == ["6", "9"]
+    assert buf.by_speaker("Nobody") == []
+
+
+def test_query_returns_seq_and_honours_since_and_limit(tmp_path):
+    buf = _timed_buffer(tmp_path)
+    page = buf.query(since=4, speaker="Bob", limit=2)
+    assert [(seq, e.text) for seq, e in page] == [(5, "4"), (8, "7")]
+
+
+def test_out_of_order_timestamps_index_at_running_max():
+    buf = TranscriptBuffer()
+    buf.append(TranscriptEntry(speaker="A", text="late", timestamp=_T0 + timedelta(minutes=5)))
+    buf.append(TranscriptEntry(speaker="A", text="early", timestamp=_T0))
+    assert [e.text for e in buf.range(_T0 + timedelta(minutes=5), None)] == ["late", "early"]
+
+
+async def test_extend_matches_appending_one_by_one(tmp_path):
+    entries = [_entry(f"S{i % 3}", f"line {i} about the budget") for i in range(25)]
+    one_by_one = TranscriptBuffer(segment_size=4, spill_dir=str(tmp_path))
+    for e in entries:
+        one_by_one.append(e)
+    bulk = TranscriptBuffer(segment_size=4, spill_dir=str(tmp_path))
+    bulk.append(entries[0])
+    sub = bulk.subscribe()
+
+    assert bulk.extend(entries[1:]) == 25
+    assert bulk.snapshot() == one_by_one.snapshot()
+    assert bulk.to_text() == one_by_one.to_text()
+    assert bulk.total_tokens == one_by_one.total_tokens
+    assert bulk.search("budget")[0][0] == one_by_one.search("budget")[0][0]
+    batch, dropped = await sub.get(timeout=1)
+    assert [event.seq for event in batch] == list(range(2, 26)) and not dropped
+    sub.close()
+
+
+def test_extend_releases_the_lock_between_chunks(monkeypatch):
+    monkeypatch.setattr(transcript_buffer, "EXTEND_CHUNK_SIZE", 4)
+    locked_while_counting: list[bool] = []
+
+    def counter(text: str) -> int:
+        locked_while_counting.append(buf._lock.locked())
+        return len(text.split())
+
+    buf = TranscriptBuffer(segment_size=3, token_counter=counter)
+    acquisitions = 0
+    lock = buf._lock
+
+    class CountingLock:
+        def __enter__(self):
+            nonlocal acquisitions
+            acquisitions += 1
+            return lock.__enter__()
+
+        def __exit__(self, *exc):
+            return lock.__exit__(*exc)
+
+        def locked(self):
+            return lock.locked()
+
+    buf._lock = CountingLock()
+    assert buf.extend([_entry("A", f"line {i}") for i in range(10)]) == 10
+    assert acquisitions == 3
+    assert locked_while_counting == [False] * 10
+    # "[HH:MM:SS] A: line i" is 4 words, plus one for the newline
+    assert buf.total_tokens == 10 * 5
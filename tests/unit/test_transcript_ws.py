@@ -0,0 +1,86 @@
+"""Unit tests for text ingestion over the WS /meetings/{id}/stream endpoint."""
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.state.base import InProcessStore
+
+
+@pytest.fixture
+def store():
+    store = InProcessStore()
+    store.create("m1")
+    return store
+
+
+def _connect(store, path: str = "/meetings/m1/stream"):
+    from app import main
+
+    return patch.object(main, "_active_buffers", store), TestClient(main.app), path
+
+
+def test_frames_are_acked_in_order_with_increasing_seq(store):
+    patcher, client, path = _connect(store)
+    with patcher, client.websocket_connect(path) as ws:
+        ws.send_text(json.dumps({"speaker": "Aisyah", "text": "Selamat pagi semua."}))
+        assert ws.receive_json() == {"buffered": 1, "total": 1, "last_seq": 1}
+        # One NDJSON frame of two lines
+        ws.send_text(
+            json.dumps({"speaker": "Ben", "text": "Morning."}) + "\n"
+            + json.dumps({"speaker": "Chong", "text": "Let's start lah.", "language": "ms-MY"})
+        )
+        assert ws.receive_json() == {"buffered": 2, "total": 3, "last_seq": 3}
+        # A JSON array frame
+        ws.send_text(json.dumps([{"speaker": "Devi", "text": f"point {i}"} for i in range(3)]))
+        assert ws.receive_json() == {"buffered": 3, "total": 6, "last_seq": 6}
+
+    entries = [(seq, e.speaker, e.text) for seq, e in store["m1"].since(0)]
+    assert entries[:3] == [
+        (1, "Aisyah", "Selamat pagi semua."),
+        (2, "Ben", "Morning."),
+        (3, "Chong", "Let's start lah."),
+    ]
+    assert [seq for seq, *_ in entries] == list(range(1, 7))
+    assert store["m1"].snapshot()[2].language == "ms-MY"
+
+
+def test_malformed_frames_get_an_error_and_the_socket_stays_open(store):
+    patcher, client, path = _connect(store)
+    with patcher, client.websocket_connect(path) as ws:
+        ws.send_text("{not json")
+        assert "error" in ws.receive_json()
+        ws.send_text(json.dumps({"speaker": "Ben"}))  # missing text
+        error = ws.receive_json()["error"]
+        assert error[0]["loc"] == ["text"]
+        # A bad line rejects its whole frame; nothing from it is appended
+        ws.send_text(json.dumps({"speaker": "Ben", "text": "ok"}) + "\n[1, 2")
+        assert "error" in ws.receive_json()
+        ws.send_text(json.dumps({"speaker": "Ben", "text": "Still here."}))
+        assert ws.receive_json() == {"buffered": 1, "total": 1, "last_seq": 1}
+    assert [e.text for e in store["m1"].snapshot()] == ["Still here."]
+
+
+def test_disconnect_releases_the_meeting(store):
+    buf = store["m1"]
+    patcher, client, path = _connect(store)
+    with patcher:
+        with client.websocket_connect(path) as ws:
+            ws.send_text(json.dumps({"speaker": "Ben", "text": "Bye."}))
+            ws.receive_json()
+            assert buf.in_use  # held while the socket is open
+        # The client went away without a closing frame of its own
+    assert not buf.in_use
+    assert len(buf) == 1
+
+
+def test_unknown_meeting_is_closed_with_4404(store):
+    patcher, client, _ = _connect(store)
+    with patcher, client.websocket_connect("/meetings/nope/stream") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            ws.receive_json()
+    assert exc_info.value.code == 4404
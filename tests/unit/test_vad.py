@@ -0,0 +1,66 @@
+"""Unit tests for the voice-activity gate in front of push_audio()."""
+from __future__ import annotations
+
+import numpy as np
+
+from app.transcription.vad import SAMPLE_RATE, VoiceActivityGate
+
+FRAME = SAMPLE_RATE // 50  # 20 ms
+
+
+def _silence(seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 30, int(seconds * SAMPLE_RATE)).astype(np.int16)
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (3000 * np.sin(2 * np.pi * 200 * t)).astype(np.int16)
+
+
+def _gate(audio: np.ndarray, gate: VoiceActivityGate, block: int = 1600) -> bytes:
+    return b"".join(gate.process(audio[i:i + block]) for i in range(0, audio.size, block))
+
+
+def test_silence_is_dropped():
+    gate = VoiceActivityGate()
+    assert _gate(_silence(3), gate) == b""
+    assert gate.bytes_in == 3 * SAMPLE_RATE * 2 and gate.bytes_out == 0
+    assert gate.utterances == 0
+
+
+def test_speech_is_kept_with_preroll_hangover_and_boundary():
+    gate = VoiceActivityGate(hangover_ms=100, preroll_ms=60, boundary_ms=200)
+    silence, speech = _silence(1), _speech(0.5)
+    out = _gate(np.concatenate([silence, speech, _silence(1, seed=1)]), gate)
+
+    preroll = silence[-3 * FRAME:].tobytes()
+    assert out.startswith(preroll + speech.tobytes())
+    hangover = 5 * FRAME * 2
+    boundary = bytes(2 * SAMPLE_RATE // 5)
+    assert out.endswith(boundary)
+    assert len(out) == len(preroll) + speech.nbytes + hangover + len(boundary)
+    assert gate.utterances == 1
+
+
+def test_each_utterance_is_reported_separately():
+    gate = VoiceActivityGate()
+    audio = np.concatenate([_silence(2), _speech(0.5), _silence(4, seed=1), _speech(0.5)])
+    _gate(audio, gate)
+    assert gate.utterances == 2
+    assert gate.bytes_out < gate.bytes_in / 2
+
+
+def test_hangover_and_partial_frames_carry_across_blocks():
+    audio = np.concatenate([_silence(1), _speech(0.5), _silence(1, seed=1)])
+    whole = VoiceActivityGate()
+    odd_blocks = VoiceActivityGate()
+    # 333-sample blocks never line up with 320-sample frames
+    assert _gate(audio, odd_blocks, block=333) == _gate(audio, whole, block=audio.size)
+    assert odd_blocks.utterances == whole.utterances == 1
+
+
+def test_accepts_raw_bytes():
+    gate = VoiceActivityGate()
+    audio = np.concatenate([_silence(1), _speech(0.5)])
+    assert gate.process(audio.tobytes()) == VoiceActivityGate().process(audio)
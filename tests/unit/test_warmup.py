@@ -0,0 +1,103 @@
+"""Unit tests for concurrent startup initialization and the readiness report."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.utils.warmup import Warmup
+
+
+def _step(delay: float, log: list[str], name: str, fail: bool = False):
+    async def init():
+        log.append(f"start {name}")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} unreachable")
+        log.append(f"end {name}")
+
+    return init
+
+
+async def test_steps_run_concurrently_and_report_latency():
+    log: list[str] = []
+    warmup = Warmup()
+    warmup.add("cosmos", _step(0.05, log, "cosmos"))
+    warmup.add("blob", _step(0.05, log, "blob"), critical=False)
+    warmup.add("search_index", _step(0.05, log, "search_index"), critical=False)
+
+    started = asyncio.get_running_loop().time()
+    await warmup.start()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert log[:3] == ["start cosmos", "start blob", "start search_index"]
+    assert elapsed < 0.12  # not 3 x 0.05 s back to back
+    status = warmup.status()
+    assert warmup.ready and {s["status"] for s in status.values()} == {"ready"}
+    assert all(s["latency_ms"] >= 40 for s in status.values())
+
+
+async def test_noncritical_failure_is_reported_and_retried():
+    log: list[str] = []
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("index service busy")
+
+    warmup = Warmup()
+    warmup.add("cosmos", _step(0, log, "cosmos"))
+    warmup.add("search_index", flaky, critical=False)
+    await warmup.start()
+
+    assert warmup.ready
+    assert warmup.status()["search_index"]["status"] == "failed"
+    assert warmup.status()["search_index"]["error"] == "index service busy"
+    await warmup.ensure("search_index")
+    assert warmup.status()["search_index"]["status"] == "ready" and attempts == 2
+
+
+async def test_critical_failure_fails_startup():
+    warmup = Warmup()
+    warmup.add("cosmos", _step(0, [], "cosmos", fail=True))
+    warmup.add("blob", _step(0, [], "blob"), critical=False)
+    with pytest.raises(RuntimeError, match="cosmos unreachable"):
+        await warmup.start()
+    assert not warmup.ready
+
+
+async def test_lazy_step_runs_once_on_first_use():
+    log: list[str] = []
+    warmup = Warmup()
+    warmup.add("cosmos", _step(0, log, "cosmos"))
+    warmup.add("blob", _step(0.01, log, "blob"), critical=False, lazy=True)
+    await warmup.start()
+    assert warmup.status()["blob"]["status"] == "deferred"
+    assert "start blob" not in log
+
+    await asyncio.gather(warmup.ensure("blob"), warmup.ensure("blob"))
+    await warmup.ensure("blob")
+    assert log.count("start blob") == 1
+    assert warmup.status()["blob"]["status"] == "ready"
+
+
+async def test_ready_endpoint_reports_dependencies():
+    from app import main
+
+    warmup = Warmup()
+    warmup.add("cosmos", _step(0, [], "cosmos"))
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+    ) as client:
+        with patch.object(main, "_warmup", warmup):
+            not_ready = await client.get("/ready")
+            await warmup.start()
+            ready = await client.get("/ready")
+
+    assert not_ready.status_code == 503 and not_ready.json()["ready"] is False
+    assert ready.status_code == 200
+    assert ready.json()["dependencies"]["cosmos"]["status"] == "ready"